@@ -1271,6 +1271,11 @@ def report_html_cmd(
         "-o",
         help="Output HTML file (default: report.html inside the run directory)",
     ),
+    compress: bool = typer.Option(
+        False,
+        "--gzip",
+        help="Write a gzip-compressed report (.html.gz)",
+    ),
 ):
     """
     Generate an HTML report for a single run directory.
@@ -1281,7 +1286,7 @@ def report_html_cmd(
         console.print(f"[red]Run directory not found:[/red] {run_dir}")
         raise typer.Exit(1)
 
-    html_path = generate_html_report(run_dir, output_file)
+    html_path = generate_html_report(run_dir, output_file, compress=compress)
     console.print(f"\n[bold green]✓ HTML report generated:[/bold green] {html_path}\n")
 
 
@@ -103,16 +103,14 @@ class PingTest(BaseTest):
     
     def _log_to_csv(self, result: TestResult):
         """Log result to CSV."""
-        for metric_name, metric_value in result.metrics.items():
-            self.csv_handler.write_result(
-                timestamp=result.timestamp,
-                test_name=result.test_name,
-                target=result.target,
-                metric=metric_name,
-                value=metric_value,
-                status=result.status,
-                details=result.summary or "",
-            )
+        self.csv_handler.write_results(
+            timestamp=result.timestamp,
+            test_name=result.test_name,
+            target=result.target,
+            metrics=result.metrics.items(),
+            status=result.status,
+            details=result.summary or "",
+        )
 
 
 class TracerouteTest(BaseTest):
@@ -224,15 +222,15 @@ class TracerouteTest(BaseTest):
     
     def _log_to_csv(self, result: TestResult):
         """Log result to CSV. Skip hop_details (logged via hop_count)."""
-        for metric_name, metric_value in result.metrics.items():
-            if metric_name == "hop_details":
-                continue
-            self.csv_handler.write_result(
-                timestamp=result.timestamp,
-                test_name=result.test_name,
-                target=result.target,
-                metric=metric_name,
-                value=metric_value,
-                status=result.status,
-                details=result.summary or "",
-            )
\ No newline at end of file
+        self.csv_handler.write_results(
+            timestamp=result.timestamp,
+            test_name=result.test_name,
+            target=result.target,
+            metrics=(
+                (name, value)
+                for name, value in result.metrics.items()
+                if name != "hop_details"
+            ),
+            status=result.status,
+            details=result.summary or "",
+        )
\ No newline at end of file
@@ -33,16 +33,7 @@ class DNSTest(BaseTest):
         # Determine status
         if result.success and metrics.get('resolved', False):
             status = "success"
-            ip_addresses = metrics.get('ip_addresses', [])
-            ipv4_count = metrics.get('ipv4_count', 0)
-            ipv6_count = metrics.get('ipv6_count', 0)
-            addr_types = []
-            if ipv4_count > 0:
-                addr_types.append(f"{ipv4_count} IPv4")
-            if ipv6_count > 0:
-                addr_types.append(f"{ipv6_count} IPv6")
-            type_str = " + ".join(addr_types) if addr_types else ""
-            summary = f"Resolved {target} to {len(ip_addresses)} address(es) ({type_str}): {', '.join(ip_addresses[:3])}"
+            summary = self._format_resolved_summary(target, metrics)
         elif result.success:
             status = "warning"
             summary = f"Could not resolve {target}"
@@ -67,6 +58,25 @@ class DNSTest(BaseTest):
         
         return test_result
     
+    @staticmethod
+    def _format_resolved_summary(target: str, metrics: Dict[str, Any]) -> str:
+        """Build the summary line for a successful lookup from the parsed counts."""
+        ip_addresses = metrics.get('ip_addresses', [])
+        ipv4_count = metrics.get('ipv4_count', 0)
+        ipv6_count = metrics.get('ipv6_count', 0)
+        if ipv4_count and ipv6_count:
+            type_str = f"{ipv4_count} IPv4 + {ipv6_count} IPv6"
+        elif ipv4_count:
+            type_str = f"{ipv4_count} IPv4"
+        elif ipv6_count:
+            type_str = f"{ipv6_count} IPv6"
+        else:
+            type_str = ""
+        return (
+            f"Resolved {target} to {len(ip_addresses)} address(es) ({type_str}): "
+            f"{', '.join(ip_addresses[:3])}"
+        )
+    
     def parse_output(self, output: str, os_type: str) -> Dict[str, Any]:
         """Parse DNS lookup output. Detects both IPv4 (A) and IPv6 (AAAA) records."""
         metrics = {}
@@ -82,19 +92,24 @@ class DNSTest(BaseTest):
         if os_type == "Windows":
             # Parse nslookup output
             # Look for lines like "Address:  192.168.1.1" or "AAAA Record: 2001:db8::1"
-            for line in output.split('\n'):
-                if 'Address' in line and ':' in line:
-                    parts = line.split(':')
-                    if len(parts) > 1:
-                        ip = parts[1].strip()
-                        # Check IPv4
-                        if ipv4_pattern.match(ip):
-                            ip_addresses.append(ip)
-                            ipv4_addresses.append(ip)
-                        # Check IPv6
-                        elif ipv6_pattern.search(ip):
-                            ip_addresses.append(ip)
-                            ipv6_addresses.append(ip)
+            # Only the first colon separates label from value, so IPv6
+            # addresses keep their own colons intact.
+            lines = output.splitlines() if 'Address' in output else []
+            for line in lines:
+                if 'Address' not in line:
+                    continue
+                _, sep, value = line.partition(':')
+                if not sep:
+                    continue
+                ip = value.strip()
+                # Check IPv4
+                if ipv4_pattern.match(ip):
+                    ip_addresses.append(ip)
+                    ipv4_addresses.append(ip)
+                # Check IPv6
+                elif ipv6_pattern.search(ip):
+                    ip_addresses.append(ip)
+                    ipv6_addresses.append(ip)
         else:
             # Parse dig output - check for A and AAAA records
             # For A records: dig +short returns IPv4
@@ -127,28 +142,16 @@ class DNSTest(BaseTest):
     
     def _log_to_csv(self, result: TestResult):
         """Log result to CSV."""
-        # Log each IP address separately
+        # Log each IP address separately, followed by the count
         ip_addresses = result.metrics.get('ip_addresses', [])
+        rows = [(f"ip_address_{idx+1}", ip) for idx, ip in enumerate(ip_addresses)]
+        rows.append(("ip_count", result.metrics.get('ip_count', 0)))
         
-        if ip_addresses:
-            for idx, ip in enumerate(ip_addresses):
-                self.csv_handler.write_result(
-                    timestamp=result.timestamp,
-                    test_name=result.test_name,
-                    target=result.target,
-                    metric=f"ip_address_{idx+1}",
-                    value=ip,
-                    status=result.status,
-                    details=result.summary or "",
-                )
-        
-        # Also log the count
-        self.csv_handler.write_result(
+        self.csv_handler.write_results(
             timestamp=result.timestamp,
             test_name=result.test_name,
             target=result.target,
-            metric="ip_count",
-            value=result.metrics.get('ip_count', 0),
+            metrics=rows,
             status=result.status,
             details=result.summary or "",
         )
\ No newline at end of file
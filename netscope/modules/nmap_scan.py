@@ -8,13 +8,20 @@ import shutil
 import subprocess
 import xml.etree.ElementTree as ET
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Union
 
 from netscope.modules.base import BaseTest, TestResult
 
 
+@lru_cache(maxsize=1)
 def has_nmap() -> bool:
-    """Return True if the `nmap` binary is available in PATH."""
+    """
+    Return True if the `nmap` binary is available in PATH.
+
+    The PATH lookup is done once per process; OS detection calls this for
+    every discovered host and the answer does not change during a run.
+    """
     return shutil.which("nmap") is not None
 
 
@@ -23,10 +30,13 @@ def run_nmap_xml(
     ports: Optional[str] = None,
     extra_args: Optional[List[str]] = None,
     timeout: int = 120,
-) -> subprocess.CompletedProcess[str]:
+) -> subprocess.CompletedProcess[bytes]:
     """
     Run nmap with XML output (`-oX -`) and return the completed process.
 
+    Output is kept as raw bytes so it can be handed straight to the XML
+    parser without a decode/re-encode round trip.
+
     Args:
         target: Target host or CIDR.
         ports: Optional ports string for `-p` (e.g. "22,80,443" or "1-1024").
@@ -45,19 +55,28 @@ def run_nmap_xml(
     return subprocess.run(
         cmd,
         capture_output=True,
-        text=True,
         timeout=timeout,
     )
 
 
-def parse_nmap_xml(xml_text: str) -> Dict[str, Any]:
+def _decode(data: Union[str, bytes, None]) -> str:
+    """Decode process output for display; str values pass through unchanged."""
+    if data is None:
+        return ""
+    if isinstance(data, bytes):
+        return data.decode("utf-8", errors="replace")
+    return data
+
+
+def parse_nmap_xml(xml_text: Union[str, bytes]) -> Dict[str, Any]:
     """
     Parse nmap XML output into a metrics dict.
 
     Extracts:
       - hosts_up / hosts_down
       - open_ports / closed_ports / filtered_ports lists (port numbers)
-      - per-port service name and product (when available)
+      - per-port service name and product (when available; only extracted
+        when at least one port is open)
     """
     metrics: Dict[str, Any] = {
         "hosts_up": 0,
@@ -78,50 +97,54 @@ def parse_nmap_xml(xml_text: str) -> Dict[str, Any]:
         return metrics
 
     # Hosts up / down from runstats
-    for runstats in root.findall("runstats"):
-        finished = runstats.find("hosts")
-        if finished is not None:
-            try:
-                metrics["hosts_up"] = int(finished.attrib.get("up", "0"))
-                metrics["hosts_down"] = int(finished.attrib.get("down", "0"))
-            except ValueError:
-                pass
+    hosts_el = root.find("runstats/hosts")
+    if hosts_el is not None:
+        try:
+            metrics["hosts_up"] = int(hosts_el.attrib.get("up", "0"))
+            metrics["hosts_down"] = int(hosts_el.attrib.get("down", "0"))
+        except ValueError:
+            pass
+
+    # Cheap substring scan: without any open port there is no service
+    # information worth extracting, so skip the per-port service lookups.
+    has_open = (b'state="open"' if isinstance(xml_text, bytes) else 'state="open"') in xml_text
 
     open_ports: List[int] = []
     closed_ports: List[int] = []
     filtered_ports: List[int] = []
     services: List[Dict[str, Any]] = []
 
-    # Iterate over hosts and their ports
-    for host in root.findall("host"):
-        for ports_el in host.findall("ports"):
-            for port_el in ports_el.findall("port"):
-                try:
-                    port_num = int(port_el.attrib.get("portid", "0"))
-                except ValueError:
-                    continue
-                state_el = port_el.find("state")
-                state = state_el.attrib.get("state", "") if state_el is not None else ""
-                service_el = port_el.find("service")
-                svc_name = service_el.attrib.get("name", "") if service_el is not None else ""
-                product = service_el.attrib.get("product", "") if service_el is not None else ""
-                version = service_el.attrib.get("version", "") if service_el is not None else ""
-
-                entry = {
-                    "port": port_num,
-                    "state": state,
-                    "service": svc_name,
-                    "product": product,
-                    "version": version,
-                }
-                services.append(entry)
-
-                if state == "open":
-                    open_ports.append(port_num)
-                elif state == "closed":
-                    closed_ports.append(port_num)
-                elif state == "filtered":
-                    filtered_ports.append(port_num)
+    # Single pass over every host's ports
+    for port_el in root.iterfind("host/ports/port"):
+        try:
+            port_num = int(port_el.attrib.get("portid", "0"))
+        except ValueError:
+            continue
+        state_el = port_el.find("state")
+        state = state_el.attrib.get("state", "") if state_el is not None else ""
+        service_el = port_el.find("service") if has_open else None
+        if service_el is not None:
+            svc_attr = service_el.attrib
+            svc_name = svc_attr.get("name", "")
+            product = svc_attr.get("product", "")
+            version = svc_attr.get("version", "")
+        else:
+            svc_name = product = version = ""
+
+        services.append({
+            "port": port_num,
+            "state": state,
+            "service": svc_name,
+            "product": product,
+            "version": version,
+        })
+
+        if state == "open":
+            open_ports.append(port_num)
+        elif state == "closed":
+            closed_ports.append(port_num)
+        elif state == "filtered":
+            filtered_ports.append(port_num)
 
     metrics["open_ports"] = sorted(open_ports)
     metrics["closed_ports"] = sorted(closed_ports)
@@ -223,7 +246,7 @@ class NmapScanTest(BaseTest):
                 duration=duration,
                 metrics={},
                 summary=summary,
-                raw_output=str(getattr(e, 'output', "")),
+                raw_output=_decode(getattr(e, 'output', None)),
                 error=str(e),
             )
             self._log_to_csv(result)
@@ -232,6 +255,7 @@ class NmapScanTest(BaseTest):
         duration = (datetime.now() - start_time).total_seconds()
         success = proc.returncode == 0
         metrics = parse_nmap_xml(proc.stdout) if success else {}
+        stderr = _decode(proc.stderr)
 
         if success:
             status = "success"
@@ -249,8 +273,8 @@ class NmapScanTest(BaseTest):
             duration=duration,
             metrics=metrics,
             summary=summary,
-            raw_output=proc.stdout or proc.stderr,
-            error=None if success else proc.stderr,
+            raw_output=_decode(proc.stdout) or stderr,
+            error=None if success else stderr,
         )
 
         self._log_to_csv(result)
@@ -267,28 +291,20 @@ class NmapScanTest(BaseTest):
         Log aggregate metrics (counts and open ports) to CSV.
         """
         metrics = result.metrics or {}
-        # Write counts
-        for key in ("open_count", "closed_count", "filtered_count", "hosts_up", "hosts_down"):
-            if key in metrics:
-                self.csv_handler.write_result(
-                    timestamp=result.timestamp,
-                    test_name=result.test_name,
-                    target=result.target,
-                    metric=key,
-                    value=metrics[key],
-                    status=result.status,
-                    details=result.summary or "",
-                )
-        # Open ports as a comma-separated list
+        # Counts, then open ports as a comma-separated list
+        rows = [
+            (key, metrics[key])
+            for key in ("open_count", "closed_count", "filtered_count", "hosts_up", "hosts_down")
+            if key in metrics
+        ]
         open_ports = metrics.get("open_ports") or []
         if open_ports:
-            self.csv_handler.write_result(
-                timestamp=result.timestamp,
-                test_name=result.test_name,
-                target=result.target,
-                metric="open_ports",
-                value=",".join(str(p) for p in open_ports),
-                status=result.status,
-                details=result.summary or "",
-            )
-
+            rows.append(("open_ports", ",".join(str(p) for p in open_ports)))
+        self.csv_handler.write_results(
+            timestamp=result.timestamp,
+            test_name=result.test_name,
+            target=result.target,
+            metrics=rows,
+            status=result.status,
+            details=result.summary or "",
+        )
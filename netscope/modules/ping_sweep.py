@@ -2,30 +2,178 @@
 Ping sweep: discover alive hosts in a CIDR range (e.g., 192.168.1.0/24).
 """
 
+import atexit
 import ipaddress
+import os
 import platform
+import socket
+import struct
 import subprocess
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Union
 
 from netscope.modules.base import BaseTest, TestResult
 
+_OS_TYPE = platform.system()
 
-def ping_host(host: str, timeout: float = 1.0) -> tuple[str, bool]:
+_ICMP_ECHO_REQUEST = 8
+_ICMP_ECHO_REPLY = 0
+_ICMP_PAYLOAD = b"netscope-ping-sweep"
+
+# None until the first probe decides whether unprivileged ICMP sockets work here.
+_icmp_available: Optional[bool] = None
+_icmp_seq = os.getpid() & 0xFFFF
+_icmp_seq_lock = threading.Lock()
+
+# Worker pools reused across sweeps, keyed by size; threads are started on
+# demand and stay idle between sweeps instead of being spawned and joined.
+_sweep_executors: Dict[int, ThreadPoolExecutor] = {}
+_sweep_executors_lock = threading.Lock()
+
+
+def _get_sweep_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Return the shared sweep pool with max_workers threads, creating it once."""
+    with _sweep_executors_lock:
+        executor = _sweep_executors.get(max_workers)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="ping-sweep",
+            )
+            _sweep_executors[max_workers] = executor
+        return executor
+
+
+@atexit.register
+def _shutdown_sweep_executors() -> None:
+    with _sweep_executors_lock:
+        for executor in _sweep_executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        _sweep_executors.clear()
+
+
+def _icmp_checksum(data: bytes) -> int:
+    """Internet checksum (RFC 1071) of an ICMP message."""
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _build_echo_request(seq: int) -> bytes:
+    """Build an ICMP echo request; the kernel fills in the identifier for datagram sockets."""
+    header = struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, 0, 0, seq)
+    checksum = _icmp_checksum(header + _ICMP_PAYLOAD)
+    return struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, checksum, 0, seq) + _ICMP_PAYLOAD
+
+
+def _next_icmp_seq() -> int:
+    global _icmp_seq
+    with _icmp_seq_lock:
+        _icmp_seq = (_icmp_seq + 1) & 0xFFFF
+        return _icmp_seq
+
+
+def _icmp_ping(host: str, timeout: float) -> Optional[bool]:
     """
-    Ping a single host and return (host, alive).
+    Send one ICMP echo over an unprivileged datagram socket.
     
-    Args:
-        host: IP address to ping
-        timeout: Timeout in seconds
-        
-    Returns:
-        Tuple of (host_ip, is_alive)
+    Returns True/False for reply/no reply, or None when ICMP datagram sockets
+    are not permitted on this system (e.g. Linux outside ping_group_range).
+    """
+    global _icmp_available
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+    except OSError:
+        _icmp_available = False
+        return None
+    _icmp_available = True
+    
+    seq = _next_icmp_seq()
+    deadline = time.monotonic() + timeout
+    with sock:
+        try:
+            sock.sendto(_build_echo_request(seq), (host, 0))
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                sock.settimeout(remaining)
+                if _is_echo_reply(sock.recv(1024), seq):
+                    return True
+        except (socket.timeout, OSError):
+            return False
+
+
+def _icmp_sweep(hosts: List[str], timeout: float) -> Optional[List[str]]:
+    """
+    Probe many IPv4 hosts from a single ICMP datagram socket.
+    
+    All echo requests are sent up front and replies are collected on the same
+    thread until every host has answered or the timeout elapses, so a whole
+    range costs roughly one timeout window.
+    
+    Returns the hosts that replied, or None when ICMP datagram sockets are
+    not permitted on this system.
     """
-    os_type = platform.system()
-    if os_type == "Windows":
+    global _icmp_available
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+    except OSError:
+        _icmp_available = False
+        return None
+    _icmp_available = True
+    
+    seq = _next_icmp_seq()
+    packet = _build_echo_request(seq)
+    pending = set()
+    alive: List[str] = []
+    with sock:
+        for host in hosts:
+            try:
+                sock.sendto(packet, (host, 0))
+                pending.add(host)
+            except OSError:
+                continue
+        
+        deadline = time.monotonic() + timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            sock.settimeout(remaining)
+            try:
+                data, addr = sock.recvfrom(1024)
+            except socket.timeout:
+                break
+            except OSError:
+                continue
+            if addr[0] in pending and _is_echo_reply(data, seq):
+                pending.discard(addr[0])
+                alive.append(addr[0])
+    return alive
+
+
+def _is_echo_reply(data: bytes, seq: int) -> bool:
+    """Return True if data is an ICMP echo reply carrying the given sequence number."""
+    # macOS delivers the IP header as well; Linux does not
+    if data and data[0] >> 4 == 4:
+        data = data[(data[0] & 0x0F) * 4:]
+    return (
+        len(data) >= 8
+        and data[0] == _ICMP_ECHO_REPLY
+        and struct.unpack("!H", data[6:8])[0] == seq
+    )
+
+
+def _subprocess_ping(host: str, timeout: float) -> bool:
+    """Ping a host with the system `ping` binary."""
+    if _OS_TYPE == "Windows":
         command = ["ping", "-n", "1", "-w", str(int(timeout * 1000)), host]
     else:
         command = ["ping", "-c", "1", "-W", str(int(timeout)), host]
@@ -36,45 +184,92 @@ def ping_host(host: str, timeout: float = 1.0) -> tuple[str, bool]:
             capture_output=True,
             timeout=timeout + 1.0,
         )
-        return (host, result.returncode == 0)
+        return result.returncode == 0
     except subprocess.TimeoutExpired:
-        return (host, False)
+        return False
     except Exception:
-        return (host, False)
+        return False
+
+
+def ping_host(host: str, timeout: float = 1.0) -> tuple[str, bool]:
+    """
+    Ping a single host and return (host, alive).
+    
+    Uses an in-process ICMP echo for IPv4 hosts when the OS allows
+    unprivileged ICMP sockets, and falls back to the system `ping` binary
+    otherwise.
+    
+    Args:
+        host: IP address to ping
+        timeout: Timeout in seconds
+        
+    Returns:
+        Tuple of (host_ip, is_alive)
+    """
+    if _icmp_available is not False and ":" not in host:
+        alive = _icmp_ping(host, timeout)
+        if alive is not None:
+            return (host, alive)
+    return (host, _subprocess_ping(host, timeout))
 
 
-def sweep_cidr(cidr: str, max_workers: int = 50, timeout: float = 1.0) -> List[str]:
+def sweep_cidr(
+    cidr: Union[str, ipaddress.IPv4Network, ipaddress.IPv6Network],
+    max_workers: int = 50,
+    timeout: float = 1.0,
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> List[str]:
     """
     Ping sweep a CIDR range and return list of alive hosts.
     
+    IPv4 ranges are probed from a single ICMP socket when the OS allows it;
+    otherwise each host is pinged from a thread pool.
+    
     Args:
-        cidr: CIDR notation (e.g., "192.168.1.0/24")
+        cidr: CIDR notation (e.g., "192.168.1.0/24") or an already parsed network
         max_workers: Maximum concurrent ping threads
         timeout: Timeout per ping in seconds
+        executor: Pool to run pings on; defaults to a shared pool of
+            max_workers threads that is reused across sweeps
         
     Returns:
-        List of alive IP addresses
+        List of alive IP addresses, in address order
     """
-    try:
-        network = ipaddress.ip_network(cidr, strict=False)
-    except ValueError:
-        return []
+    if isinstance(cidr, str):
+        try:
+            network = ipaddress.ip_network(cidr, strict=False)
+        except ValueError:
+            return []
+    else:
+        network = cidr
     
     # Limit to /24 or smaller (max 256 hosts)
     if network.num_addresses > 256:
         return []
     
+    # Hosts are enumerated in address order; their index is the sort key
+    hosts = [str(ip) for ip in network.hosts()]
+    rank = {host: i for i, host in enumerate(hosts)}
+    
+    # Fast path: one ICMP socket probes the whole range from this thread
+    if network.version == 4 and _icmp_available is not False:
+        alive = _icmp_sweep(hosts, timeout)
+        if alive is not None:
+            return sorted(alive, key=rank.__getitem__)
+    
     alive_hosts: List[str] = []
+    if executor is None:
+        executor = _get_sweep_executor(max_workers)
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(ping_host, str(ip), timeout): str(ip) for ip in network.hosts()}
-        
-        for future in as_completed(futures):
-            host, is_alive = future.result()
-            if is_alive:
-                alive_hosts.append(host)
+    # ping_host echoes the host back, so no future->host mapping is needed
+    futures = [executor.submit(ping_host, host, timeout) for host in hosts]
+    
+    for future in as_completed(futures):
+        host, is_alive = future.result()
+        if is_alive:
+            alive_hosts.append(host)
     
-    return sorted(alive_hosts, key=lambda x: ipaddress.IPv4Address(x))
+    return sorted(alive_hosts, key=rank.__getitem__)
 
 
 class PingSweepTest(BaseTest):
@@ -127,7 +322,7 @@ class PingSweepTest(BaseTest):
             )
         
         # Run sweep
-        alive_hosts = sweep_cidr(target, max_workers=max_workers, timeout=timeout)
+        alive_hosts = sweep_cidr(network, max_workers=max_workers, timeout=timeout)
         duration = (datetime.now() - start_time).total_seconds()
         
         status = "success" if len(alive_hosts) > 0 else "warning"
@@ -159,15 +354,17 @@ class PingSweepTest(BaseTest):
         return {}
     
     def _log_to_csv(self, result: TestResult) -> None:
-        """Log each alive host as a CSV row."""
-        alive_hosts = result.metrics.get("alive_hosts", [])
-        for host in alive_hosts:
-            self.csv_handler.write_result(
-                timestamp=result.timestamp,
-                test_name=result.test_name,
-                target=host,
-                metric="alive",
-                value="true",
-                status=result.status,
-                details=result.summary or "",
-            )
+        """Log each alive host as a CSV row, all in one append."""
+        details = result.summary or ""
+        self.csv_handler.write_rows(
+            {
+                "timestamp": result.timestamp,
+                "test_name": result.test_name,
+                "target": host,
+                "metric": "alive",
+                "value": "true",
+                "status": result.status,
+                "details": details,
+            }
+            for host in result.metrics.get("alive_hosts", [])
+        )
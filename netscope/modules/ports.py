@@ -1,22 +1,28 @@
 """
 Port scan test: pure-Python TCP port scanner (no nmap required).
-Now uses a thread pool for faster scanning of larger port sets.
+All connects are issued at once on non-blocking sockets and reaped through
+the platform's readiness API (epoll/kqueue/select), so a scan takes about
+one timeout window regardless of port count.
 """
 
+import errno
+import selectors
 import socket
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import struct
+import sys
+import time
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from netscope.modules.base import BaseTest, TestResult
 
 # Common TCP ports: top 20 and top 100 presets
-PORT_PRESET_TOP20: List[int] = [
+PORT_PRESET_TOP20: Tuple[int, ...] = (
     21, 22, 23, 25, 53, 80, 110, 111, 135, 139,
     143, 443, 445, 993, 995, 1723, 3306, 3389, 5900, 8080,
-]
+)
 
-PORT_PRESET_TOP100: List[int] = [
+PORT_PRESET_TOP100: Tuple[int, ...] = (
     7, 9, 13, 21, 22, 23, 25, 26, 37, 53, 79, 80, 81, 88,
     106, 110, 111, 113, 119, 135, 139, 143, 144, 179, 199,
     389, 427, 443, 444, 445, 465, 513, 514, 515, 543, 544,
@@ -27,45 +33,186 @@ PORT_PRESET_TOP100: List[int] = [
     5631, 5666, 5800, 5900, 6000, 6646, 7070, 8000, 8008,
     8009, 8080, 8443, 8888, 9100, 9999, 32768, 49152, 49153,
     49154, 49155, 49156,
-]
+)
+
+_PRESETS: Dict[str, Tuple[int, ...]] = {
+    "top20": PORT_PRESET_TOP20,
+    "top100": PORT_PRESET_TOP100,
+}
+
+
+# Upper bound on sockets in flight at once, whatever RLIMIT_NOFILE allows
+_MAX_IN_FLIGHT = 1024
+# File descriptors left for the rest of the process (logs, CSV, selector)
+_FD_HEADROOM = 64
+
+# SO_LINGER {on, 0 seconds}: close() resets the connection instead of going
+# through FIN/TIME_WAIT, so large scans do not pile up local TIME_WAIT sockets.
+_LINGER_RST = struct.pack("HH" if sys.platform == "win32" else "ii", 1, 0)
+
+# Shortest wait for remaining ports once the host has answered on one
+_MIN_SETTLE = 0.05
+
+# SO_ERROR values showing the host itself answered: accepted or reset
+_HOST_ANSWERED = frozenset(
+    code
+    for code in (0, errno.ECONNREFUSED, getattr(errno, "WSAECONNREFUSED", None))
+    if code is not None
+)
+
+# connect_ex() results meaning "handshake still in flight" on a non-blocking socket
+_CONNECT_IN_PROGRESS = frozenset(
+    code
+    for code in (
+        errno.EINPROGRESS,
+        errno.EWOULDBLOCK,
+        errno.EALREADY,
+        getattr(errno, "WSAEWOULDBLOCK", None),
+    )
+    if code is not None
+)
+
+
+def _max_in_flight() -> int:
+    """Number of ports to connect concurrently, bounded by the open-file limit."""
+    try:
+        import resource
+    except ImportError:
+        # Windows: select() is compiled with FD_SETSIZE=512
+        return 512
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft == resource.RLIM_INFINITY:
+        return _MAX_IN_FLIGHT
+    return max(16, min(_MAX_IN_FLIGHT, soft - _FD_HEADROOM))
+
+
+def _connect_all(
+    family: int,
+    sockaddr: tuple,
+    ports: Sequence[int],
+    deadline: float,
+    on_result: Callable[[int, bool], None],
+    rtt_factor: Optional[float] = None,
+) -> None:
+    """
+    Start a non-blocking connect to every port and report each outcome.
+
+    Sockets are registered for write-readiness; once writable, SO_ERROR tells
+    whether the handshake succeeded. Ports still pending at `deadline`
+    (a time.monotonic() value) are reported as not open.
+
+    With `rtt_factor`, the first answer from the host (open or refused) gives
+    its round-trip time, and the deadline is pulled in to rtt_factor times
+    that: ports silent for that long on a responsive host are filtered.
+    """
+    sel = selectors.DefaultSelector()
+    start = time.monotonic()
+    settled = rtt_factor is None
+    try:
+        for index, port in enumerate(ports):
+            try:
+                sock = socket.socket(family, socket.SOCK_STREAM)
+            except OSError:
+                # Out of descriptors: every later socket() would fail the same
+                # way, so give up on the rest instead of raising once per port.
+                for skipped in ports[index:]:
+                    on_result(skipped, False)
+                break
+            sock.setblocking(False)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RST)
+            err = sock.connect_ex((sockaddr[0], port) + tuple(sockaddr[2:]))
+            if err in _CONNECT_IN_PROGRESS:
+                sel.register(sock, selectors.EVENT_WRITE, port)
+                continue
+            sock.close()
+            on_result(port, err == 0)
+
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in sel.select(remaining):
+                sock = key.fileobj
+                err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                sel.unregister(sock)
+                sock.close()
+                on_result(key.data, err == 0)
+                if not settled and err in _HOST_ANSWERED:
+                    settled = True
+                    now = time.monotonic()
+                    deadline = min(deadline, now + max(_MIN_SETTLE, rtt_factor * (now - start)))
+
+        # Anything still pending timed out (filtered or unreachable)
+        for key in list(sel.get_map().values()):
+            sel.unregister(key.fileobj)
+            key.fileobj.close()
+            on_result(key.data, False)
+    finally:
+        sel.close()
 
 
 def scan_ports(
     host: str,
-    ports: List[int],
+    ports: Sequence[int],
     timeout: float = 2.0,
     progress_callback: Optional[Callable[[int, int], None]] = None,
-) -> tuple[List[int], List[int]]:
+    overall_timeout: Optional[float] = None,
+    rtt_factor: Optional[float] = None,
+) -> tuple[List[int], int]:
     """
-    Try TCP connect to each port on host. Returns (open_ports, closed_ports).
+    Try TCP connect to each port on host. Returns (open_ports, closed_count).
+    Ports that are not open are only counted, never listed.
     If progress_callback is set, it is called as (completed_count, total) after each port.
+
+    `timeout` bounds each batch of concurrent connects. If `overall_timeout`
+    is given, the whole scan returns by then: pending connects are abandoned
+    and ports not yet tried are counted as not open.
+    With `rtt_factor`, each batch stops waiting rtt_factor round trips after
+    the host first answers, instead of always waiting out `timeout`.
     """
     open_ports: List[int] = []
-    closed_ports: List[int] = []
+    closed_count = 0
     total = len(ports)
     completed = 0
 
-    def check_port(port: int) -> tuple[int, bool]:
-        try:
-            with socket.create_connection((host, port), timeout=timeout):
-                return port, True
-        except (socket.timeout, socket.error, OSError):
-            return port, False
-
-    max_workers = min(64, total) if total > 0 else 1
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_port = {executor.submit(check_port, port): port for port in ports}
-        for future in as_completed(future_to_port):
-            port, is_open = future.result()
-            if is_open:
-                open_ports.append(port)
-            else:
-                closed_ports.append(port)
-            completed += 1
-            if progress_callback is not None:
-                progress_callback(completed, total)
-
-    return sorted(open_ports), sorted(closed_ports)
+    def record(port: int, is_open: bool) -> None:
+        nonlocal completed, closed_count
+        if is_open:
+            open_ports.append(port)
+        else:
+            closed_count += 1
+        completed += 1
+        if progress_callback is not None:
+            progress_callback(completed, total)
+
+    if total == 0:
+        return [], 0
+
+    try:
+        family, _, _, _, sockaddr = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)[0]
+    except (socket.gaierror, OSError):
+        for port in ports:
+            record(port, False)
+        return [], closed_count
+
+    scan_deadline = None
+    if overall_timeout is not None:
+        scan_deadline = time.monotonic() + overall_timeout
+
+    # Connect in chunks that fit within the file-descriptor budget
+    batch = _max_in_flight()
+    for i in range(0, total, batch):
+        chunk = ports[i:i + batch]
+        deadline = time.monotonic() + timeout
+        if scan_deadline is not None:
+            if time.monotonic() >= scan_deadline:
+                for port in chunk:
+                    record(port, False)
+                continue
+            deadline = min(deadline, scan_deadline)
+        _connect_all(family, sockaddr, chunk, deadline, record, rtt_factor)
+
+    return sorted(open_ports), closed_count
 
 
 class PortScanTest(BaseTest):
@@ -77,19 +224,28 @@ class PortScanTest(BaseTest):
     def run(
         self,
         target: str,
-        ports: Optional[List[int]] = None,
+        ports: Optional[Sequence[int]] = None,
         timeout: float = DEFAULT_TIMEOUT,
         preset: str = DEFAULT_PRESET,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        overall_timeout: Optional[float] = None,
     ) -> TestResult:
-        """Run port scan on target. If ports is None, use preset ('top20' or 'top100')."""
+        """
+        Run port scan on target. If ports is None, use preset ('top20' or 'top100').
+        overall_timeout, if set, caps the wall time of the whole scan.
+        """
         start_time = datetime.now()
 
         if ports is None:
-            ports = PORT_PRESET_TOP100 if preset == "top100" else PORT_PRESET_TOP20
+            ports = _PRESETS.get(preset, PORT_PRESET_TOP20)
 
-        open_ports, closed_ports = scan_ports(
-            target, ports, timeout=timeout, progress_callback=progress_callback
+        # scan_ports already returns open ports in ascending order
+        open_ports, closed_count = scan_ports(
+            target,
+            ports,
+            timeout=timeout,
+            progress_callback=progress_callback,
+            overall_timeout=overall_timeout,
         )
         duration = (datetime.now() - start_time).total_seconds()
 
@@ -97,12 +253,12 @@ class PortScanTest(BaseTest):
         status = "success" if total > 0 else "warning"
         summary = (
             f"Found {len(open_ports)} open port(s) out of {total} scanned on {target}."
-            + (f" Open: {', '.join(str(p) for p in sorted(open_ports))}" if open_ports else " None open.")
+            + (f" Open: {', '.join(map(str, open_ports))}" if open_ports else " None open.")
         )
 
         metrics: Dict[str, Any] = {
-            "open_ports": sorted(open_ports),
-            "closed_count": len(closed_ports),
+            "open_ports": open_ports,
+            "closed_count": closed_count,
             "total_ports": total,
             "open_count": len(open_ports),
         }
@@ -128,26 +284,14 @@ class PortScanTest(BaseTest):
 
     def _log_to_csv(self, result: TestResult) -> None:
         """Log result to CSV (open_ports as comma-separated string, plus counts)."""
-        open_ports = result.metrics.get("open_ports", [])
-        open_str = ",".join(str(p) for p in open_ports) if open_ports else ""
-        for metric_name, metric_value in result.metrics.items():
-            if metric_name == "open_ports":
-                self.csv_handler.write_result(
-                    timestamp=result.timestamp,
-                    test_name=result.test_name,
-                    target=result.target,
-                    metric="open_ports",
-                    value=open_str,
-                    status=result.status,
-                    details=result.summary or "",
-                )
-            else:
-                self.csv_handler.write_result(
-                    timestamp=result.timestamp,
-                    test_name=result.test_name,
-                    target=result.target,
-                    metric=metric_name,
-                    value=metric_value,
-                    status=result.status,
-                    details=result.summary or "",
-                )
+        self.csv_handler.write_results(
+            timestamp=result.timestamp,
+            test_name=result.test_name,
+            target=result.target,
+            metrics=(
+                (name, ",".join(str(p) for p in value) if name == "open_ports" else value)
+                for name, value in result.metrics.items()
+            ),
+            status=result.status,
+            details=result.summary or "",
+        )
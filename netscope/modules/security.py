@@ -8,14 +8,59 @@ from __future__ import annotations
 import socket
 import ssl
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass, field
 
+try:
+    from cryptography import x509
+except ImportError:  # optional: pip install netscope-cli[security]
+    x509 = None
+
+try:
+    import dns.exception
+    import dns.flags
+    import dns.rdatatype
+    import dns.resolver
+except ImportError:  # optional: pip install netscope-cli[security]
+    dns = None
+
 from netscope.modules.base import BaseTest, TestResult
 from netscope.core.executor import TestExecutor
 from netscope.storage.csv_handler import CSVHandler
 
+# Guards first-time creation of the shared SSL contexts and DNS resolver, so
+# concurrent audits build each one once instead of racing to build several
+_shared_init_lock = threading.Lock()
+
+
+def _certificate_expiry(der: Optional[bytes], not_after: str) -> Optional[datetime]:
+    """
+    Return a certificate's notAfter as an aware UTC datetime, or None.
+    
+    Prefers the ASN.1 time decoded by `cryptography`; otherwise parses the
+    OpenSSL text form with ssl.cert_time_to_seconds, which unlike strptime
+    does not depend on the current locale.
+    """
+    if der and x509 is not None:
+        try:
+            cert = x509.load_der_x509_certificate(der)
+        except ValueError:
+            cert = None
+        if cert is not None:
+            try:
+                return cert.not_valid_after_utc
+            except AttributeError:  # cryptography < 42
+                return cert.not_valid_after.replace(tzinfo=timezone.utc)
+    if not not_after:
+        return None
+    try:
+        return datetime.fromtimestamp(ssl.cert_time_to_seconds(not_after), tz=timezone.utc)
+    except ValueError:
+        return None
+
 
 @dataclass
 class SSLCertificateInfo:
@@ -53,6 +98,54 @@ class SSLSecurityTest(BaseTest):
     SSL/TLS security testing and certificate validation.
     """
     
+    # SSL contexts are shared by every instance: building one loads the system
+    # CA bundle, which dominates the cost of a probe when auditing many hosts.
+    _default_context: Optional[ssl.SSLContext] = None
+    _protocol_contexts: Dict[ssl.TLSVersion, Optional[ssl.SSLContext]] = {}
+    
+    # (SSLSecurityInfo attribute, version) pairs probed for support. Each probe
+    # pins the handshake to exactly that version. SSLv2 cannot be negotiated
+    # by the ssl module at all, so supports_ssl_2 is never probed.
+    _PROTOCOL_PROBES = (
+        ("supports_tls_1_3", ssl.TLSVersion.TLSv1_3),
+        ("supports_tls_1_2", ssl.TLSVersion.TLSv1_2),
+        ("supports_tls_1_1", ssl.TLSVersion.TLSv1_1),
+        ("supports_tls_1_0", ssl.TLSVersion.TLSv1),
+        ("supports_ssl_3", ssl.TLSVersion.SSLv3),
+    )
+    
+    @classmethod
+    def _get_default_context(cls) -> ssl.SSLContext:
+        """Return the shared verifying client context, creating it on first use."""
+        if cls._default_context is None:
+            with _shared_init_lock:
+                if cls._default_context is None:
+                    cls._default_context = ssl.create_default_context()
+        return cls._default_context
+    
+    @classmethod
+    def _get_protocol_context(cls, version: ssl.TLSVersion) -> Optional[ssl.SSLContext]:
+        """
+        Return the shared non-verifying context pinned to one protocol version.
+        
+        Returns None when the local OpenSSL build cannot speak that version,
+        in which case support cannot be probed.
+        """
+        if version in cls._protocol_contexts:
+            return cls._protocol_contexts[version]
+        context: Optional[ssl.SSLContext] = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        try:
+            context.minimum_version = version
+            context.maximum_version = version
+            if version < ssl.TLSVersion.TLSv1_2:
+                # Legacy versions are disabled by the default security level
+                context.set_ciphers("ALL:@SECLEVEL=0")
+        except (ValueError, ssl.SSLError):
+            context = None
+        return cls._protocol_contexts.setdefault(version, context)
+    
     def run(
         self,
         target: str,
@@ -71,11 +164,17 @@ class SSLSecurityTest(BaseTest):
             TestResult with SSL/TLS analysis
         """
         try:
-            # Get certificate info
-            cert_info = self._get_certificate_info(target, port)
+            # Resolve once; every connection below goes to the same address
+            # while still sending the original hostname for SNI.
+            address = self._resolve(target, port)
             
-            # Get security info
-            security_info = self._analyze_ssl_security(target, port, check_vulnerabilities)
+            # Certificate and negotiated parameters from a single handshake
+            cert_info, security_info = self._probe_once(target, port, address)
+            
+            # Protocol support and vulnerability analysis
+            self._analyze_ssl_security(
+                target, port, security_info, check_vulnerabilities, address
+            )
             
             # Determine status
             status = "success"
@@ -111,6 +210,9 @@ class SSLSecurityTest(BaseTest):
                     "key_size": security_info.key_size,
                     "supports_tls_1_3": security_info.supports_tls_1_3,
                     "supports_tls_1_2": security_info.supports_tls_1_2,
+                    "supports_tls_1_1": security_info.supports_tls_1_1,
+                    "supports_tls_1_0": security_info.supports_tls_1_0,
+                    "supports_ssl_3": security_info.supports_ssl_3,
                     "has_forward_secrecy": security_info.has_forward_secrecy,
                     "vulnerability_count": len(security_info.vulnerabilities),
                 },
@@ -133,86 +235,111 @@ class SSLSecurityTest(BaseTest):
             self.csv_handler.write_result(result)
             return result
     
-    def _get_certificate_info(self, hostname: str, port: int) -> SSLCertificateInfo:
-        """Get SSL certificate information."""
-        context = ssl.create_default_context()
+    @staticmethod
+    def _resolve(hostname: str, port: int) -> str:
+        """Resolve hostname to the address the TLS probes connect to."""
+        return socket.getaddrinfo(hostname, port, type=socket.SOCK_STREAM)[0][4][0]
+    
+    def _probe_once(
+        self,
+        hostname: str,
+        port: int,
+        address: Optional[str] = None,
+    ) -> tuple[SSLCertificateInfo, SSLSecurityInfo]:
+        """
+        Perform one verified TLS handshake and read everything it exposes.
+        
+        Returns the certificate details together with a SSLSecurityInfo
+        holding the negotiated protocol version and cipher suite.
+        """
+        context = self._get_default_context()
         
-        with socket.create_connection((hostname, port), timeout=10) as sock:
+        with socket.create_connection((address or hostname, port), timeout=10) as sock:
             with context.wrap_socket(sock, server_hostname=hostname) as ssock:
-                cert = ssock.getpeercert()
-                
-                # Parse subject and issuer
-                subject = dict(x[0] for x in cert.get('subject', []))
-                issuer = dict(x[0] for x in cert.get('issuer', []))
-                
-                # Parse dates
-                not_before = cert.get('notBefore', '')
-                not_after = cert.get('notAfter', '')
-                
-                # Calculate expiry
-                try:
-                    expiry_date = datetime.strptime(not_after, '%b %d %H:%M:%S %Y %Z')
-                    expiry_date = expiry_date.replace(tzinfo=timezone.utc)
-                    now = datetime.now(timezone.utc)
-                    days_until_expiry = (expiry_date - now).days
-                    expired = days_until_expiry < 0
-                except:
-                    days_until_expiry = 0
-                    expired = False
-                
-                # Get SAN (Subject Alternative Names)
-                san = []
-                for ext in cert.get('subjectAltName', []):
-                    if ext[0] == 'DNS':
-                        san.append(ext[1])
-                
-                return SSLCertificateInfo(
-                    subject=subject,
-                    issuer=issuer,
-                    version=cert.get('version', 0),
-                    serial_number=cert.get('serialNumber', ''),
-                    not_before=not_before,
-                    not_after=not_after,
-                    expired=expired,
-                    days_until_expiry=days_until_expiry,
-                    san=san,
+                cert_info = self._parse_certificate(
+                    ssock.getpeercert(),
+                    der=ssock.getpeercert(binary_form=True),
                 )
+                security_info = SSLSecurityInfo(protocol_version=ssock.version() or "Unknown")
+                
+                cipher = ssock.cipher()
+                if cipher:
+                    security_info.cipher_suite = cipher[0]
+                    security_info.key_size = cipher[2]
+                    
+                    # Check for forward secrecy
+                    cipher_name = cipher[0].upper()
+                    security_info.has_forward_secrecy = any(
+                        x in cipher_name for x in ['ECDHE', 'DHE']
+                    )
+        
+        return cert_info, security_info
+    
+    @staticmethod
+    def _parse_certificate(
+        cert: Dict[str, Any],
+        der: Optional[bytes] = None,
+    ) -> SSLCertificateInfo:
+        """
+        Build SSLCertificateInfo from the dict returned by getpeercert().
+        
+        When the DER form is given and `cryptography` is installed, the expiry
+        is read from the decoded certificate instead of the notAfter string.
+        """
+        # Parse subject and issuer (tuples of RDNs, each a tuple of (key, value))
+        subject = {k: v for rdn in cert.get('subject', ()) for k, v in rdn}
+        issuer = {k: v for rdn in cert.get('issuer', ()) for k, v in rdn}
+        
+        # Parse dates
+        not_before = cert.get('notBefore', '')
+        not_after = cert.get('notAfter', '')
+        
+        # Calculate expiry
+        expiry_date = _certificate_expiry(der, not_after)
+        if expiry_date is not None:
+            days_until_expiry = (expiry_date - datetime.now(timezone.utc)).days
+            expired = days_until_expiry < 0
+        else:
+            days_until_expiry = 0
+            expired = False
+        
+        # Get SAN (Subject Alternative Names)
+        san = [value for kind, value in cert.get('subjectAltName', ()) if kind == 'DNS']
+        
+        return SSLCertificateInfo(
+            subject=subject,
+            issuer=issuer,
+            version=cert.get('version', 0),
+            serial_number=cert.get('serialNumber', ''),
+            not_before=not_before,
+            not_after=not_after,
+            expired=expired,
+            days_until_expiry=days_until_expiry,
+            san=san,
+        )
     
     def _analyze_ssl_security(
         self,
         hostname: str,
         port: int,
+        security_info: SSLSecurityInfo,
         check_vulnerabilities: bool,
+        address: Optional[str] = None,
     ) -> SSLSecurityInfo:
-        """Analyze SSL/TLS security configuration."""
-        security_info = SSLSecurityInfo()
-        
-        # Test current connection
-        context = ssl.create_default_context()
-        
-        try:
-            with socket.create_connection((hostname, port), timeout=10) as sock:
-                with context.wrap_socket(sock, server_hostname=hostname) as ssock:
-                    # Get protocol version
-                    security_info.protocol_version = ssock.version() or "Unknown"
-                    
-                    # Get cipher suite
-                    cipher = ssock.cipher()
-                    if cipher:
-                        security_info.cipher_suite = cipher[0]
-                        security_info.key_size = cipher[2]
-                        
-                        # Check for forward secrecy
-                        cipher_name = cipher[0].upper()
-                        security_info.has_forward_secrecy = any(
-                            x in cipher_name for x in ['ECDHE', 'DHE']
-                        )
-        except Exception as e:
-            self.executor.logger.warning(f"SSL connection analysis failed: {e}")
+        """
+        Complete the security analysis started by _probe_once.
         
-        # Test protocol support
-        security_info.supports_tls_1_3 = self._test_protocol(hostname, port, ssl.PROTOCOL_TLS)
-        security_info.supports_tls_1_2 = self._test_protocol(hostname, port, ssl.PROTOCOL_TLSv1_2)
+        Fills in protocol support and, optionally, known vulnerabilities.
+        """
+        # Test protocol support; the probes are independent handshakes, so
+        # run them side by side and wait roughly one probe's latency.
+        with ThreadPoolExecutor(max_workers=len(self._PROTOCOL_PROBES)) as pool:
+            futures = {
+                attr: pool.submit(self._test_protocol, hostname, port, protocol, address)
+                for attr, protocol in self._PROTOCOL_PROBES
+            }
+        for attr, future in futures.items():
+            setattr(security_info, attr, future.result())
         
         # Check for vulnerabilities
         if check_vulnerabilities:
@@ -224,11 +351,19 @@ class SSLSecurityTest(BaseTest):
         
         return security_info
     
-    def _test_protocol(self, hostname: str, port: int, protocol: int) -> bool:
-        """Test if a specific SSL/TLS protocol is supported."""
+    def _test_protocol(
+        self,
+        hostname: str,
+        port: int,
+        protocol: ssl.TLSVersion,
+        address: Optional[str] = None,
+    ) -> bool:
+        """Test if a specific SSL/TLS protocol version is supported."""
+        context = self._get_protocol_context(protocol)
+        if context is None:
+            return False
         try:
-            context = ssl.SSLContext(protocol)
-            with socket.create_connection((hostname, port), timeout=5) as sock:
+            with socket.create_connection((address or hostname, port), timeout=5) as sock:
                 with context.wrap_socket(sock, server_hostname=hostname) as ssock:
                     return True
         except:
@@ -261,6 +396,9 @@ class SSLSecurityTest(BaseTest):
         if security_info.supports_tls_1_0:
             vulnerabilities.append("TLS 1.0 supported (deprecated)")
         
+        if security_info.supports_tls_1_1:
+            vulnerabilities.append("TLS 1.1 supported (deprecated)")
+        
         return vulnerabilities
     
     def _format_ssl_output(
@@ -289,6 +427,9 @@ class SSLSecurityTest(BaseTest):
         output.append(f"Forward Secrecy: {'Yes' if security_info.has_forward_secrecy else 'No'}")
         output.append(f"TLS 1.3 Support: {'Yes' if security_info.supports_tls_1_3 else 'No'}")
         output.append(f"TLS 1.2 Support: {'Yes' if security_info.supports_tls_1_2 else 'No'}")
+        output.append(f"TLS 1.1 Support: {'Yes' if security_info.supports_tls_1_1 else 'No'}")
+        output.append(f"TLS 1.0 Support: {'Yes' if security_info.supports_tls_1_0 else 'No'}")
+        output.append(f"SSLv3 Support: {'Yes' if security_info.supports_ssl_3 else 'No'}")
         
         if security_info.vulnerabilities:
             output.append("\n=== Vulnerabilities ===")
@@ -326,6 +467,7 @@ class PortSecurityTest(BaseTest):
         6379: "Redis (no authentication)",
         27017: "MongoDB (database exposure)",
     }
+    _DANGEROUS_SET = frozenset(DANGEROUS_PORTS)
     
     def run(
         self,
@@ -343,13 +485,10 @@ class PortSecurityTest(BaseTest):
             TestResult with security analysis
         """
         try:
-            dangerous_open = []
-            warnings = []
-            
-            for port in open_ports:
-                if port in self.DANGEROUS_PORTS:
-                    dangerous_open.append((port, self.DANGEROUS_PORTS[port]))
-                    warnings.append(f"Port {port} ({self.DANGEROUS_PORTS[port]}) is open")
+            dangerous_open = [
+                (port, self.DANGEROUS_PORTS[port])
+                for port in sorted(self._DANGEROUS_SET.intersection(open_ports))
+            ]
             
             status = "warning" if dangerous_open else "success"
             message = f"Found {len(dangerous_open)} potentially dangerous open ports" if dangerous_open else "No dangerous ports detected"
@@ -476,8 +615,38 @@ class DNSSecurityTest(BaseTest):
             self.csv_handler.write_result(result)
             return result
     
+    _dnssec_resolver = None
+    
+    @classmethod
+    def _get_dnssec_resolver(cls):
+        """Return the shared dnspython resolver asking for DNSSEC records (DO bit)."""
+        if cls._dnssec_resolver is None:
+            with _shared_init_lock:
+                if cls._dnssec_resolver is None:
+                    resolver = dns.resolver.Resolver()
+                    resolver.use_edns(0, dns.flags.DO, 4096)
+                    resolver.lifetime = 10
+                    cls._dnssec_resolver = resolver
+        return cls._dnssec_resolver
+    
     def _check_dnssec(self, domain: str) -> bool:
-        """Check if DNSSEC is enabled for domain."""
+        """
+        Check if DNSSEC is enabled for domain.
+        
+        Queries in-process with dnspython when it is installed; otherwise
+        shells out to `dig +dnssec`.
+        """
+        if dns is not None:
+            try:
+                answer = self._get_dnssec_resolver().resolve(
+                    domain, "A", raise_on_no_answer=False
+                )
+            except dns.exception.DNSException:
+                return False
+            return any(
+                rrset.rdtype == dns.rdatatype.RRSIG for rrset in answer.response.answer
+            )
+        
         try:
             # Use dig to check for DNSSEC records
             result = subprocess.run(
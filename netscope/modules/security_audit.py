@@ -5,17 +5,52 @@ Combines multiple security tests into a unified audit report.
 
 from __future__ import annotations
 
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
 from netscope.modules.base import BaseTest, TestResult
+from netscope.modules.ports import scan_ports
 from netscope.modules.security import SSLSecurityTest, PortSecurityTest, DNSSecurityTest
 from netscope.core.executor import TestExecutor
 from netscope.storage.csv_handler import CSVHandler
+from netscope.utils.compat import DATACLASS_SLOTS
 
+# Ports probed when run() is not given open_ports, and the connect timeout
+# for each; the scan connects to all of them at once and stops waiting a few
+# round trips after the host first answers
+_DANGEROUS_PORTS = tuple(sorted(PortSecurityTest._DANGEROUS_SET))
+_COMMON_PORT_TIMEOUT = 0.5
+_COMMON_PORT_RTT_FACTOR = 4.0
 
-@dataclass
+# probe name -> (finding category, label used when the probe itself fails)
+_PROBE_LABELS = {
+    "ssl": ("SSL/TLS", "SSL test"),
+    "port": ("Port Security", "Port security test"),
+    "dns": ("DNS Security", "DNS security test"),
+}
+
+# Upper bound on cached SSL/DNS results before expired ones are purged
+_CACHE_MAX_ENTRIES = 1024
+
+_RULE = "=" * 70
+_THIN_RULE = "-" * 70
+
+# Report sections in display order: (severity, section header)
+_SEVERITY_SECTIONS = (
+    ("critical", "\nCRITICAL Severity:"),
+    ("high", "\nHIGH Severity:"),
+    ("medium", "\nMEDIUM Severity:"),
+    ("low", "\nLOW Severity:"),
+    ("info", "\nINFO:"),
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class SecurityAuditResult:
     """Comprehensive security audit result."""
     target: str
@@ -50,6 +85,7 @@ class SecurityAudit(BaseTest):
         self,
         executor: TestExecutor,
         csv_handler: CSVHandler,
+        cache_ttl: float = 300.0,
     ):
         """
         Initialize security audit.
@@ -57,11 +93,18 @@ class SecurityAudit(BaseTest):
         Args:
             executor: Test executor instance
             csv_handler: CSV handler for logging
+            cache_ttl: Seconds to reuse SSL and DNS results for the same
+                target across audits (0 disables caching)
         """
         super().__init__(executor, csv_handler)
         self.ssl_test = SSLSecurityTest(executor, csv_handler)
         self.port_test = PortSecurityTest(executor, csv_handler)
         self.dns_test = DNSSecurityTest(executor, csv_handler)
+        self.cache_ttl = cache_ttl
+        # (test, target[, port]) -> (expiry on the monotonic clock, result)
+        self._cache: Dict[Tuple[Any, ...], Tuple[float, TestResult]] = {}
+        # SSL and DNS probes fill the cache from concurrent worker threads
+        self._cache_lock = threading.Lock()
     
     def run(
         self,
@@ -71,6 +114,8 @@ class SecurityAudit(BaseTest):
         include_ssl: bool = True,
         include_ports: bool = True,
         include_dns: bool = True,
+        force_refresh: bool = False,
+        fail_fast: bool = False,
     ) -> SecurityAuditResult:
         """
         Run comprehensive security audit.
@@ -82,6 +127,10 @@ class SecurityAudit(BaseTest):
             include_ssl: Include SSL/TLS security test
             include_ports: Include port security test
             include_dns: Include DNS security test
+            force_refresh: Re-run SSL and DNS tests even if cached results
+                for this target are still fresh
+            fail_fast: Stop waiting for the remaining tests once the score
+                has already reached 0
             
         Returns:
             SecurityAuditResult with comprehensive findings
@@ -93,89 +142,53 @@ class SecurityAudit(BaseTest):
             risk_level="low",
         )
         
-        findings = []
-        recommendations = []
-        
-        # SSL/TLS Security Test
+        # The probes are independent and network-bound, so run them side by
+        # side; each is analyzed on this thread as soon as it finishes
+        probes = []
         if include_ssl:
-            try:
-                ssl_result = self.ssl_test.run(target, port)
-                audit_result.ssl_result = ssl_result
-                
-                # Analyze SSL findings
-                ssl_findings, ssl_score = self._analyze_ssl_result(ssl_result)
-                findings.extend(ssl_findings)
-                audit_result.overall_score -= (100 - ssl_score)
-                
-                # SSL recommendations
-                if ssl_result.metrics.get("certificate_expired"):
-                    recommendations.append("Renew SSL/TLS certificate immediately")
-                if not ssl_result.metrics.get("supports_tls_1_3"):
-                    recommendations.append("Enable TLS 1.3 for better security")
-                if not ssl_result.metrics.get("has_forward_secrecy"):
-                    recommendations.append("Enable forward secrecy (ECDHE/DHE ciphers)")
-                
-            except Exception as e:
-                findings.append({
-                    "category": "SSL/TLS",
-                    "severity": "error",
-                    "finding": f"SSL test failed: {str(e)}",
-                })
-        
-        # Port Security Test
+            probes.append(("ssl", lambda: self._cached(
+                ("ssl", target, port), lambda: self.ssl_test.run(target, port), force_refresh,
+            )))
         if include_ports:
-            try:
-                # If open_ports not provided, use common dangerous ports
-                if open_ports is None:
-                    open_ports = self._scan_common_ports(target)
-                
-                port_result = self.port_test.run(target, open_ports)
-                audit_result.port_result = port_result
-                
-                # Analyze port findings
-                port_findings, port_score = self._analyze_port_result(port_result)
-                findings.extend(port_findings)
-                audit_result.overall_score -= (100 - port_score)
-                
-                # Port recommendations
-                dangerous_count = port_result.metrics.get("dangerous_ports_count", 0)
-                if dangerous_count > 0:
-                    recommendations.append(f"Close or restrict {dangerous_count} dangerous port(s)")
-                    recommendations.append("Implement firewall rules to limit port exposure")
-                
-            except Exception as e:
-                findings.append({
-                    "category": "Port Security",
-                    "severity": "error",
-                    "finding": f"Port security test failed: {str(e)}",
-                })
-        
-        # DNS Security Test
+            probes.append(("port", lambda: self._run_port_test(target, open_ports)))
         if include_dns:
+            probes.append(("dns", lambda: self._cached(
+                ("dns", target), lambda: self.dns_test.run(target), force_refresh,
+            )))
+        
+        # probe name -> (findings, recommendations, penalty)
+        reviews: Dict[str, Tuple[List[Dict[str, Any]], List[str], int]] = {}
+        # Sum of WEIGHTS for every issue found; the score is 100 minus this
+        penalty = 0
+        skipped = False
+        if probes:
+            pool = ThreadPoolExecutor(max_workers=len(probes))
             try:
-                dns_result = self.dns_test.run(target)
-                audit_result.dns_result = dns_result
-                
-                # Analyze DNS findings
-                dns_findings, dns_score = self._analyze_dns_result(dns_result)
-                findings.extend(dns_findings)
-                audit_result.overall_score -= (100 - dns_score)
-                
-                # DNS recommendations
-                if not dns_result.metrics.get("has_dnssec"):
-                    recommendations.append("Enable DNSSEC for DNS security")
-                if dns_result.metrics.get("dns_leak_detected"):
-                    recommendations.append("Configure DNS to prevent leaks")
-                
-            except Exception as e:
-                findings.append({
-                    "category": "DNS Security",
-                    "severity": "error",
-                    "finding": f"DNS security test failed: {str(e)}",
-                })
-        
-        # Ensure score is within bounds
-        audit_result.overall_score = max(0, min(100, audit_result.overall_score))
+                futures = {pool.submit(probe): name for name, probe in probes}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    reviews[name] = self._review_probe(name, future, audit_result)
+                    penalty += reviews[name][2]
+                    if fail_fast and penalty >= 100 and len(reviews) < len(probes):
+                        skipped = True
+                        break
+            finally:
+                # Probes still running after a fail-fast stop are abandoned
+                pool.shutdown(wait=not skipped, cancel_futures=True)
+        
+        # Findings and recommendations are reported in a fixed category
+        # order, whatever order the probes finished in
+        ordered = [reviews[name] for name in ("ssl", "port", "dns") if name in reviews]
+        findings = [finding for review in ordered for finding in review[0]]
+        recommendations = [rec for review in ordered for rec in review[1]]
+        if skipped:
+            findings.append({
+                "category": "Audit",
+                "severity": "info",
+                "finding": "Remaining checks skipped (score already 0)",
+            })
+        
+        audit_result.overall_score = max(0, 100 - penalty)
         
         # Determine risk level
         audit_result.risk_level = self._calculate_risk_level(audit_result.overall_score)
@@ -189,92 +202,200 @@ class SecurityAudit(BaseTest):
         
         return audit_result
     
+    def _review_probe(
+        self,
+        name: str,
+        future: Future,
+        audit_result: SecurityAuditResult,
+    ) -> Tuple[List[Dict[str, Any]], List[str], int]:
+        """
+        Analyze one finished probe and store its result on audit_result.
+        
+        Returns:
+            (findings, recommendations, penalty) for the probe's category
+        """
+        category, label = _PROBE_LABELS[name]
+        try:
+            result = future.result()
+            setattr(audit_result, f"{name}_result", result)
+            return getattr(self, f"_review_{name}_result")(result)
+        except Exception as e:
+            return [{
+                "category": category,
+                "severity": "error",
+                "finding": f"{label} failed: {str(e)}",
+            }], [], 0
+    
+    def _review_ssl_result(self, result: TestResult) -> Tuple[List[Dict[str, Any]], List[str], int]:
+        """SSL findings, recommendations and penalty."""
+        findings, penalty = self._analyze_ssl_result(result)
+        
+        recommendations = []
+        metrics = result.metrics
+        if metrics.get("certificate_expired"):
+            recommendations.append("Renew SSL/TLS certificate immediately")
+        if not metrics.get("supports_tls_1_3"):
+            recommendations.append("Enable TLS 1.3 for better security")
+        if not metrics.get("has_forward_secrecy"):
+            recommendations.append("Enable forward secrecy (ECDHE/DHE ciphers)")
+        
+        return findings, recommendations, penalty
+    
+    def _review_port_result(self, result: TestResult) -> Tuple[List[Dict[str, Any]], List[str], int]:
+        """Port findings, recommendations and penalty."""
+        findings, penalty = self._analyze_port_result(result)
+        
+        recommendations = []
+        dangerous_count = result.metrics.get("dangerous_ports_count", 0)
+        if dangerous_count > 0:
+            recommendations.append(f"Close or restrict {dangerous_count} dangerous port(s)")
+            recommendations.append("Implement firewall rules to limit port exposure")
+        
+        return findings, recommendations, penalty
+    
+    def _review_dns_result(self, result: TestResult) -> Tuple[List[Dict[str, Any]], List[str], int]:
+        """DNS findings, recommendations and penalty."""
+        findings, penalty = self._analyze_dns_result(result)
+        
+        recommendations = []
+        metrics = result.metrics
+        if not metrics.get("has_dnssec"):
+            recommendations.append("Enable DNSSEC for DNS security")
+        if metrics.get("dns_leak_detected"):
+            recommendations.append("Configure DNS to prevent leaks")
+        
+        return findings, recommendations, penalty
+    
+    def _cached(
+        self,
+        key: Tuple[Any, ...],
+        probe: Callable[[], TestResult],
+        force_refresh: bool = False,
+    ) -> TestResult:
+        """
+        Return a fresh cached result for key, or run probe and cache it.
+        
+        Certificates and DNS records change on a scale of hours, so repeated
+        audits of one target (e.g. from a monitoring loop) reuse them for
+        cache_ttl seconds instead of redoing the handshakes and lookups.
+        """
+        now = time.monotonic()
+        if not force_refresh:
+            with self._cache_lock:
+                entry = self._cache.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+        
+        # The probe runs unlocked so SSL and DNS lookups still overlap
+        result = probe()
+        # Failed handshakes and lookups are not cached, so the next audit retries
+        if self.cache_ttl > 0 and result.status != "error":
+            with self._cache_lock:
+                # Re-inserted keys move to the end, keeping the dict in expiry order
+                self._cache.pop(key, None)
+                if len(self._cache) >= _CACHE_MAX_ENTRIES:
+                    self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+                    if len(self._cache) >= _CACHE_MAX_ENTRIES:
+                        del self._cache[next(iter(self._cache))]
+                self._cache[key] = (now + self.cache_ttl, result)
+        return result
+    
+    def _run_port_test(self, target: str, open_ports: Optional[List[int]]) -> TestResult:
+        """Run the port security test, scanning common ports if none were given."""
+        if open_ports is None:
+            open_ports = self._scan_common_ports(target)
+        return self.port_test.run(target, open_ports)
+    
     def _analyze_ssl_result(self, result: TestResult) -> tuple[List[Dict], int]:
-        """Analyze SSL test result and return findings and score."""
+        """Analyze SSL test result and return findings and score penalty."""
         findings = []
-        score = 100
+        penalty = 0
+        metrics = result.metrics
+        weights = self.WEIGHTS
         
-        if result.metrics.get("certificate_expired"):
+        if metrics.get("certificate_expired"):
             findings.append({
                 "category": "SSL/TLS",
                 "severity": "critical",
                 "finding": "SSL certificate has expired",
             })
-            score -= self.WEIGHTS["ssl_expired"]
+            penalty += weights["ssl_expired"]
         
-        if result.metrics.get("key_size", 256) < 128:
+        key_size = metrics.get("key_size", 256)
+        if key_size < 128:
             findings.append({
                 "category": "SSL/TLS",
                 "severity": "high",
-                "finding": f"Weak cipher key size: {result.metrics.get('key_size')} bits",
+                "finding": f"Weak cipher key size: {key_size} bits",
             })
-            score -= self.WEIGHTS["ssl_weak_cipher"]
+            penalty += weights["ssl_weak_cipher"]
         
-        if not result.metrics.get("has_forward_secrecy"):
+        if not metrics.get("has_forward_secrecy"):
             findings.append({
                 "category": "SSL/TLS",
                 "severity": "medium",
                 "finding": "No forward secrecy (ECDHE/DHE)",
             })
-            score -= self.WEIGHTS["ssl_no_forward_secrecy"]
+            penalty += weights["ssl_no_forward_secrecy"]
         
-        if not result.metrics.get("supports_tls_1_2"):
+        if not metrics.get("supports_tls_1_2"):
             findings.append({
                 "category": "SSL/TLS",
                 "severity": "high",
                 "finding": "TLS 1.2 not supported",
             })
-            score -= self.WEIGHTS["ssl_old_protocol"]
+            penalty += weights["ssl_old_protocol"]
         
-        return findings, max(0, score)
+        return findings, penalty
     
     def _analyze_port_result(self, result: TestResult) -> tuple[List[Dict], int]:
-        """Analyze port security result and return findings and score."""
-        findings = []
-        score = 100
-        
-        dangerous_ports = result.metrics.get("dangerous_ports", [])
+        """Analyze port security result and return findings and score penalty."""
+        dangerous_ports = result.metrics.get("dangerous_ports") or ()
         
-        for port in dangerous_ports:
-            findings.append({
+        findings = [
+            {
                 "category": "Port Security",
                 "severity": "high",
                 "finding": f"Dangerous port {port} is open",
-            })
-            score -= self.WEIGHTS["dangerous_port_open"]
+            }
+            for port in dangerous_ports
+        ]
+        penalty = self.WEIGHTS["dangerous_port_open"] * len(dangerous_ports)
         
-        return findings, max(0, score)
+        return findings, penalty
     
     def _analyze_dns_result(self, result: TestResult) -> tuple[List[Dict], int]:
-        """Analyze DNS security result and return findings and score."""
+        """Analyze DNS security result and return findings and score penalty."""
         findings = []
-        score = 100
+        penalty = 0
+        metrics = result.metrics
+        weights = self.WEIGHTS
         
-        if not result.metrics.get("has_dnssec"):
+        if not metrics.get("has_dnssec"):
             findings.append({
                 "category": "DNS Security",
                 "severity": "low",
                 "finding": "DNSSEC not enabled",
             })
-            score -= self.WEIGHTS["no_dnssec"]
+            penalty += weights["no_dnssec"]
         
-        if result.metrics.get("dns_leak_detected"):
+        if metrics.get("dns_leak_detected"):
             findings.append({
                 "category": "DNS Security",
                 "severity": "medium",
                 "finding": "Potential DNS leak detected",
             })
-            score -= self.WEIGHTS["dns_leak"]
+            penalty += weights["dns_leak"]
         
-        if result.metrics.get("dns_hijacked"):
+        if metrics.get("dns_hijacked"):
             findings.append({
                 "category": "DNS Security",
                 "severity": "critical",
                 "finding": "Potential DNS hijacking detected",
             })
-            score -= self.WEIGHTS["dns_hijacking"]
+            penalty += weights["dns_hijacking"]
         
-        return findings, max(0, score)
+        return findings, penalty
     
     def _calculate_risk_level(self, score: int) -> str:
         """Calculate risk level from score."""
@@ -288,14 +409,18 @@ class SecurityAudit(BaseTest):
             return "critical"
     
     def _scan_common_ports(self, target: str) -> List[int]:
-        """Scan common dangerous ports."""
-        # In a real implementation, this would perform an actual scan
-        # For now, return empty list (would need port scanner integration)
-        return []
+        """Scan the ports PortSecurityTest flags as dangerous and return the open ones."""
+        open_ports, _ = scan_ports(
+            target,
+            _DANGEROUS_PORTS,
+            timeout=_COMMON_PORT_TIMEOUT,
+            rtt_factor=_COMMON_PORT_RTT_FACTOR,
+        )
+        return open_ports
     
     def _log_audit_result(self, result: SecurityAuditResult) -> None:
-        """Log audit result to CSV."""
-        self.csv_handler.write_result(
+        """Log audit result to CSV without waiting for the write."""
+        self.csv_handler.enqueue_result(
             timestamp=result.timestamp,
             test_name="security_audit",
             target=result.target,
@@ -316,44 +441,45 @@ def format_audit_report(audit_result: SecurityAuditResult) -> str:
     Returns:
         Formatted report string
     """
-    lines = []
-    
+    return "\n".join(_report_lines(audit_result))
+
+
+def _report_lines(audit_result: SecurityAuditResult) -> Iterator[str]:
+    """Yield the lines of the audit report, in order."""
     # Header
-    lines.append("=" * 70)
-    lines.append("SECURITY AUDIT REPORT")
-    lines.append("=" * 70)
-    lines.append(f"Target: {audit_result.target}")
-    lines.append(f"Timestamp: {audit_result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"Overall Score: {audit_result.overall_score}/100")
-    lines.append(f"Risk Level: {audit_result.risk_level.upper()}")
-    lines.append("=" * 70)
+    yield _RULE
+    yield "SECURITY AUDIT REPORT"
+    yield _RULE
+    yield f"Target: {audit_result.target}"
+    yield f"Timestamp: {audit_result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
+    yield f"Overall Score: {audit_result.overall_score}/100"
+    yield f"Risk Level: {audit_result.risk_level.upper()}"
+    yield _RULE
     
     # Findings
     if audit_result.findings:
-        lines.append("\nFINDINGS:")
-        lines.append("-" * 70)
+        yield "\nFINDINGS:"
+        yield _THIN_RULE
         
-        # Group by severity
-        critical = [f for f in audit_result.findings if f.get("severity") == "critical"]
-        high = [f for f in audit_result.findings if f.get("severity") == "high"]
-        medium = [f for f in audit_result.findings if f.get("severity") == "medium"]
-        low = [f for f in audit_result.findings if f.get("severity") == "low"]
+        # Group by severity in one pass
+        by_severity = defaultdict(list)
+        for finding in audit_result.findings:
+            by_severity[finding.get("severity")].append(finding)
         
-        for severity, findings in [("CRITICAL", critical), ("HIGH", high), ("MEDIUM", medium), ("LOW", low)]:
+        for severity, header in _SEVERITY_SECTIONS:
+            findings = by_severity.get(severity)
             if findings:
-                lines.append(f"\n{severity} Severity:")
+                yield header
                 for finding in findings:
-                    lines.append(f"  • [{finding['category']}] {finding['finding']}")
+                    yield f"  • [{finding['category']}] {finding['finding']}"
     else:
-        lines.append("\n✓ No security issues found")
+        yield "\n✓ No security issues found"
     
     # Recommendations
     if audit_result.recommendations:
-        lines.append("\nRECOMMENDATIONS:")
-        lines.append("-" * 70)
+        yield "\nRECOMMENDATIONS:"
+        yield _THIN_RULE
         for i, rec in enumerate(audit_result.recommendations, 1):
-            lines.append(f"{i}. {rec}")
-    
-    lines.append("\n" + "=" * 70)
+            yield f"{i}. {rec}"
     
-    return "\n".join(lines)
+    yield "\n" + _RULE
@@ -7,21 +7,181 @@ from __future__ import annotations
 
 import asyncio
 import concurrent.futures
-from typing import List, Dict, Any, Optional, Callable
-from dataclasses import dataclass
-from datetime import datetime
+import inspect
+import os
+import random
+import threading
+import time
+from collections import Counter, deque
+from itertools import islice
+from typing import List, Deque, Dict, Any, Optional, Callable, Iterator, NamedTuple, Sequence, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 
 from netscope.modules.base import TestResult
+from netscope.storage.csv_handler import flush_pending_writes
+from netscope.utils.compat import DATACLASS_SLOTS
 
 
-@dataclass
+class _BatchClock:
+    """
+    Wall-clock timestamps derived from one datetime.now() per batch.
+    
+    Durations and timestamps inside a batch are taken from time.monotonic(),
+    which is cheaper than datetime.now() and does not jump when the system
+    clock is adjusted.
+    """
+    
+    def __init__(self):
+        self.wall = datetime.now()
+        self.mono = time.monotonic()
+    
+    def timestamp(self, mono: float) -> datetime:
+        """Wall-clock time corresponding to a time.monotonic() reading."""
+        return self.wall + timedelta(seconds=mono - self.mono)
+
+
+class _RateLimiter:
+    """
+    Spaces out async test starts to at most `rate` per second across a batch.
+    
+    Each acquire() reserves the next free start slot and sleeps until it, so
+    the limit holds for the batch as a whole rather than per worker. Only
+    used from one event loop, so no locking is needed.
+    """
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_slot = time.monotonic()
+    
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class _ProgressThrottle:
+    """
+    Forwards (completed, total) to a progress callback at most once every
+    `every` completions or `interval` seconds, whichever comes first. The
+    final (total, total) call is always made.
+    """
+    
+    def __init__(
+        self,
+        callback: Optional[Callable[[int, int], None]],
+        total: int,
+        every: int = 1,
+        interval: float = 0.0,
+    ):
+        self.callback = callback
+        self.total = total
+        self.every = max(1, every)
+        self.interval = interval
+        self._reported = 0
+        self._last = time.monotonic()
+    
+    def __call__(self, completed: int) -> None:
+        if self.callback is None:
+            return
+        now = time.monotonic()
+        if (
+            completed - self._reported >= self.every
+            or completed == self.total
+            or (self.interval and now - self._last >= self.interval)
+        ):
+            self._reported = completed
+            self._last = now
+            self.callback(completed, self.total)
+
+
+def _error_result(
+    target: str,
+    summary: str,
+    error: str,
+    timestamp: Optional[datetime] = None,
+    duration: float = 0.0,
+    test_name: str = "parallel_test",
+) -> TestResult:
+    """
+    Build the error result recorded for a test that raised or timed out.
+    
+    Every field is built here with the right type, so the model is
+    constructed without running pydantic validation.
+    """
+    return TestResult.model_construct(
+        test_name=test_name,
+        target=target,
+        status="error",
+        timestamp=timestamp or datetime.now(),
+        duration=duration,
+        summary=summary,
+        error=error,
+        metrics={},
+        raw_output=error,
+    )
+
+
+class _Outcome(NamedTuple):
+    """How one pooled call ended; `error`/`summary` are set unless it returned."""
+    index: int
+    result: Optional[TestResult]
+    error: Optional[str]
+    summary: Optional[str]
+    finished: float  # time.monotonic()
+    duration: float
+
+
+def _default_max_workers() -> int:
+    """
+    Default worker count for I/O-bound tests: 5 threads per CPU, between 10
+    and 64. The NETSCOPE_MAX_WORKERS environment variable overrides it.
+    """
+    override = os.environ.get("NETSCOPE_MAX_WORKERS", "").strip()
+    if override:
+        try:
+            return max(1, int(override))
+        except ValueError:
+            pass
+    return min(64, max(10, (os.cpu_count() or 2) * 5))
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ParallelTestConfig:
-    """Configuration for parallel test execution."""
-    max_workers: int = 10
+    """
+    Configuration for parallel test execution.
+    
+    Tests always run on threads. They are I/O bound, so threads give the same
+    throughput as processes at a fraction of the memory: one interpreter
+    whatever max_workers is, rather than one per worker. Test functions are
+    often closures, which a process pool could not pickle anyway.
+    """
+    max_workers: int = field(default_factory=_default_max_workers)
     timeout: int = 30
     rate_limit: Optional[float] = None  # Requests per second
     retry_failed: bool = False
     retry_count: int = 3
+    # Shrink the per-target timeout to 3x the observed response time
+    # (never below min_timeout, never above timeout)
+    adaptive_timeout: bool = False
+    min_timeout: float = 0.5
+    # Monitoring cycles ContinuousMonitor keeps; older ones are dropped
+    history_limit: int = 10000
+    # Call progress callbacks only every N completions or every M ms,
+    # whichever comes first (defaults: on every completion)
+    progress_batch_every: int = 1
+    progress_batch_ms: float = 0.0
+    # Start every worker thread when the executor is built, rather than
+    # during the first batch
+    warmup: bool = False
+    # Replace the worker threads after this many tests so state leaked into
+    # them by long ContinuousMonitor runs is released (0: never)
+    recycle_after: int = 10_000
+    # Seconds ContinuousMonitor reuses a target's last result instead of
+    # re-testing it (None: test every target every cycle)
+    cache_ttl: Optional[float] = None
 
 
 class ParallelTestExecutor:
@@ -38,6 +198,139 @@ class ParallelTestExecutor:
         """
         self.config = config or ParallelTestConfig()
         self.results: List[TestResult] = []
+        # Moving average of successful test durations, in seconds
+        self._ewma: Optional[float] = None
+        # Reused across execute_parallel calls; threads are started on demand
+        self._pool = self._new_pool()
+        # Tests submitted to the current pool, for config.recycle_after
+        self._submitted = 0
+    
+    def _new_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.config.max_workers,
+            thread_name_prefix="netscope",
+        )
+        if self.config.warmup:
+            # The pool only starts a thread when none is idle, so hold every
+            # warm-up task until all of them are submitted
+            release = threading.Event()
+            futures = [pool.submit(release.wait) for _ in range(self.config.max_workers)]
+            release.set()
+            concurrent.futures.wait(futures)
+        return pool
+    
+    def _maybe_recycle_pool(self) -> None:
+        """Swap in fresh worker threads once config.recycle_after tests have run."""
+        if self.config.recycle_after and self._submitted >= self.config.recycle_after:
+            # Timed-out tests may still be running; let them finish on the old pool
+            self._pool.shutdown(wait=False)
+            self._pool = self._new_pool()
+            self._submitted = 0
+    
+    def __enter__(self) -> "ParallelTestExecutor":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Shut down the worker pool without waiting for running tests."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _record_response_time(self, seconds: float) -> None:
+        """Fold a successful test's duration into the moving average."""
+        if self._ewma is None:
+            self._ewma = seconds
+        else:
+            self._ewma = 0.2 * seconds + 0.8 * self._ewma
+    
+    def _progress(
+        self,
+        callback: Optional[Callable[[int, int], None]],
+        total: int,
+    ) -> _ProgressThrottle:
+        """Progress reporter for one batch, throttled as the config asks."""
+        return _ProgressThrottle(
+            callback, total,
+            every=self.config.progress_batch_every,
+            interval=self.config.progress_batch_ms / 1000.0,
+        )
+    
+    def _current_timeout(self) -> float:
+        """Per-target timeout, adapted to observed response times if enabled."""
+        config = self.config
+        if not config.adaptive_timeout or self._ewma is None:
+            return config.timeout
+        return min(config.timeout, max(config.min_timeout, 3 * self._ewma))
+    
+    def _run_pooled(
+        self,
+        calls: Sequence[Tuple[Callable, str]],
+        pools: Optional[Sequence[concurrent.futures.Executor]] = None,
+    ) -> Iterator[_Outcome]:
+        """
+        Run each (func, target) call on the pool and yield its outcome as it ends.
+        
+        `pools`, if given, names the pool for each call instead of this
+        executor's own. A call's timeout is measured from when a worker picks
+        it up, not from submission, so calls queued behind others are not
+        cut short.
+        """
+        # Worker start times and run times by submission index
+        started: Dict[int, float] = {}
+        elapsed: Dict[int, float] = {}
+        
+        def timed(index: int, func: Callable, target: str) -> TestResult:
+            started[index] = time.monotonic()
+            result = func(target)
+            elapsed[index] = time.monotonic() - started[index]
+            return result
+        
+        future_to_index = {
+            (pools[index] if pools else self._pool).submit(timed, index, func, target): index
+            for index, (func, target) in enumerate(calls)
+        }
+        pending = set(future_to_index)
+        
+        while pending:
+            timeout = self._current_timeout()
+            deadlines = [
+                started[future_to_index[f]] + timeout
+                for f in pending
+                if future_to_index[f] in started
+            ]
+            wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else timeout
+            done, pending = concurrent.futures.wait(
+                pending,
+                timeout=wait_for,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            
+            now = time.monotonic()
+            for future in done:
+                index = future_to_index[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    yield _Outcome(index, None, str(e), f"Test failed: {str(e)}",
+                                   now, now - started.get(index, now))
+                else:
+                    self._record_response_time(elapsed[index])
+                    yield _Outcome(index, result, None, None, now, elapsed[index])
+            
+            # A worker thread cannot be interrupted, so a timed-out call is
+            # reported as an error and left to finish in the background
+            expired = [
+                f for f in pending
+                if now - started.get(future_to_index[f], now) >= timeout
+            ]
+            for future in expired:
+                index = future_to_index[future]
+                pending.discard(future)
+                yield _Outcome(index, None, "Timeout", "Test timed out", now, now - started[index])
+        
+        self._submitted += len(calls) if not pools else sum(p is self._pool for p in pools)
+        self._maybe_recycle_pool()
     
     def execute_parallel(
         self,
@@ -56,41 +349,22 @@ class ParallelTestExecutor:
         Returns:
             List of TestResult objects
         """
-        results = []
-        total = len(targets)
-        completed = 0
+        # Filled by target position, so results come back in target order
+        results: List[Optional[TestResult]] = [None] * len(targets)
+        progress = self._progress(progress_callback, len(targets))
+        clock = _BatchClock()
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            # Submit all tasks
-            future_to_target = {
-                executor.submit(self._execute_with_timeout, test_func, target): target
-                for target in targets
-            }
-            
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(future_to_target):
-                target = future_to_target[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    # Create error result
-                    error_result = TestResult(
-                        test_name="parallel_test",
-                        target=target,
-                        status="error",
-                        timestamp=datetime.now(),
-                        duration=0.0,
-                        summary=f"Test failed: {str(e)}",
-                        error=str(e),
-                        metrics={},
-                        raw_output=str(e),
-                    )
-                    results.append(error_result)
-                
-                completed += 1
-                if progress_callback:
-                    progress_callback(completed, total)
+        calls = [(test_func, target) for target in targets]
+        for completed, outcome in enumerate(self._run_pooled(calls), 1):
+            result = outcome.result
+            if result is None:
+                result = _error_result(
+                    targets[outcome.index], outcome.summary, outcome.error,
+                    timestamp=clock.timestamp(outcome.finished),
+                    duration=outcome.duration,
+                )
+            results[outcome.index] = result
+            progress(completed)
         
         self.results = results
         return results
@@ -121,103 +395,69 @@ class ParallelTestExecutor:
         async_test_func: Callable,
         targets: List[str],
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> List[TestResult]:
-        """Execute async tests in batch."""
-        results = []
+        """
+        Execute async tests in batch.
+        
+        Callers that run several batches on the same loop can pass their own
+        semaphore so concurrency is bounded across batches.
+        """
         total = len(targets)
+        results: List[Optional[TestResult]] = [None] * total
         completed = 0
+        progress = self._progress(progress_callback, total)
+        
+        clock = _BatchClock()
         
         # Create semaphore for rate limiting
-        semaphore = asyncio.Semaphore(self.config.max_workers)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.config.max_workers)
+        
+        limiter = _RateLimiter(self.config.rate_limit) if self.config.rate_limit else None
         
         async def execute_with_semaphore(target: str) -> TestResult:
+            # Rate limiting, before taking a slot so waiting doesn't hold one
+            if limiter is not None:
+                await limiter.acquire()
+            
             async with semaphore:
-                # Rate limiting
-                if self.config.rate_limit:
-                    await asyncio.sleep(1.0 / self.config.rate_limit)
-                
+                start = time.monotonic()
                 try:
                     result = await asyncio.wait_for(
                         async_test_func(target),
-                        timeout=self.config.timeout,
+                        timeout=self._current_timeout(),
                     )
+                    self._record_response_time(time.monotonic() - start)
                     return result
                 except asyncio.TimeoutError:
-                    return TestResult(
-                        test_name="parallel_test",
-                        target=target,
-                        status="error",
-                        timestamp=datetime.now(),
-                        duration=0.0,
-                        summary="Test timed out",
-                        error="Timeout",
-                        metrics={},
-                        raw_output="Timeout",
-                    )
+                    error, summary = "Timeout", "Test timed out"
                 except Exception as e:
-                    return TestResult(
-                        test_name="parallel_test",
-                        target=target,
-                        status="error",
-                        timestamp=datetime.now(),
-                        duration=0.0,
-                        summary=f"Test failed: {str(e)}",
-                        error=str(e),
-                        metrics={},
-                        raw_output=str(e),
-                    )
+                    error, summary = str(e), f"Test failed: {str(e)}"
+                now = time.monotonic()
+                return _error_result(
+                    target, summary, error,
+                    timestamp=clock.timestamp(now),
+                    duration=now - start,
+                )
         
-        # Execute all tasks
-        tasks = [execute_with_semaphore(target) for target in targets]
+        # A fixed set of workers pulls targets from one shared iterator, so
+        # only max_workers coroutines exist at a time however many targets
+        # there are; the loop is single-threaded, so sharing it is safe
+        remaining = enumerate(targets)
         
-        # Gather results with progress tracking
-        for coro in asyncio.as_completed(tasks):
-            result = await coro
-            results.append(result)
-            completed += 1
-            if progress_callback:
-                progress_callback(completed, total)
+        async def worker() -> None:
+            nonlocal completed
+            for index, target in remaining:
+                results[index] = await execute_with_semaphore(target)
+                completed += 1
+                progress(completed)
+        
+        await asyncio.gather(*(worker() for _ in range(min(self.config.max_workers, total))))
         
         self.results = results
         return results
     
-    def _execute_with_timeout(
-        self,
-        test_func: Callable,
-        target: str,
-    ) -> TestResult:
-        """Execute test with timeout."""
-        try:
-            # Use concurrent.futures for timeout
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(test_func, target)
-                result = future.result(timeout=self.config.timeout)
-                return result
-        except concurrent.futures.TimeoutError:
-            return TestResult(
-                test_name="parallel_test",
-                target=target,
-                status="error",
-                timestamp=datetime.now(),
-                duration=0.0,
-                summary="Test timed out",
-                error="Timeout",
-                metrics={},
-                raw_output="Timeout",
-            )
-        except Exception as e:
-            return TestResult(
-                test_name="parallel_test",
-                target=target,
-                status="error",
-                timestamp=datetime.now(),
-                duration=0.0,
-                summary=f"Test failed: {str(e)}",
-                error=str(e),
-                metrics={},
-                raw_output=str(e),
-            )
-    
     def get_summary(self) -> Dict[str, Any]:
         """
         Get summary of parallel test results.
@@ -235,15 +475,14 @@ class ParallelTestExecutor:
             }
         
         total = len(self.results)
-        success = sum(1 for r in self.results if r.status == "success")
-        warning = sum(1 for r in self.results if r.status == "warning")
-        error = sum(1 for r in self.results if r.status == "error")
+        counts = Counter(r.status for r in self.results)
+        success = counts["success"]
         
         return {
             "total": total,
             "success": success,
-            "warning": warning,
-            "error": error,
+            "warning": counts["warning"],
+            "error": counts["error"],
             "success_rate": (success / total) * 100 if total > 0 else 0.0,
         }
 
@@ -251,17 +490,40 @@ class ParallelTestExecutor:
 class BatchTestRunner:
     """
     Run multiple different tests in parallel.
+    
+    Tests declaring an 'expected_duration' of at least SLOW_TEST_SECONDS
+    (full scans, traceroutes) can be given their own slow-lane pool, so they
+    never occupy the workers that quick probes are waiting for.
     """
     
-    def __init__(self, config: Optional[ParallelTestConfig] = None):
+    SLOW_TEST_SECONDS = 1.0
+    
+    def __init__(self, config: Optional[ParallelTestConfig] = None, slow_workers: int = 0):
         """
         Initialize batch test runner.
         
         Args:
             config: Parallel execution configuration
+            slow_workers: Threads for the slow lane (0: slow tests share the main pool)
         """
         self.config = config or ParallelTestConfig()
         self.executor = ParallelTestExecutor(config)
+        self._slow_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=slow_workers,
+            thread_name_prefix="netscope-slow",
+        ) if slow_workers > 0 else None
+    
+    def __enter__(self) -> "BatchTestRunner":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Shut down the shared worker pool (and the slow lane, if any)."""
+        self.executor.close()
+        if self._slow_pool is not None:
+            self._slow_pool.shutdown(wait=False, cancel_futures=True)
     
     def run_batch(
         self,
@@ -272,47 +534,40 @@ class BatchTestRunner:
         Run batch of different tests.
         
         Args:
-            tests: List of test dictionaries with 'name', 'func', and 'target'
+            tests: List of test dictionaries with 'name', 'func', and 'target',
+                and optionally 'expected_duration' in seconds
             progress_callback: Optional callback for progress updates
             
         Returns:
             Dictionary mapping test names to results
         """
-        results = {}
-        total = len(tests)
-        completed = 0
+        results: Dict[str, List[TestResult]] = {}
+        progress = self.executor._progress(progress_callback, len(tests))
+        clock = _BatchClock()
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            future_to_test = {
-                executor.submit(test['func'], test['target']): test['name']
+        # Same per-test timeout as execute_parallel, so one hung test cannot
+        # hold up the whole batch
+        calls = [(test['func'], test['target']) for test in tests]
+        pools = None
+        if self._slow_pool is not None:
+            pools = [
+                self._slow_pool
+                if test.get('expected_duration', 0) >= self.SLOW_TEST_SECONDS
+                else self.executor._pool
                 for test in tests
-            }
-            
-            for future in concurrent.futures.as_completed(future_to_test):
-                test_name = future_to_test[future]
-                try:
-                    result = future.result(timeout=self.config.timeout)
-                    if test_name not in results:
-                        results[test_name] = []
-                    results[test_name].append(result)
-                except Exception as e:
-                    if test_name not in results:
-                        results[test_name] = []
-                    results[test_name].append(TestResult(
-                        test_name=test_name,
-                        target="unknown",
-                        status="error",
-                        timestamp=datetime.now(),
-                        duration=0.0,
-                        summary=f"Test failed: {str(e)}",
-                        error=str(e),
-                        metrics={},
-                        raw_output=str(e),
-                    ))
-                
-                completed += 1
-                if progress_callback:
-                    progress_callback(completed, total)
+            ]
+        for completed, outcome in enumerate(self.executor._run_pooled(calls, pools), 1):
+            test = tests[outcome.index]
+            result = outcome.result
+            if result is None:
+                result = _error_result(
+                    test['target'], outcome.summary, outcome.error,
+                    timestamp=clock.timestamp(outcome.finished),
+                    duration=outcome.duration,
+                    test_name=test['name'],
+                )
+            results.setdefault(test['name'], []).append(result)
+            progress(completed)
         
         return results
 
@@ -320,6 +575,10 @@ class BatchTestRunner:
 class ContinuousMonitor:
     """
     Continuous network monitoring with periodic testing.
+    
+    While more than half of a cycle's results are errors the interval is
+    stretched (up to 10x) so a congested network is not probed harder; it
+    eases back to `interval` once a cycle comes back clean.
     """
     
     def __init__(
@@ -328,6 +587,7 @@ class ContinuousMonitor:
         targets: List[str],
         interval: int = 60,
         config: Optional[ParallelTestConfig] = None,
+        jitter: float = 0.0,
     ):
         """
         Initialize continuous monitor.
@@ -337,13 +597,26 @@ class ContinuousMonitor:
             targets: List of targets to monitor
             interval: Test interval in seconds
             config: Parallel execution configuration
+            jitter: Random extra delay per cycle, as a fraction of the interval,
+                so monitors started together drift apart
         """
         self.test_func = test_func
         self.targets = targets
         self.interval = interval
+        self.jitter = jitter
+        self._current_interval: float = interval
         self.executor = ParallelTestExecutor(config)
         self.running = False
-        self.history: List[Dict[str, Any]] = []
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=self.executor.config.history_limit)
+    
+    def _next_interval(self, results: List[TestResult]) -> float:
+        """Back off while most results are errors; ease back once a cycle is clean."""
+        errors = sum(r.status == "error" for r in results)
+        if errors * 2 > len(results):
+            self._current_interval = min(self._current_interval * 1.5, 10 * self.interval)
+        elif errors == 0:
+            self._current_interval = max(self.interval, self._current_interval / 1.5)
+        return self._current_interval
     
     async def start(
         self,
@@ -358,11 +631,49 @@ class ContinuousMonitor:
             callback: Optional callback for each test cycle
         """
         self.running = True
-        start_time = datetime.now()
+        start_time = time.monotonic()
+        self._current_interval = self.interval
+        
+        # Async tests run on this loop with one semaphore for every cycle;
+        # sync tests go to a worker thread so they don't block the loop
+        is_async = inspect.iscoroutinefunction(self.test_func)
+        semaphore = asyncio.Semaphore(self.executor.config.max_workers) if is_async else None
+        
+        # Last result per target and when it was taken; kept for this run only
+        cache_ttl = self.executor.config.cache_ttl
+        cached: Dict[str, Tuple[float, TestResult]] = {}
         
         while self.running:
+            cycle_start = time.monotonic()
+            
+            reused = [
+                result for taken, result in cached.values()
+                if cycle_start - taken < cache_ttl
+            ] if cache_ttl else []
+            fresh = {result.target for result in reused}
+            targets = [t for t in self.targets if t not in fresh]
+            
             # Run tests
-            results = self.executor.execute_parallel(self.test_func, self.targets)
+            if is_async:
+                results = await self.executor._execute_async_batch(
+                    self.test_func, targets, semaphore=semaphore,
+                )
+            else:
+                results = await asyncio.get_running_loop().run_in_executor(
+                    None, self.executor.execute_parallel, self.test_func, targets,
+                )
+            
+            if cache_ttl:
+                now = time.monotonic()
+                # Failed targets are not cached, so the next cycle retries them
+                cached.update(
+                    (result.target, (now, result)) for result in results
+                    if result.status != "error"
+                )
+                # Merge back in target order, as execute_parallel returns it
+                by_target = {result.target: result for result in reused + results}
+                results = [by_target[target] for target in self.targets]
+                self.executor.results = results
             
             # Store in history
             self.history.append({
@@ -377,16 +688,20 @@ class ContinuousMonitor:
             
             # Check duration
             if duration:
-                elapsed = (datetime.now() - start_time).total_seconds()
+                elapsed = time.monotonic() - start_time
                 if elapsed >= duration:
                     break
             
-            # Wait for next interval
-            await asyncio.sleep(self.interval)
+            # Wait for next interval, measured from the start of this cycle
+            # so the cadence doesn't drift by the time the tests took
+            interval = self._next_interval(results)
+            interval += random.uniform(0.0, self.jitter * interval)
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - cycle_start)))
     
     def stop(self) -> None:
-        """Stop continuous monitoring."""
+        """Stop continuous monitoring and wait for queued CSV rows to be written."""
         self.running = False
+        flush_pending_writes()
     
     def get_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -399,5 +714,5 @@ class ContinuousMonitor:
             List of history entries
         """
         if limit:
-            return self.history[-limit:]
-        return self.history
+            return list(islice(self.history, max(0, len(self.history) - limit), None))
+        return list(self.history)
@@ -7,21 +7,191 @@ generates a self-contained `report.html` summarizing tests and key metrics.
 
 from __future__ import annotations
 
-import csv
+import functools
+import gzip
+import io
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from string import Template
+from typing import Any, Dict, Optional, TextIO, Tuple
+
+import pandas as pd
+
+# Static page parts are built once at import; only the per-run values are
+# substituted into them for each report.
+_CSS = """
+body { font-family: system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
+       background: #0b1020; color: #f5f5f7; margin: 0; padding: 0; }
+header { background: linear-gradient(90deg, #2563eb, #14b8a6); padding: 1.5rem 2rem; color: white; }
+header h1 { margin: 0 0 0.3rem 0; font-size: 1.6rem; }
+header p { margin: 0.1rem 0; opacity: 0.9; }
+main { padding: 1.5rem 2rem 2rem 2rem; }
+.card { background: #111827; border-radius: 0.75rem; padding: 1rem 1.2rem; margin-bottom: 1rem;
+        border: 1px solid #1f2937; box-shadow: 0 10px 25px rgba(0,0,0,0.4); }
+.badge { display: inline-block; padding: 0.1rem 0.6rem; border-radius: 999px; font-size: 0.75rem; }
+.badge-success { background: #065f46; color: #bbf7d0; }
+.badge-warning { background: #92400e; color: #fed7aa; }
+.badge-failure { background: #7f1d1d; color: #fecaca; }
+table { width: 100%; border-collapse: collapse; margin-top: 0.5rem; font-size: 0.85rem; }
+th, td { padding: 0.4rem 0.5rem; border-bottom: 1px solid #1f2937; text-align: left; }
+th { color: #e5e7eb; font-weight: 600; }
+tr:nth-child(even) { background: #020617; }
+.section-title { font-size: 1.1rem; margin-bottom: 0.3rem; }
+.muted { color: #9ca3af; font-size: 0.85rem; }
+.pill { display: inline-block; padding: 0.1rem 0.5rem; border-radius: 999px; background: #111827;
+        border: 1px solid #1f2937; font-size: 0.75rem; margin-right: 0.25rem; color: #9ca3af; }
+code { background: #020617; padding: 0.05rem 0.3rem; border-radius: 0.25rem; }
+"""
+
+# Single-pass HTML escaping for _escape()
+_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#39;",
+})
+
+_STATUS_BADGES = {
+    "success": '<span class="badge badge-success">SUCCESS</span>',
+    "warning": '<span class="badge badge-warning">WARNING</span>',
+    "failure": '<span class="badge badge-failure">FAILURE</span>',
+}
+
+_HEADER_TEMPLATE = Template("""
+<header>
+  <h1>NetScope Report</h1>
+  <p><strong>Test:</strong> $test_type</p>
+  <p><strong>Target:</strong> $target &nbsp; $badge</p>
+  <p class="muted">$timestamp</p>
+</header>
+""")
+
+_CHARTS_HTML = """
+<div class="card">
+  <div class="section-title">Tests by Status</div>
+  <canvas id="statusChart" height="120"></canvas>
+</div>
+"""
+
+# Inline Chart.js (via CDN) and initialization script
+_CHART_JS_TEMPLATE = Template("""
+<script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+<script>
+  const ctx = document.getElementById('statusChart').getContext('2d');
+  new Chart(ctx, {
+    type: 'bar',
+    data: {
+      labels: ['SUCCESS', 'WARNING', 'FAILURE'],
+      datasets: [{
+        label: 'Tests',
+        data: $values,
+        backgroundColor: ['#22c55e', '#eab308', '#ef4444'],
+      }],
+    },
+    options: {
+      responsive: true,
+      plugins: {
+        legend: { display: false },
+      },
+      scales: {
+        x: {
+          ticks: { color: '#e5e7eb' },
+        },
+        y: {
+          beginAtZero: true,
+          ticks: { color: '#9ca3af', precision: 0 },
+        },
+      },
+    },
+  });
+</script>
+""")
+
+# Page skeleton, written around the streamed header/body/script
+_PAGE_HEAD_TEMPLATE = Template("""<!doctype html>
+<html lang="en">
+  <head>
+    <meta charset="utf-8" />
+    <title>NetScope Report - $title</title>
+    <style>""" + _CSS.replace("$", "$$") + """</style>
+  </head>
+  <body>
+    """)
+
+_PAGE_TAIL = """
+  </body>
+</html>
+"""
 
 
 def load_run_data(run_dir: Path) -> Dict[str, Any]:
     """
     Load metadata and CSV rows from a run directory.
 
+    Rows come from `results.parquet` (see CSVHandler.to_parquet) when it is
+    at least as new as `results.csv`, otherwise from the CSV.
+
     Returns a dict with:
       - metadata: dict from metadata.json (or {})
-      - rows: list of CSV rows (each a dict)
+      - rows: DataFrame of result rows, every column as str (empty if missing)
+
+    Results are cached per run directory and reused until one of its files
+    changes, so the HTML and notebook reports of a run parse it only once.
+    The rows DataFrame is shared between callers and must not be modified.
+    """
+    run_dir = run_dir.resolve()
+    data = _load_cached(
+        str(run_dir),
+        _file_stamp(run_dir / "metadata.json"),
+        _file_stamp(run_dir / "results.csv"),
+        _file_stamp(run_dir / "results.parquet"),
+    )
+    return dict(data)
+
+
+def load_run_summary(run_dir: Path) -> Dict[str, Dict[str, str]]:
+    """
+    Return {test_name: {metric: value}} for a run directory.
+
+    Each metric keeps the last value recorded for it; tests and metrics
+    are listed in the order they first appear. Tests without any named
+    metric map to an empty dict.
     """
-    data: Dict[str, Any] = {"metadata": {}, "rows": []}
+    return _summarize_rows(load_run_data(run_dir)["rows"])
+
+
+def _summarize_rows(rows: pd.DataFrame) -> Dict[str, Dict[str, str]]:
+    if "test_name" not in rows.columns:
+        return {}
+    summary: Dict[str, Dict[str, str]] = {name: {} for name in rows["test_name"].unique()}
+    if not {"metric", "value"} <= set(rows.columns):
+        return summary
+    named = rows[rows["metric"] != ""]
+    # sort=False keeps groups in first-seen order; last() is the last-wins value
+    last = named.groupby(["test_name", "metric"], sort=False)["value"].last()
+    for (test_name, metric), value in last.items():
+        summary[test_name][metric] = value
+    return summary
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of path, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(run_dir: str, *stamps: Optional[Tuple[int, int]]) -> Dict[str, Any]:
+    # stamps only take part in the cache key: a changed file is a new entry
+    return _read_run_data(Path(run_dir))
+
+
+def _read_run_data(run_dir: Path) -> Dict[str, Any]:
+    data: Dict[str, Any] = {"metadata": {}, "rows": _empty_rows()}
 
     meta_path = run_dir / "metadata.json"
     if meta_path.exists():
@@ -31,44 +201,70 @@ def load_run_data(run_dir: Path) -> Dict[str, Any]:
             data["metadata"] = {}
 
     csv_path = run_dir / "results.csv"
+    parquet_path = csv_path.with_suffix(".parquet")
+    if _parquet_is_current(parquet_path, csv_path):
+        try:
+            rows = pd.read_parquet(parquet_path, columns=["test_name", "metric", "value", "status"])
+            data["rows"] = rows.astype(str)
+            return data
+        except Exception:
+            # No Parquet engine installed, or a bad file: fall back to the CSV
+            pass
     if csv_path.exists():
         try:
-            with csv_path.open("r", encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f)
-                data["rows"] = list(reader)
+            # keep_default_na=False keeps empty cells as "" instead of NaN
+            data["rows"] = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
         except Exception:
-            data["rows"] = []
+            data["rows"] = _empty_rows()
 
     return data
 
 
-def _group_rows_by_test(rows: List[Dict[str, str]]) -> Dict[str, List[Dict[str, str]]]:
-    grouped: Dict[str, List[Dict[str, str]]] = {}
-    for row in rows:
-        test_name = row.get("test_name", "Unknown")
-        grouped.setdefault(test_name, []).append(row)
-    return grouped
+def _parquet_is_current(parquet_path: Path, csv_path: Path) -> bool:
+    """True if a Parquet export exists and is not older than the CSV it came from."""
+    try:
+        parquet_mtime = parquet_path.stat().st_mtime_ns
+    except OSError:
+        return False
+    try:
+        return parquet_mtime >= csv_path.stat().st_mtime_ns
+    except OSError:
+        return True
+
+
+def _empty_rows() -> pd.DataFrame:
+    return pd.DataFrame(columns=["test_name", "metric", "value", "status"], dtype=str)
 
 
 def _escape(text: Any) -> str:
     """Basic HTML escaping."""
-    s = str(text)
-    return (
-        s.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
-    )
+    return str(text).translate(_ESCAPE_TABLE)
+
+
+def _status_badge(value: str) -> str:
+    badge = _STATUS_BADGES.get((value or "").lower())
+    if badge is not None:
+        return badge
+    return f'<span class="badge">{_escape(value)}</span>'
 
 
 def generate_html(run_dir: Path) -> str:
     """
     Generate HTML string for a single run directory.
     """
+    buf = io.StringIO()
+    generate_html_to(run_dir, buf)
+    return buf.getvalue()
+
+
+def generate_html_to(run_dir: Path, out: TextIO) -> None:
+    """
+    Write the HTML report for a single run directory to `out` piece by
+    piece, without holding the whole page in memory.
+    """
     data = load_run_data(run_dir)
     meta = data.get("metadata") or {}
-    rows: List[Dict[str, str]] = data.get("rows") or []
+    rows: pd.DataFrame = data["rows"]
 
     test_type = meta.get("test_type", "Unknown Test")
     target = meta.get("target", "—")
@@ -76,178 +272,76 @@ def generate_html(run_dir: Path) -> str:
     system_info = meta.get("system_info") or {}
     timestamp = meta.get("timestamp", "")
 
-    grouped = _group_rows_by_test(rows)
-
     # Aggregate simple data for charts: test status counts
     status_counts = {"success": 0, "warning": 0, "failure": 0}
-    for row in rows:
-        s = (row.get("status") or "").lower()
-        if s in status_counts:
-            status_counts[s] += 1
-
-    # Simple CSS for a clean report
-    css = """
-body { font-family: system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
-       background: #0b1020; color: #f5f5f7; margin: 0; padding: 0; }
-header { background: linear-gradient(90deg, #2563eb, #14b8a6); padding: 1.5rem 2rem; color: white; }
-header h1 { margin: 0 0 0.3rem 0; font-size: 1.6rem; }
-header p { margin: 0.1rem 0; opacity: 0.9; }
-main { padding: 1.5rem 2rem 2rem 2rem; }
-.card { background: #111827; border-radius: 0.75rem; padding: 1rem 1.2rem; margin-bottom: 1rem;
-        border: 1px solid #1f2937; box-shadow: 0 10px 25px rgba(0,0,0,0.4); }
-.badge { display: inline-block; padding: 0.1rem 0.6rem; border-radius: 999px; font-size: 0.75rem; }
-.badge-success { background: #065f46; color: #bbf7d0; }
-.badge-warning { background: #92400e; color: #fed7aa; }
-.badge-failure { background: #7f1d1d; color: #fecaca; }
-table { width: 100%; border-collapse: collapse; margin-top: 0.5rem; font-size: 0.85rem; }
-th, td { padding: 0.4rem 0.5rem; border-bottom: 1px solid #1f2937; text-align: left; }
-th { color: #e5e7eb; font-weight: 600; }
-tr:nth-child(even) { background: #020617; }
-.section-title { font-size: 1.1rem; margin-bottom: 0.3rem; }
-.muted { color: #9ca3af; font-size: 0.85rem; }
-.pill { display: inline-block; padding: 0.1rem 0.5rem; border-radius: 999px; background: #111827;
-        border: 1px solid #1f2937; font-size: 0.75rem; margin-right: 0.25rem; color: #9ca3af; }
-code { background: #020617; padding: 0.05rem 0.3rem; border-radius: 0.25rem; }
-    """
+    if "status" in rows.columns:
+        counts = rows["status"].str.lower().value_counts()
+        for key in status_counts:
+            status_counts[key] = int(counts.get(key, 0))
 
-    def status_badge(value: str) -> str:
-        v = (value or "").lower()
-        if v == "success":
-            return '<span class="badge badge-success">SUCCESS</span>'
-        if v == "warning":
-            return '<span class="badge badge-warning">WARNING</span>'
-        if v == "failure":
-            return '<span class="badge badge-failure">FAILURE</span>'
-        return f'<span class="badge">{_escape(value)}</span>'
+    out.write(_PAGE_HEAD_TEMPLATE.substitute(title=_escape(test_type)))
 
     # Header HTML
-    header_html = f"""
-<header>
-  <h1>NetScope Report</h1>
-  <p><strong>Test:</strong> {_escape(test_type)}</p>
-  <p><strong>Target:</strong> {_escape(target)} &nbsp; {status_badge(status)}</p>
-  <p class="muted">{_escape(timestamp)}</p>
-</header>
-"""
+    out.write(_HEADER_TEMPLATE.substitute(
+        test_type=_escape(test_type),
+        target=_escape(target),
+        badge=_status_badge(status),
+        timestamp=_escape(timestamp),
+    ))
+    out.write("\n    <main>")
 
     # System info card
     sys_rows = []
     if isinstance(system_info, dict) and system_info:
         for key, value in system_info.items():
             sys_rows.append(f"<div><span class='pill'>{_escape(key)}</span> {_escape(value)}</div>")
-    sys_html = (
+    out.write(
         "<div class='card'>"
         "<div class='section-title'>System Information</div>"
         + ("".join(sys_rows) if sys_rows else "<div class='muted'>No system information available.</div>")
         + "</div>"
     )
+    out.write(_CHARTS_HTML)
 
     # Per-test sections
-    sections: List[str] = []
-    for test_name, test_rows in grouped.items():
-        # Collect key metrics (as last values per metric name)
-        metrics: Dict[str, str] = {}
-        for row in test_rows:
-            metric = row.get("metric") or ""
-            if metric:
-                metrics[metric] = row.get("value", "")
-
+    summary = _summarize_rows(rows)
+    for test_name, metrics in summary.items():
+        out.write(f"<div class='card'><div class='section-title'>{_escape(test_name)}</div>")
         # Build a small metrics table (metric -> value)
-        metrics_rows_html = ""
         if metrics:
-            metrics_rows_html = "<table><thead><tr><th>Metric</th><th>Value</th></tr></thead><tbody>"
+            parts = ["<table><thead><tr><th>Metric</th><th>Value</th></tr></thead><tbody>"]
             for m_name, m_val in metrics.items():
-                metrics_rows_html += (
+                parts.append(
                     f"<tr><td>{_escape(m_name.replace('_', ' ').title())}</td>"
                     f"<td>{_escape(m_val)}</td></tr>"
                 )
-            metrics_rows_html += "</tbody></table>"
+            parts.append("</tbody></table>")
+            out.write("".join(parts))
         else:
-            metrics_rows_html = "<div class='muted'>No metrics recorded for this test.</div>"
+            out.write("<div class='muted'>No metrics recorded for this test.</div>")
+        out.write("</div>")
 
-        sections.append(
-            "<div class='card'>"
-            f"<div class='section-title'>{_escape(test_name)}</div>"
-            + metrics_rows_html
-            + "</div>"
-        )
-
-    if not sections:
-        sections.append(
+    if not summary:
+        out.write(
             "<div class='card'><div class='muted'>No metrics were recorded for this run.</div></div>"
         )
-
-    body_html = "<main>" + sys_html + "".join(sections) + "</main>"
+    out.write("</main>\n    ")
 
     # Basic chart data (tests by status)
-    chart_labels = ["SUCCESS", "WARNING", "FAILURE"]
     chart_values = [
         status_counts["success"],
         status_counts["warning"],
         status_counts["failure"],
     ]
+    out.write(_CHART_JS_TEMPLATE.substitute(values=chart_values))
+    out.write(_PAGE_TAIL)
 
-    charts_html = """
-<div class="card">
-  <div class="section-title">Tests by Status</div>
-  <canvas id="statusChart" height="120"></canvas>
-</div>
-"""
-
-    body_html = "<main>" + sys_html + charts_html + "".join(sections) + "</main>"
 
-    # Inline Chart.js (via CDN) and initialization script
-    chart_js = f"""
-<script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-<script>
-  const ctx = document.getElementById('statusChart').getContext('2d');
-  new Chart(ctx, {{
-    type: 'bar',
-    data: {{
-      labels: {chart_labels},
-      datasets: [{{
-        label: 'Tests',
-        data: {chart_values},
-        backgroundColor: ['#22c55e', '#eab308', '#ef4444'],
-      }}],
-    }},
-    options: {{
-      responsive: true,
-      plugins: {{
-        legend: {{ display: false }},
-      }},
-      scales: {{
-        x: {{
-          ticks: {{ color: '#e5e7eb' }},
-        }},
-        y: {{
-          beginAtZero: true,
-          ticks: {{ color: '#9ca3af', precision: 0 }},
-        }},
-      }},
-    }},
-  }});
-</script>
-"""
-
-    html = f"""<!doctype html>
-<html lang="en">
-  <head>
-    <meta charset="utf-8" />
-    <title>NetScope Report - {_escape(test_type)}</title>
-    <style>{css}</style>
-  </head>
-  <body>
-    {header_html}
-    {body_html}
-    {chart_js}
-  </body>
-</html>
-"""
-    return html
-
-
-def generate_html_report(run_dir: Path, output_file: Path | None = None) -> Path:
+def generate_html_report(
+    run_dir: Path,
+    output_file: Path | None = None,
+    compress: bool = False,
+) -> Path:
     """
     Generate an HTML report for `run_dir`.
 
@@ -255,6 +349,7 @@ def generate_html_report(run_dir: Path, output_file: Path | None = None) -> Path
         run_dir: Path to a single test run directory.
         output_file: Optional explicit output HTML path. If None, writes `report.html`
             inside the run directory.
+        compress: Write a gzip-compressed `.html.gz` file instead of plain HTML.
 
     Returns:
         Path to the generated HTML file.
@@ -262,7 +357,12 @@ def generate_html_report(run_dir: Path, output_file: Path | None = None) -> Path
     run_dir = run_dir.resolve()
     if output_file is None:
         output_file = run_dir / "report.html"
-    html = generate_html(run_dir)
-    output_file.write_text(html, encoding="utf-8")
+    if compress:
+        if output_file.suffix != ".gz":
+            output_file = output_file.with_name(output_file.name + ".gz")
+        with gzip.open(output_file, "wt", encoding="utf-8", compresslevel=6) as f:
+            generate_html_to(run_dir, f)
+        return output_file
+    with open(output_file, "w", encoding="utf-8", buffering=1 << 16) as f:
+        generate_html_to(run_dir, f)
     return output_file
-
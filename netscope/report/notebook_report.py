@@ -11,7 +11,8 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from string import Template
+from typing import Any, Dict
 
 from netscope.report.html_report import load_run_data
 
@@ -34,78 +35,58 @@ def _mk_code_cell(code: str) -> Dict[str, Any]:
     }
 
 
-def generate_notebook(run_dir: Path) -> Dict[str, Any]:
-    """
-    Generate a notebook JSON structure for a run directory.
-    """
-    run_dir = run_dir.resolve()
-    data = load_run_data(run_dir)
-    meta = data.get("metadata") or {}
-
-    test_type = meta.get("test_type", "Unknown Test")
-    target = meta.get("target", "—")
-    status = meta.get("status", "—")
-    timestamp = meta.get("timestamp", "")
-
-    cells: List[Dict[str, Any]] = []
-
-    # Title
-    cells.append(
-        _mk_markdown_cell(
-            f"# NetScope Report – {test_type}\n\n"
-            f"- **Target**: `{target}`\n"
-            f"- **Status**: `{status}`\n"
-            f"- **Timestamp**: `{timestamp}`\n"
-        )
-    )
-
-    # Load metadata and CSV
-    cells.append(
-        _mk_code_cell(
-            "from pathlib import Path\n"
-            "import json\n"
-            "import pandas as pd\n\n"
-            f"run_dir = Path({json.dumps(str(run_dir))})\n"
-            "meta_path = run_dir / 'metadata.json'\n"
-            "csv_path = run_dir / 'results.csv'\n\n"
-            "with meta_path.open('r', encoding='utf-8') as f:\n"
-            "    metadata = json.load(f)\n"
-            "display(metadata)\n\n"
-            "df = pd.read_csv(csv_path)\n"
-            "df.head()"
-        )
-    )
-
-    # Group by test and show basic metrics
-    cells.append(
-        _mk_markdown_cell("## Metrics by test\n\n"
-                          "This cell groups metrics by test name for quick inspection.")
-    )
-    cells.append(
-        _mk_code_cell(
-            "df.groupby(['test_name', 'metric'])['value'].first().unstack('metric')"
-        )
-    )
-
-    # Placeholder for custom analysis
-    cells.append(
-        _mk_markdown_cell(
-            "## Custom analysis\n\n"
-            "- Plot latency over time\n"
-            "- Filter by target or status\n"
-            "- Join multiple runs, etc.\n"
-        )
-    )
-    cells.append(
-        _mk_code_cell(
-            "# Example: filter metrics for Ping Test\n"
-            "df_ping = df[df['test_name'] == 'Ping Test']\n"
-            "df_ping"
-        )
-    )
-
-    notebook = {
-        "cells": cells,
+def _json_fragment(value: Any) -> str:
+    """Encode value as the inside of a JSON string literal (no quotes)."""
+    return json.dumps(str(value))[1:-1]
+
+
+# The notebook is the same for every run apart from a few fields, so it is
+# serialized once at import. ${...} placeholders sit inside JSON strings and
+# are filled with _json_fragment() values, which keeps the document valid.
+# indent=1 matches what Jupyter itself writes.
+_NB_TEMPLATE = Template(json.dumps(
+    {
+        "cells": [
+            # Title
+            _mk_markdown_cell(
+                "# NetScope Report – ${test_type}\n\n"
+                "- **Target**: `${target}`\n"
+                "- **Status**: `${status}`\n"
+                "- **Timestamp**: `${timestamp}`\n"
+            ),
+            # Load metadata and CSV
+            _mk_code_cell(
+                "from pathlib import Path\n"
+                "import json\n"
+                "import pandas as pd\n\n"
+                "run_dir = Path(${run_dir})\n"
+                "meta_path = run_dir / 'metadata.json'\n"
+                "csv_path = run_dir / 'results.csv'\n\n"
+                "with meta_path.open('r', encoding='utf-8') as f:\n"
+                "    metadata = json.load(f)\n"
+                "display(metadata)\n\n"
+                "df = pd.read_csv(csv_path)\n"
+                "df.head()"
+            ),
+            # Group by test and show basic metrics
+            _mk_markdown_cell("## Metrics by test\n\n"
+                              "This cell groups metrics by test name for quick inspection."),
+            _mk_code_cell(
+                "df.groupby(['test_name', 'metric'])['value'].first().unstack('metric')"
+            ),
+            # Placeholder for custom analysis
+            _mk_markdown_cell(
+                "## Custom analysis\n\n"
+                "- Plot latency over time\n"
+                "- Filter by target or status\n"
+                "- Join multiple runs, etc.\n"
+            ),
+            _mk_code_cell(
+                "# Example: filter metrics for Ping Test\n"
+                "df_ping = df[df['test_name'] == 'Ping Test']\n"
+                "df_ping"
+            ),
+        ],
         "metadata": {
             "kernelspec": {
                 "display_name": "Python 3",
@@ -119,9 +100,29 @@ def generate_notebook(run_dir: Path) -> Dict[str, Any]:
         },
         "nbformat": 4,
         "nbformat_minor": 5,
-    }
+    },
+    indent=1,
+))
+
+
+def _render_notebook(run_dir: Path) -> str:
+    """Return the notebook JSON text for an already resolved run directory."""
+    meta = load_run_data(run_dir).get("metadata") or {}
+    return _NB_TEMPLATE.substitute(
+        test_type=_json_fragment(meta.get("test_type", "Unknown Test")),
+        target=_json_fragment(meta.get("target", "—")),
+        status=_json_fragment(meta.get("status", "—")),
+        timestamp=_json_fragment(meta.get("timestamp", "")),
+        # A Python string literal inside the JSON string
+        run_dir=_json_fragment(json.dumps(str(run_dir))),
+    )
 
-    return notebook
+
+def generate_notebook(run_dir: Path) -> Dict[str, Any]:
+    """
+    Generate a notebook JSON structure for a run directory.
+    """
+    return json.loads(_render_notebook(run_dir.resolve()))
 
 
 def generate_notebook_report(run_dir: Path, output_file: Path | None = None) -> Path:
@@ -139,7 +140,6 @@ def generate_notebook_report(run_dir: Path, output_file: Path | None = None) ->
     run_dir = run_dir.resolve()
     if output_file is None:
         output_file = run_dir / "report.ipynb"
-    nb = generate_notebook(run_dir)
-    output_file.write_text(json.dumps(nb, indent=2), encoding="utf-8")
+    output_file.write_text(_render_notebook(run_dir), encoding="utf-8")
     return output_file
 
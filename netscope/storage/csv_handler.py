@@ -2,11 +2,67 @@
 CSV file handling for test results.
 """
 
+import atexit
 import csv
+import logging
+import queue
+import threading
+import time
+import weakref
 from pathlib import Path
 from datetime import datetime
-from typing import Any
-from loguru import logger
+from typing import IO, Any, Dict, Iterable, List, Optional, Tuple
+
+from netscope.storage.logger import log as logger
+
+# Write buffer of each handler's open results file
+_BUFFER_SIZE = 1 << 16
+# Pending rows are written out once this many are queued or this old
+_BATCH_SIZE = 256
+_FLUSH_INTERVAL = 5.0
+
+# Rows queued by CSVHandler.enqueue_result, written by one daemon thread
+_write_queue: "queue.Queue[Tuple[CSVHandler, Dict[str, Any]]]" = queue.Queue(maxsize=1024)
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+# Handlers holding pending rows or an open file, flushed on demand and at exit
+_open_handlers: "weakref.WeakSet[CSVHandler]" = weakref.WeakSet()
+
+
+def _writer_loop() -> None:
+    while True:
+        handler, kwargs = _write_queue.get()
+        try:
+            handler.write_result(**kwargs)
+        except Exception as e:
+            logger.error("Background CSV write to %s failed: %s", handler.csv_file, e)
+        finally:
+            _write_queue.task_done()
+
+
+def _ensure_writer() -> None:
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(
+                target=_writer_loop,
+                name="netscope-csv-writer",
+                daemon=True,
+            )
+            _writer_thread.start()
+
+
+@atexit.register
+def flush_pending_writes() -> None:
+    """
+    Block until every row queued with enqueue_result has been written, then
+    flush every handler's buffered rows to disk.
+    """
+    if _writer_thread is not None:
+        _write_queue.join()
+    for handler in list(_open_handlers):
+        handler.flush()
 
 
 class CSVHandler:
@@ -29,18 +85,82 @@ class CSVHandler:
             'status',
             'details',
         ]
+        # Opened on first write and kept for the handler's lifetime
+        self._fh: Optional[IO[str]] = None
+        self._writer: Any = None
+        self._lock = threading.Lock()
+        # Rows not yet handed to the writer, in fieldnames order
+        self._pending: List[Tuple[str, ...]] = []
+        self._batch_size = _BATCH_SIZE
+        self._last_flush = time.monotonic()
         
         # Create CSV file with headers if it doesn't exist
         if not csv_file.exists():
             self._create_csv()
     
+    def __enter__(self) -> "CSVHandler":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    def _open(self):
+        """Return the csv writer, opening the file for appending on first use."""
+        if self._writer is None:
+            self._fh = open(self.csv_file, 'a', newline='', buffering=_BUFFER_SIZE)
+            self._writer = csv.writer(self._fh)
+        return self._writer
+    
+    def _buffer(self, rows: List[Tuple[str, ...]]):
+        """Queue rows, writing the batch out once it is full or old enough."""
+        with self._lock:
+            self._pending.extend(rows)
+            _open_handlers.add(self)
+            if (
+                len(self._pending) >= self._batch_size
+                or time.monotonic() - self._last_flush > _FLUSH_INTERVAL
+            ):
+                self._write_pending()
+    
+    def _write_pending(self):
+        """Write pending rows and flush the file. Caller holds self._lock."""
+        if self._pending:
+            self._open().writerows(self._pending)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Wrote %d results to %s", len(self._pending), self.csv_file)
+            self._pending.clear()
+        if self._fh is not None:
+            self._fh.flush()
+        self._last_flush = time.monotonic()
+    
+    def flush(self):
+        """Write pending rows to disk so other readers of the file see them."""
+        with self._lock:
+            self._write_pending()
+    
+    def close(self):
+        """Flush and close the results file; a later write reopens it."""
+        with self._lock:
+            self._write_pending()
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+                self._writer = None
+            _open_handlers.discard(self)
+    
     def _create_csv(self):
         """Create CSV file with headers."""
         with open(self.csv_file, 'w', newline='') as f:
             writer = csv.DictWriter(f, fieldnames=self.fieldnames)
             writer.writeheader()
         
-        logger.debug(f"Created CSV file: {self.csv_file}")
+        logger.debug("Created CSV file: %s", self.csv_file)
     
     def write_result(
         self,
@@ -64,21 +184,119 @@ class CSVHandler:
             status: Test status (success/warning/failure)
             details: Additional details
         """
-        row = {
-            'timestamp': timestamp.isoformat(),
+        self._buffer([(timestamp.isoformat(), test_name, target, metric, str(value), status, details)])
+    
+    def enqueue_result(
+        self,
+        timestamp: datetime,
+        test_name: str,
+        target: str,
+        metric: str,
+        value: Any,
+        status: str,
+        details: str = "",
+    ):
+        """
+        Queue a test result to be written to CSV by a background thread.
+        
+        Takes the same arguments as write_result but returns without waiting
+        for the disk write. Rows are written in the order they were queued;
+        call flush_pending_writes() to wait for them (this also happens at
+        interpreter exit).
+        """
+        _ensure_writer()
+        _write_queue.put((self, {
+            'timestamp': timestamp,
             'test_name': test_name,
             'target': target,
             'metric': metric,
-            'value': str(value),
+            'value': value,
             'status': status,
             'details': details,
-        }
+        }))
+    
+    def write_results(
+        self,
+        timestamp: datetime,
+        test_name: str,
+        target: str,
+        metrics: Iterable[Tuple[str, Any]],
+        status: str,
+        details: str = "",
+    ):
+        """
+        Write several metrics of one test result to CSV as one batch.
         
-        with open(self.csv_file, 'a', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=self.fieldnames)
-            writer.writerow(row)
+        All rows are queued into the handler's pending batch together, so
+        they reach the file in a single write when the batch is flushed.
+        
+        Args:
+            timestamp: Test timestamp
+            test_name: Name of the test
+            target: Target host/IP
+            metrics: (metric, value) pairs to write
+            status: Test status (success/warning/failure)
+            details: Additional details
+        """
+        ts = timestamp.isoformat()
+        self._append_rows([
+            (ts, test_name, target, metric, str(value), status, details)
+            for metric, value in metrics
+        ])
+    
+    def write_rows(self, rows: Iterable[Dict[str, Any]]):
+        """
+        Write result rows that differ in more than metric/value in one append.
+        
+        Args:
+            rows: Dicts with the same keys as write_result's arguments
+                (timestamp, test_name, target, metric, value, status, details)
+        """
+        self._append_rows([
+            (
+                row['timestamp'].isoformat(),
+                row['test_name'],
+                row['target'],
+                row['metric'],
+                str(row['value']),
+                row['status'],
+                row.get('details', ""),
+            )
+            for row in rows
+        ])
+    
+    def _append_rows(self, rows: List[Tuple[str, ...]]):
+        """Queue already formatted rows (in fieldnames order) as one batch."""
+        if not rows:
+            return
+        
+        self._buffer(rows)
+    
+    def to_parquet(self, out: Optional[Path] = None) -> Path:
+        """
+        Write all results to a columnar Parquet file.
+        
+        test_name, metric and status are stored as categoricals so repeated
+        names are dictionary-encoded. Needs a Parquet engine
+        (pip install netscope-cli[parquet]); pandas raises ImportError
+        without one.
+        
+        Args:
+            out: Output path (default: the CSV path with a .parquet suffix)
+        
+        Returns:
+            Path to the written Parquet file
+        """
+        import pandas as pd
+        
+        if out is None:
+            out = self.csv_file.with_suffix('.parquet')
         
-        logger.debug(f"Wrote result to CSV: {metric}={value}")
+        self.flush()
+        df = pd.read_csv(self.csv_file, dtype=str, keep_default_na=False)
+        df = df.astype({'test_name': 'category', 'metric': 'category', 'status': 'category'})
+        df.to_parquet(out, compression='zstd', index=False)
+        return out
     
     def read_results(self) -> list:
         """
@@ -92,6 +310,7 @@ class CSVHandler:
         if not self.csv_file.exists():
             return results
         
+        self.flush()
         with open(self.csv_file, 'r', newline='') as f:
             reader = csv.DictReader(f)
             results = list(reader)
@@ -2,10 +2,35 @@
 Logging configuration using loguru.
 """
 
+import inspect
+import logging
 from pathlib import Path
 from loguru import logger
 import sys
 
+# Stdlib logger for hot paths (e.g. CSV writes): Logger.debug returns before
+# building a record when DEBUG is off, where loguru always inspects the
+# caller's frame first. setup_logging forwards its records to the loguru sinks.
+log = logging.getLogger("netscope")
+
+
+class _LoguruHandler(logging.Handler):
+    """Hand stdlib log records to loguru, keeping the original caller."""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            level = logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+        
+        # Skip logging's own frames so {name}:{function}:{line} is the caller
+        frame, depth = inspect.currentframe(), 0
+        while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
+            frame = frame.f_back
+            depth += 1
+        
+        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+
 
 def setup_logging(output_dir: Path, verbose: bool = False) -> logger:
     """
@@ -49,6 +74,12 @@ def setup_logging(output_dir: Path, verbose: bool = False) -> logger:
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
     )
     
+    # Route the stdlib "netscope" logger into the sinks above. The file sink
+    # takes DEBUG, so that is the lowest level worth building records for.
+    log.handlers[:] = [_LoguruHandler()]
+    log.setLevel(logging.DEBUG)
+    log.propagate = False
+    
     logger.info("Logging initialized")
     logger.debug(f"Log files: {log_file}, {error_log}")
     
@@ -5,9 +5,13 @@ Minimalistic, terminal-like design inspired by Anthropic's UI principles.
 
 from __future__ import annotations
 
+import socket
 import time
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from typing import Deque, List, Dict, Any, Optional
 from dataclasses import dataclass
 
 from rich.console import Console, Group
@@ -19,6 +23,20 @@ from rich.text import Text
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeRemainingColumn
 from rich.align import Align
 
+# Color bands: colors[i] for values below thresholds[i] (and not an earlier one),
+# the last color at or above every threshold
+_LATENCY_THRESHOLDS = (20, 50, 100)
+_LATENCY_COLORS = ("green", "yellow", "orange", "red")
+_PACKET_LOSS_THRESHOLDS = (1, 5)
+_PACKET_LOSS_COLORS = ("green", "yellow", "red")
+
+_STATUS_ICONS = {
+    "success": "[green]✓[/green]",
+    "warning": "[yellow]⚠[/yellow]",
+    "error": "[red]✗[/red]",
+}
+_DEFAULT_STATUS_ICON = "[dim]?[/dim]"
+
 
 @dataclass
 class NetworkMetrics:
@@ -51,8 +69,14 @@ class NetworkDashboard:
         """
         self.console = console or Console()
         self.metrics = NetworkMetrics()
-        self.test_history: List[Dict[str, Any]] = []
         self.max_history = 10
+        # Most recent first; the deque drops the oldest entry once full
+        self.test_history: Deque[Dict[str, Any]] = deque(maxlen=self.max_history)
+        
+        # Panels are built once and updated in place on each refresh
+        self._metric_cells: Dict[str, Text] = {}
+        self._metrics_panel = self._build_metrics_panel()
+        self._status_panel: Optional[Panel] = None
     
     def create_layout(self) -> Layout:
         """
@@ -96,16 +120,13 @@ class NetworkDashboard:
             status: Test status (success, warning, error)
             duration: Test duration in seconds
         """
-        self.test_history.insert(0, {
+        self.test_history.appendleft({
             "test_name": test_name,
             "status": status,
             "duration": duration,
             "timestamp": datetime.now(),
         })
-        
-        # Keep only recent history
-        if len(self.test_history) > self.max_history:
-            self.test_history = self.test_history[:self.max_history]
+        self._status_panel = None
     
     def render_header(self) -> Panel:
         """Render dashboard header."""
@@ -119,45 +140,23 @@ class NetworkDashboard:
         
         return Panel(content, border_style="cyan", padding=(0, 1))
     
-    def render_metrics(self) -> Panel:
-        """Render network metrics panel."""
+    def _build_metrics_panel(self) -> Panel:
+        """Build the metrics panel, keeping the value cells for render_metrics."""
         table = Table(show_header=False, box=None, padding=(0, 2))
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="white")
         
-        # Latency with color coding
-        latency_color = self._get_latency_color(self.metrics.latency_ms)
-        table.add_row(
-            "Latency",
-            f"[{latency_color}]{self.metrics.latency_ms:.1f} ms[/{latency_color}]"
-        )
-        
-        # Packet loss with color coding
-        loss_color = self._get_packet_loss_color(self.metrics.packet_loss)
-        table.add_row(
-            "Packet Loss",
-            f"[{loss_color}]{self.metrics.packet_loss:.1f}%[/{loss_color}]"
-        )
-        
-        # Bandwidth
-        table.add_row(
-            "Download",
-            f"[green]{self.metrics.bandwidth_down:.1f} Mbps[/green]"
-        )
-        table.add_row(
-            "Upload",
-            f"[green]{self.metrics.bandwidth_up:.1f} Mbps[/green]"
-        )
-        
-        # Connections and devices
-        table.add_row(
-            "Active Connections",
-            f"[yellow]{self.metrics.active_connections}[/yellow]"
-        )
-        table.add_row(
-            "Devices Discovered",
-            f"[magenta]{self.metrics.devices_discovered}[/magenta]"
-        )
+        for key, label in (
+            ("latency", "Latency"),
+            ("packet_loss", "Packet Loss"),
+            ("download", "Download"),
+            ("upload", "Upload"),
+            ("connections", "Active Connections"),
+            ("devices", "Devices Discovered"),
+        ):
+            cell = Text()
+            self._metric_cells[key] = cell
+            table.add_row(label, cell)
         
         return Panel(
             table,
@@ -166,8 +165,36 @@ class NetworkDashboard:
             padding=(1, 2),
         )
     
+    def _set_metric(self, key: str, value: str, style: str) -> None:
+        cell = self._metric_cells[key]
+        cell.plain = value
+        cell.style = style
+    
+    def render_metrics(self) -> Panel:
+        """Render network metrics panel."""
+        metrics = self.metrics
+        
+        # Latency and packet loss with color coding
+        self._set_metric("latency", f"{metrics.latency_ms:.1f} ms", self._get_latency_color(metrics.latency_ms))
+        self._set_metric("packet_loss", f"{metrics.packet_loss:.1f}%", self._get_packet_loss_color(metrics.packet_loss))
+        
+        # Bandwidth
+        self._set_metric("download", f"{metrics.bandwidth_down:.1f} Mbps", "green")
+        self._set_metric("upload", f"{metrics.bandwidth_up:.1f} Mbps", "green")
+        
+        # Connections and devices
+        self._set_metric("connections", str(metrics.active_connections), "yellow")
+        self._set_metric("devices", str(metrics.devices_discovered), "magenta")
+        
+        return self._metrics_panel
+    
     def render_status(self) -> Panel:
-        """Render test history and status panel."""
+        """Render test history and status panel (rebuilt only after a new result)."""
+        if self._status_panel is None:
+            self._status_panel = self._build_status_panel()
+        return self._status_panel
+    
+    def _build_status_panel(self) -> Panel:
         if not self.test_history:
             content = Text("No tests run yet", style="dim italic")
             return Panel(
@@ -182,7 +209,7 @@ class NetworkDashboard:
         table.add_column("Status", justify="center")
         table.add_column("Duration", justify="right", style="dim")
         
-        for test in self.test_history[:5]:  # Show only 5 most recent
+        for test in islice(self.test_history, 5):  # Show only 5 most recent
             status_icon = self._get_status_icon(test["status"])
             table.add_row(
                 test["test_name"][:20],  # Truncate long names
@@ -237,14 +264,16 @@ class NetworkDashboard:
         layout = self.create_layout()
         start_time = time.time()
 
-        with Live(layout, console=self.console, refresh_per_second=2, screen=True) as live:
+        # The layout only changes when render() runs below, so draw it then
+        # instead of having Live redraw it from a timer thread in between.
+        with Live(layout, console=self.console, auto_refresh=False, screen=True) as live:
             while True:
                 # Update timestamp (in a real implementation, also refresh metrics from tests)
                 self.metrics.last_update = datetime.now()
 
                 # Render dashboard
                 self.render(layout)
-                live.update(layout)
+                live.refresh()
 
                 # Duration-based exit (for automated use)
                 if duration > 0 and time.time() - start_time > duration:
@@ -262,34 +291,15 @@ class NetworkDashboard:
     
     def _get_latency_color(self, latency: float) -> str:
         """Get color for latency value."""
-        if latency < 20:
-            return "green"
-        elif latency < 50:
-            return "yellow"
-        elif latency < 100:
-            return "orange"
-        else:
-            return "red"
+        return _LATENCY_COLORS[bisect_right(_LATENCY_THRESHOLDS, latency)]
     
     def _get_packet_loss_color(self, loss: float) -> str:
         """Get color for packet loss value."""
-        if loss < 1:
-            return "green"
-        elif loss < 5:
-            return "yellow"
-        else:
-            return "red"
+        return _PACKET_LOSS_COLORS[bisect_right(_PACKET_LOSS_THRESHOLDS, loss)]
     
     def _get_status_icon(self, status: str) -> str:
         """Get icon for test status."""
-        if status == "success":
-            return "[green]✓[/green]"
-        elif status == "warning":
-            return "[yellow]⚠[/yellow]"
-        elif status == "error":
-            return "[red]✗[/red]"
-        else:
-            return "[dim]?[/dim]"
+        return _STATUS_ICONS.get(status, _DEFAULT_STATUS_ICON)
 
 
 class DeviceTable:
@@ -365,9 +375,8 @@ class DeviceTable:
     def _ip_to_int(self, ip: str) -> int:
         """Convert IP address to integer for sorting."""
         try:
-            parts = ip.split(".")
-            return (int(parts[0]) << 24) + (int(parts[1]) << 16) + (int(parts[2]) << 8) + int(parts[3])
-        except:
+            return int.from_bytes(socket.inet_aton(ip), "big")
+        except (OSError, TypeError):
             return 0
 
 
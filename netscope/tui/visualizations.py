@@ -5,9 +5,11 @@ ASCII/Unicode graphs and charts for latency, bandwidth, and other metrics.
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
+import numpy as np
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
@@ -28,6 +30,8 @@ class Sparkline:
     
     # Unicode block characters for sparklines
     BLOCKS = ['▁', '▂', '▃', '▄', '▅', '▆', '▇', '█']
+    # Code points of BLOCKS as little-endian UTF-32, decoded in one call
+    _BLOCK_CODES = np.array([ord(block) for block in BLOCKS], dtype='<u4')
     
     @classmethod
     def render(
@@ -52,29 +56,28 @@ class Sparkline:
         if not values:
             return ""
         
+        arr = np.asarray(values, dtype=np.float64)
+        
         # Determine min/max for scaling
         if min_val is None:
-            min_val = min(values)
+            min_val = float(arr.min())
         if max_val is None:
-            max_val = max(values)
+            max_val = float(arr.max())
         
         # Avoid division by zero
         if max_val == min_val:
             return cls.BLOCKS[0] * len(values)
         
         # Sample values if width is specified
-        if width and width < len(values):
-            step = len(values) / width
-            values = [values[int(i * step)] for i in range(width)]
+        if width and width < len(arr):
+            step = len(arr) / width
+            arr = arr[(np.arange(width) * step).astype(np.intp)]
         
         # Scale values to block indices
-        sparkline = ""
-        for val in values:
-            normalized = (val - min_val) / (max_val - min_val)
-            block_idx = min(int(normalized * len(cls.BLOCKS)), len(cls.BLOCKS) - 1)
-            sparkline += cls.BLOCKS[block_idx]
+        normalized = (arr - min_val) / (max_val - min_val)
+        block_idx = np.clip((normalized * len(cls.BLOCKS)).astype(np.intp), 0, len(cls.BLOCKS) - 1)
         
-        return sparkline
+        return cls._BLOCK_CODES[block_idx].tobytes().decode('utf-32-le')
 
 
 class BarChart:
@@ -113,22 +116,16 @@ class BarChart:
         # Find max label length for alignment
         max_label_len = max(len(d.label) for d in data)
         
-        # Build chart
+        # Build chart; every bar is a prefix of the full-width one
+        full_bar = "█" * width
         lines = []
         for point in data:
-            # Label (right-aligned)
-            label = point.label.rjust(max_label_len)
-            
-            # Bar
             bar_length = int((point.value / max_val) * width)
-            bar = "█" * bar_length
-            
-            # Value
             value_str = f" {point.value:.1f}" if show_values else ""
-            
-            # Combine
-            line = f"{label} │ [{color}]{bar}[/{color}]{value_str}"
-            lines.append(line)
+            lines.append(
+                f"{point.label.rjust(max_label_len)} │ "
+                f"[{color}]{full_bar[:max(bar_length, 0)]}[/{color}]{value_str}"
+            )
         
         return Text.from_markup("\n".join(lines))
 
@@ -172,44 +169,29 @@ class LineGraph:
         if value_range == 0:
             value_range = 1
         
-        # Create grid
-        grid = [[' ' for _ in range(width)] for _ in range(height)]
-        
         # Sample data to fit width
-        if len(values) > width:
-            step = len(values) / width
-            sampled_values = [values[int(i * step)] for i in range(width)]
+        arr = np.asarray(values, dtype=np.float64)
+        if len(arr) > width:
+            step = len(arr) / width
+            sampled = arr[(np.arange(width) * step).astype(np.intp)]
         else:
-            sampled_values = values + [values[-1]] * (width - len(values))
+            sampled = np.concatenate([arr, np.full(width - len(arr), arr[-1])])
         
-        # Plot points
-        for x, val in enumerate(sampled_values):
-            if x >= width:
-                break
-            
-            # Scale to grid height
-            y = int(((val - min_val) / value_range) * (height - 1))
-            y = height - 1 - y  # Flip Y axis
-            
-            if 0 <= y < height:
-                grid[y][x] = '●'
+        # Scale to grid rows, flipping the Y axis
+        ys = height - 1 - (((sampled - min_val) / value_range) * (height - 1)).astype(np.intp)
         
-        # Connect points with lines
-        for x in range(len(sampled_values) - 1):
-            y1 = int(((sampled_values[x] - min_val) / value_range) * (height - 1))
-            y2 = int(((sampled_values[x + 1] - min_val) / value_range) * (height - 1))
-            
-            y1 = height - 1 - y1
-            y2 = height - 1 - y2
-            
-            # Draw line between points
-            if y1 != y2:
-                start_y = min(y1, y2)
-                end_y = max(y1, y2)
-                for y in range(start_y, end_y + 1):
-                    if 0 <= y < height and 0 <= x < width:
-                        if grid[y][x] == ' ':
-                            grid[y][x] = '│' if abs(y2 - y1) > 1 else '─'
+        # Create grid and plot points
+        grid = np.full((height, width), ' ', dtype='<U1')
+        grid[ys, np.arange(width)] = '●'
+        
+        # Connect points with lines: column x spans the rows between y(x) and y(x+1)
+        y1, y2 = ys[:-1], ys[1:]
+        rows = np.arange(height)[:, None]
+        span = (rows >= np.minimum(y1, y2)) & (rows <= np.maximum(y1, y2)) & (y1 != y2)
+        strokes = np.where(np.abs(y2 - y1) > 1, '│', '─')
+        cells = grid[:, :-1]
+        fill = span & (cells == ' ')
+        cells[fill] = np.broadcast_to(strokes, cells.shape)[fill]
         
         # Convert grid to string
         lines = []
@@ -221,7 +203,7 @@ class LineGraph:
             else:
                 label = ""
             
-            lines.append(label + ''.join(row))
+            lines.append(label + ''.join(row.tolist()))
         
         # Add X axis
         if show_axes:
@@ -273,27 +255,11 @@ class NetworkTopology:
         lines.append("     ┌───────┼───────┐")
         lines.append("     │       │       │")
         
-        # Devices (show up to 3 in diagram)
-        device_lines = ["     ", "     ", "     "]
-        
-        for i, device in enumerate(devices[:3]):
-            ip = device.get("ip", "N/A")
-            dtype = device.get("device_type", "Device")[:8]
-            
-            if i == 0:
-                device_lines[0] += f"┌──────┐"
-                device_lines[1] += f"│{dtype:^6}│"
-                device_lines[2] += f"└──────┘"
-            elif i == 1:
-                device_lines[0] += f"  ┌──────┐"
-                device_lines[1] += f"  │{dtype:^6}│"
-                device_lines[2] += f"  └──────┘"
-            elif i == 2:
-                device_lines[0] += f"  ┌──────┐"
-                device_lines[1] += f"  │{dtype:^6}│"
-                device_lines[2] += f"  └──────┘"
-        
-        lines.extend(device_lines)
+        # Devices (show up to 3 in diagram), boxes two spaces apart
+        dtypes = [device.get("device_type", "Device")[:8] for device in devices[:3]]
+        lines.append("     " + "  ".join(["┌──────┐"] * len(dtypes)))
+        lines.append("     " + "  ".join([f"│{dtype:^6}│" for dtype in dtypes]))
+        lines.append("     " + "  ".join(["└──────┘"] * len(dtypes)))
         
         # Show count if more devices
         if len(devices) > 3:
@@ -316,19 +282,29 @@ class LatencyHeatmap:
         "bad": "red",
     }
     
+    # Upper bounds (exclusive, ms) of every category but the last
+    THRESHOLDS = (20, 50, 100, 200)
+    CATEGORIES = ("excellent", "good", "fair", "poor", "bad")
+    # COLORS in CATEGORIES order
+    _CATEGORY_COLORS = ("green", "cyan", "yellow", "orange", "red")
+    
+    # Bars (one block per 10 ms) are sliced from this; longer ones are built
+    _BAR = "█" * 64
+    
     @classmethod
     def get_latency_category(cls, latency_ms: float) -> str:
         """Get latency category."""
-        if latency_ms < 20:
-            return "excellent"
-        elif latency_ms < 50:
-            return "good"
-        elif latency_ms < 100:
-            return "fair"
-        elif latency_ms < 200:
-            return "poor"
-        else:
-            return "bad"
+        return cls.CATEGORIES[bisect_right(cls.THRESHOLDS, latency_ms)]
+    
+    @classmethod
+    def get_latency_categories(cls, latencies: List[float]) -> List[str]:
+        """Get the latency category of every value in one vectorized pass."""
+        return [cls.CATEGORIES[i] for i in cls._category_indices(latencies)]
+    
+    @classmethod
+    def _category_indices(cls, latencies: List[float]) -> List[int]:
+        # np.digitize puts each edge in the upper bin, like bisect_right
+        return np.digitize(np.asarray(latencies, dtype=np.float64), cls.THRESHOLDS).tolist()
     
     @classmethod
     def render(
@@ -346,17 +322,20 @@ class LatencyHeatmap:
         Returns:
             Rich Text with color-coded heatmap
         """
-        text = Text()
+        parts: List[Tuple[str, str]] = []
+        append = parts.append
         
-        for target, latency in zip(targets, latencies):
-            category = cls.get_latency_category(latency)
-            color = cls.COLORS[category]
-            
-            text.append(f"{target:20} ", style="cyan")
-            text.append("█" * int(latency / 10), style=color)
-            text.append(f" {latency:.1f}ms\n", style="dim")
+        colors = [cls._CATEGORY_COLORS[i] for i in cls._category_indices(latencies)]
+        
+        for target, latency, color in zip(targets, latencies, colors):
+            append((f"{target:20} ", "cyan"))
+            blocks = int(latency / 10)
+            if blocks > 0:
+                bar = cls._BAR[:blocks] if blocks <= len(cls._BAR) else "█" * blocks
+                append((bar, color))
+            append((f" {latency:.1f}ms\n", "dim"))
         
-        return text
+        return Text().append_tokens(parts)
 
 
 def create_summary_panel(
@@ -386,14 +365,16 @@ def create_summary_panel(
         icon = "✗"
         color = "red"
     
-    # Build content
-    lines = []
-    for key, value in metrics.items():
-        # Format key (convert snake_case to Title Case)
-        formatted_key = key.replace("_", " ").title()
-        lines.append(f"[cyan]{formatted_key}:[/cyan] [white]{value}[/white]")
+    # Build content from styled parts (keys converted from snake_case to Title Case)
+    def parts():
+        for i, (key, value) in enumerate(metrics.items()):
+            if i:
+                yield "\n"
+            yield (f"{key.replace('_', ' ').title()}:", "cyan")
+            yield " "
+            yield (str(value), "white")
     
-    content = Text.from_markup("\n".join(lines))
+    content = Text.assemble(*parts())
     
     return Panel(
         content,
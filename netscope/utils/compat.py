@@ -0,0 +1,9 @@
+"""
+Python-version compatibility helpers.
+"""
+
+import sys
+
+# Keyword arguments for @dataclass that make it slotted (no per-instance
+# __dict__) where supported (3.10+); empty on 3.9
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
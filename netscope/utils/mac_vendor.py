@@ -5,6 +5,7 @@ Uses local OUI database for offline lookups.
 
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -231,7 +232,20 @@ OUI_DATABASE = {
     "F4:EC:38": "TP-Link Corporation",
 }
 
+# OUI_DATABASE keyed by the 24-bit OUI value, for lookups straight from a MAC
+_OUI_BY_INT = {int(oui.replace(":", ""), 16): vendor for oui, vendor in OUI_DATABASE.items()}
 
+# Separators and whitespace accepted between MAC address digits
+_MAC_SEPARATORS = str.maketrans("", "", ":-. \t\n\r\f\v")
+
+# A MAC address already in the XX:XX:XX:XX:XX:XX form normalize_mac returns
+_CANONICAL_MAC_RE = re.compile(r"[0-9A-F]{2}(?::[0-9A-F]{2}){5}")
+
+# A MAC address with its separators removed
+_HEX12_RE = re.compile(r"[0-9A-Fa-f]{12}")
+
+
+@lru_cache(maxsize=4096)
 def normalize_mac(mac: str) -> str:
     """
     Normalize MAC address to standard format (XX:XX:XX:XX:XX:XX).
@@ -242,15 +256,22 @@ def normalize_mac(mac: str) -> str:
     Returns:
         Normalized MAC address in uppercase with colons
     """
+    mac_upper = mac.upper()
+    if _CANONICAL_MAC_RE.fullmatch(mac_upper):
+        return mac_upper
+    
     # Remove common separators and whitespace
-    mac_clean = re.sub(r'[:\-\.\s]', '', mac.upper())
+    mac_clean = mac_upper.translate(_MAC_SEPARATORS)
     
     # Validate length
     if len(mac_clean) != 12:
         return mac  # Return original if invalid
     
     # Format as XX:XX:XX:XX:XX:XX
-    return ':'.join(mac_clean[i:i+2] for i in range(0, 12, 2))
+    return (
+        f"{mac_clean[0:2]}:{mac_clean[2:4]}:{mac_clean[4:6]}:"
+        f"{mac_clean[6:8]}:{mac_clean[8:10]}:{mac_clean[10:12]}"
+    )
 
 
 def get_oui(mac: str) -> str:
@@ -263,13 +284,18 @@ def get_oui(mac: str) -> str:
     Returns:
         OUI (first 3 octets) in format XX:XX:XX
     """
-    normalized = normalize_mac(mac)
+    return _oui_of(normalize_mac(mac))
+
+
+def _oui_of(normalized: str) -> str:
+    """OUI part of an already normalized MAC address."""
     parts = normalized.split(':')
     if len(parts) >= 3:
         return ':'.join(parts[:3])
     return ""
 
 
+@lru_cache(maxsize=4096)
 def lookup_vendor(mac: str) -> Optional[str]:
     """
     Lookup vendor name from MAC address.
@@ -280,6 +306,10 @@ def lookup_vendor(mac: str) -> Optional[str]:
     Returns:
         Vendor name if found, None otherwise
     """
+    mac_clean = mac.translate(_MAC_SEPARATORS)
+    # int() alone would also take "0x", signs and "_" separators
+    if _HEX12_RE.fullmatch(mac_clean):
+        return _OUI_BY_INT.get(int(mac_clean[:6], 16))
     oui = get_oui(mac)
     return OUI_DATABASE.get(oui)
 
@@ -296,19 +326,67 @@ def get_device_info(mac: str, ip: str = "", hostname: str = "") -> dict:
     Returns:
         Dictionary with device information
     """
+    normalized = normalize_mac(mac)
     vendor = lookup_vendor(mac)
     device_type = _guess_device_type(vendor, hostname)
     
     return {
-        "mac": normalize_mac(mac),
+        "mac": normalized,
         "ip": ip,
         "hostname": hostname,
         "vendor": vendor or "Unknown",
         "device_type": device_type,
-        "oui": get_oui(mac),
+        "oui": _oui_of(normalized),
     }
 
 
+# Vendor-name substrings and the device category they imply, checked in order
+_VENDOR_CATEGORIES = (
+    # Network infrastructure
+    (("cisco", "juniper", "arista", "mikrotik"), "Network Device"),
+    (("netgear", "tp-link", "linksys", "d-link", "asus"), "Router/AP"),
+    (("ubiquiti",), "Access Point"),
+    # Computers
+    (("apple", "dell", "hp", "lenovo", "asus"), "Computer/Device"),
+    # Virtualization
+    (("vmware", "virtualbox", "qemu"), "Virtual Machine"),
+    # IoT
+    (("espressif",), "IoT Device"),
+    (("raspberry", "arduino"), "IoT/Embedded"),
+    # Printers
+    (("canon", "epson", "brother", "xerox"), "Printer"),
+    # Mobile
+    (("samsung", "huawei", "xiaomi", "oppo"), "Mobile Device"),
+    # Intel NICs are common in servers and workstations
+    (("intel",), "Computer/Server"),
+)
+
+
+# One lookahead branch per category, all anchored at the start: the regex
+# engine tries them in table order, so the first matching rule wins
+# (not the leftmost substring) and lastgroup names it.
+_VENDOR_CATEGORY_RE = re.compile(
+    "^(?:" + "|".join(
+        f"(?=.*?(?:{'|'.join(map(re.escape, substrings))}))(?P<c{i}>)"
+        for i, (substrings, _) in enumerate(_VENDOR_CATEGORIES)
+    ) + ")",
+    re.DOTALL,
+)
+_CATEGORY_BY_GROUP = {f"c{i}": category for i, (_, category) in enumerate(_VENDOR_CATEGORIES)}
+
+
+def _vendor_category(vendor: str) -> str:
+    """Device category implied by a vendor name, before hostname hints."""
+    match = _VENDOR_CATEGORY_RE.match(vendor.lower())
+    if match is None:
+        return "Unknown"
+    return _CATEGORY_BY_GROUP[match.lastgroup]
+
+
+# Categories of every vendor in the embedded database, resolved once
+_CATEGORY_BY_VENDOR = {vendor: _vendor_category(vendor) for vendor in set(OUI_DATABASE.values())}
+
+
 def _guess_device_type(vendor: Optional[str], hostname: str) -> str:
     """
     Guess device type based on vendor and hostname.
@@ -323,50 +401,23 @@ def _guess_device_type(vendor: Optional[str], hostname: str) -> str:
     if not vendor:
         return "Unknown"
     
-    vendor_lower = vendor.lower()
-    hostname_lower = hostname.lower() if hostname else ""
+    category = _CATEGORY_BY_VENDOR.get(vendor)
+    if category is None:
+        category = _vendor_category(vendor)
     
-    # Network infrastructure
-    if any(x in vendor_lower for x in ["cisco", "juniper", "arista", "mikrotik"]):
-        return "Network Device"
-    if any(x in vendor_lower for x in ["netgear", "tp-link", "linksys", "d-link", "asus"]):
+    # Routers and computers are refined by their hostname
+    if category == "Router/AP" and hostname:
+        hostname_lower = hostname.lower()
         if any(x in hostname_lower for x in ["router", "gateway"]):
             return "Router"
-        return "Router/AP"
-    if "ubiquiti" in vendor_lower:
-        return "Access Point"
-    
-    # Computers
-    if any(x in vendor_lower for x in ["apple", "dell", "hp", "lenovo", "asus"]):
+    elif category == "Computer/Device" and hostname:
+        hostname_lower = hostname.lower()
         if any(x in hostname_lower for x in ["iphone", "ipad"]):
             return "Mobile Device"
         if any(x in hostname_lower for x in ["macbook", "imac", "laptop"]):
             return "Computer"
-        return "Computer/Device"
-    
-    # Virtualization
-    if any(x in vendor_lower for x in ["vmware", "virtualbox", "qemu"]):
-        return "Virtual Machine"
-    
-    # IoT
-    if "espressif" in vendor_lower:
-        return "IoT Device"
-    if any(x in vendor_lower for x in ["raspberry", "arduino"]):
-        return "IoT/Embedded"
-    
-    # Printers
-    if any(x in vendor_lower for x in ["canon", "epson", "brother", "xerox"]):
-        return "Printer"
-    
-    # Mobile
-    if any(x in vendor_lower for x in ["samsung", "huawei", "xiaomi", "oppo"]):
-        return "Mobile Device"
     
-    # Intel NICs are common in servers and workstations
-    if "intel" in vendor_lower:
-        return "Computer/Server"
-    
-    return "Unknown"
+    return category
 
 
 def export_oui_database(output_path: Path) -> None:
@@ -388,5 +439,15 @@ def import_oui_database(input_path: Path) -> dict:
         
     Returns:
         Dictionary of OUI to vendor mappings
+    
+    The parsed file is cached until its modification time or size changes.
     """
-    return json.loads(input_path.read_text())
+    input_path = input_path.resolve()
+    st = input_path.stat()
+    return dict(_load_oui_cached(str(input_path), st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=4)
+def _load_oui_cached(path: str, mtime_ns: int, size: int) -> dict:
+    # mtime_ns and size only take part in the cache key
+    return json.loads(Path(path).read_text())
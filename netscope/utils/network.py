@@ -2,8 +2,11 @@
 Network utility functions.
 """
 
+import ipaddress
 import re
-import socket
+
+# A single DNS label: alphanumerics and inner hyphens, at most 63 chars
+_LABEL_RE = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?$')
 
 
 def is_valid_ip(ip: str) -> bool:
@@ -16,10 +19,19 @@ def is_valid_ip(ip: str) -> bool:
     Returns:
         True if valid IP address
     """
+    parts = ip.split('.')
+    if len(parts) == 4:
+        # Dotted-quad IPv4 only; legacy forms such as "127.1" are rejected
+        for part in parts:
+            if not (part.isascii() and part.isdigit()) or len(part) > 3 or int(part) > 255:
+                return False
+        return True
+    if ':' not in ip:
+        return False
     try:
-        socket.inet_aton(ip)
+        ipaddress.IPv6Address(ip)
         return True
-    except socket.error:
+    except ValueError:
         return False
 
 
@@ -41,6 +53,5 @@ def is_valid_hostname(hostname: str) -> bool:
         hostname = hostname[:-1]
     
     # Check each label
-    allowed = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?$')
-
-    return all(allowed.match(label) for label in hostname.split('.'))
\ No newline at end of file
+    match = _LABEL_RE.match
+    return all(match(label) for label in hostname.split('.'))
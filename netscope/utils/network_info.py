@@ -5,17 +5,49 @@ Cross-platform (Linux, macOS, Windows).
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import http.client
+import ipaddress
+import json
 import platform
 import re
+import shutil
 import socket
+import struct
 import subprocess
-import urllib.request
+import threading
+import time
+import urllib.parse
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Hashable, Optional, Tuple
 
+from netscope.utils.compat import DATACLASS_SLOTS
 
-@dataclass
+try:
+    import netifaces
+except ImportError:  # optional: pip install netscope-cli[advanced]
+    netifaces = None
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+# Patterns for parsing command output
+_MAC_RE = re.compile(r"([0-9a-fA-F]{2}[:-][0-9a-fA-F]{2}[:-][0-9a-fA-F]{2}[:-][0-9a-fA-F]{2}[:-][0-9a-fA-F]{2}[:-][0-9a-fA-F]{2})")
+_LINUX_DEFAULT_RE = re.compile(r"default\s+via\s+(\S+)\s+dev\s+(\S+)")
+_INET_PREFIX_RE = re.compile(r"inet\s+\S+/(\d+)")
+_DARWIN_INET_RE = re.compile(r"inet\s+(\S+)\s+netmask\s+0x([0-9a-fA-F]+)")
+
+_SIOCGIFNETMASK = 0x891B  # linux/sockios.h
+
+_OS_TYPE = platform.system()
+
+
+@dataclass(**DATACLASS_SLOTS)
 class NetworkInfo:
     """Network information for the current host."""
 
@@ -30,255 +62,543 @@ class NetworkInfo:
     location: str = ""
 
 
+class _TTLCache:
+    """Thread-safe mapping whose entries expire `ttl` seconds after being stored."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for `key`, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if time.monotonic() >= expires:
+                del self._entries[key]
+                return None
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# The public IP and its ISP/location rarely change; failed lookups are not cached
+_public_info_cache = _TTLCache(60.0)
+_public_ip_cache = _TTLCache(60.0)
+
+
+def clear_cache() -> None:
+    """Forget cached public-IP, provider/location and resolv.conf results."""
+    _public_info_cache.clear()
+    _public_ip_cache.clear()
+    _parse_resolv_conf.cache_clear()
+
+
 def _get_local_ip() -> str:
     """Get primary local IPv4 address."""
+    # The hostname's own address, from the hosts file / NSS cache
+    try:
+        for *_, sockaddr in socket.getaddrinfo(socket.gethostname(), None, socket.AF_INET):
+            addr = ipaddress.IPv4Address(sockaddr[0])
+            if not (addr.is_loopback or addr.is_link_local):
+                return str(addr)
+    except (OSError, UnicodeError):
+        pass
+    # Otherwise the source address the kernel routes from; a UDP connect
+    # sends nothing, so the timeout can be short
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.settimeout(2.0)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-        return ip or ""
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.settimeout(0.1)
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0] or ""
     except OSError:
+        return ""
+
+
+_HTTP_HEADERS = {"User-Agent": "NetScope/1.0"}
+
+# Idle kept-alive connections, one per (scheme, host), so repeated lookups
+# skip the TCP (and TLS) handshake
+_idle_connections: Dict[Tuple[str, str], http.client.HTTPConnection] = {}
+_idle_lock = threading.Lock()
+
+
+def _http_get(url: str, timeout: float) -> str:
+    """GET `url` over a pooled keep-alive connection and return the decoded body."""
+    parts = urllib.parse.urlsplit(url)
+    key = (parts.scheme, parts.netloc)
+    target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+    with _idle_lock:
+        conn = _idle_connections.pop(key, None)
+    reused = conn is not None
+    while True:
+        if conn is None:
+            conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+            conn = conn_cls(parts.netloc, timeout=timeout)
+        elif conn.sock is not None:
+            conn.sock.settimeout(timeout)
         try:
-            return socket.gethostbyname(socket.gethostname()) or ""
-        except OSError:
-            return ""
+            conn.request("GET", target, headers=_HTTP_HEADERS)
+            resp = conn.getresponse()
+            body = resp.read()
+            break
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            if not reused:
+                raise
+            # The server dropped the idle connection; retry once on a new one
+            conn, reused = None, False
+
+    if resp.will_close:
+        conn.close()
+    else:
+        with _idle_lock:
+            if key in _idle_connections:
+                conn.close()
+            else:
+                _idle_connections[key] = conn
+    if resp.status >= 400:
+        raise http.client.HTTPException(f"HTTP {resp.status} from {parts.netloc}")
+    return body.decode()
+
+
+@atexit.register
+def _close_idle_connections() -> None:
+    with _idle_lock:
+        for conn in _idle_connections.values():
+            conn.close()
+        _idle_connections.clear()
+
+
+# Without an address in the path, ip-api.com describes the caller's own IP
+_IP_API_URL = "http://ip-api.com/json/?fields=query,isp,country,city,regionName"
+
+
+def _get_public_info(timeout: float = 2.0) -> tuple[str, str, str]:
+    """
+    Public IPv4 address, ISP/provider and location from a single ip-api.com
+    request. Falls back to ipify for the address alone if ip-api fails.
+    """
+    cached = _public_info_cache.get("ip-api")
+    if cached is not None:
+        return cached
+    try:
+        j = json.loads(_http_get(_IP_API_URL, timeout))
+        ip = j.get("query") or ""
+        isp = j.get("isp") or ""
+        parts = [p for p in (j.get("city"), j.get("regionName"), j.get("country")) if p]
+        location = ", ".join(parts)
+    except Exception:
+        ip = ""
+    if not ip:
+        return _get_public_ip(timeout), "", ""
+    _public_info_cache.put("ip-api", (ip, isp, location))
+    return ip, isp, location
 
 
 def _get_public_ip(timeout: float = 2.0) -> str:
     """Get public IPv4 address."""
+    cached = _public_ip_cache.get("ipify")
+    if cached is not None:
+        return cached
     try:
-        req = urllib.request.Request(
-            "https://api.ipify.org",
-            headers={"User-Agent": "NetScope/1.0"},
-        )
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return resp.read().decode().strip() or ""
+        ip = _http_get("https://api.ipify.org", timeout).strip()
     except Exception:
         return ""
+    if ip:
+        _public_ip_cache.put("ipify", ip)
+    return ip
 
 
-def _get_provider_and_location(public_ip: str, timeout: float = 2.0) -> tuple[str, str]:
-    """Get ISP/provider and location from public IP (e.g. ip-api.com). Returns (provider, location)."""
-    if not public_ip:
-        return "", ""
-    try:
-        url = f"http://ip-api.com/json/{public_ip}?fields=isp,country,city,regionName"
-        req = urllib.request.Request(url, headers={"User-Agent": "NetScope/1.0"})
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            data = resp.read().decode()
-    except Exception:
-        return "", ""
+_PROC_NET_ARP = Path("/proc/net/arp")
+
+
+@lru_cache(maxsize=1)
+def _has_ip_command() -> bool:
+    """True if the iproute2 `ip` binary is on PATH (looked up once per process)."""
+    return shutil.which("ip") is not None
+
+
+def _read_proc_arp(ip: str) -> str:
+    """MAC of `ip` from the kernel's ARP table on Linux, or "" if not listed."""
     try:
-        import json
-        j = json.loads(data)
-        isp = j.get("isp") or ""
-        parts = [p for p in (j.get("city"), j.get("regionName"), j.get("country")) if p]
-        location = ", ".join(parts) if parts else ""
-        return isp, location
-    except Exception:
-        return "", ""
+        with _PROC_NET_ARP.open() as f:
+            next(f, None)  # header
+            for line in f:
+                # IP address, HW type, Flags, HW address, Mask, Device
+                fields = line.split()
+                if len(fields) >= 4 and fields[0] == ip and fields[2] != "0x0":
+                    return fields[3]
+    except OSError:
+        pass
+    return ""
 
 
 def _parse_arp_for_mac(ip: str, os_type: str) -> str:
     """Get MAC address for an IP from ARP table."""
     if not ip:
         return ""
+    if os_type == "Linux":
+        mac = _read_proc_arp(ip)
+        if mac:
+            return mac
+    if os_type != "Windows" and _has_ip_command():
+        cmd = ["ip", "neigh", "show", ip]
+    else:
+        cmd = ["arp", "-a"]
+    # Look for line containing this IP and a MAC
+    for line in _command_output(cmd).splitlines():
+        if ip in line:
+            m = _MAC_RE.search(line)
+            if m:
+                return m.group(1)
+    return ""
+
+
+def _netifaces_default_route(local_ip: str) -> Optional[Tuple[str, str, str]]:
+    """
+    (gateway_ip, interface, dotted netmask) of the default IPv4 route, read
+    in-process through netifaces. None if netifaces is not installed or
+    there is no default route.
+    """
+    if netifaces is None:
+        return None
     try:
-        if os_type == "Windows":
-            out = subprocess.run(
-                ["arp", "-a"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-        else:
-            out = subprocess.run(
-                ["arp", "-a"] if not __import__("shutil").which("ip") else ["ip", "neigh", "show"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-        if out.returncode != 0:
-            return ""
-        # Look for line containing this IP and a MAC
-        mac_pattern = re.compile(r"([0-9a-fA-F]{2}[:-][0-9a-fA-F]{2}[:-][0-9a-fA-F]{2}[:-][0-9a-fA-F]{2}[:-][0-9a-fA-F]{2}[:-][0-9a-fA-F]{2})")
-        for line in (out.stdout or "").splitlines():
-            if ip in line:
-                m = mac_pattern.search(line)
-                if m:
-                    return m.group(1)
+        gateway_ip, iface = netifaces.gateways()["default"][netifaces.AF_INET][:2]
+        addrs = netifaces.ifaddresses(iface).get(netifaces.AF_INET) or []
+    except (KeyError, ValueError, OSError):
+        return None
+    # Prefer the address we route from when the interface has several
+    addr = next((a for a in addrs if a.get("addr") == local_ip), addrs[0] if addrs else {})
+    return gateway_ip, iface, addr.get("netmask", "")
+
+
+def _prefix_notation(netmask: str) -> str:
+    """"255.255.255.0" -> "/24"; "" for an empty or malformed netmask."""
+    try:
+        return f"/{ipaddress.IPv4Network(f'0.0.0.0/{netmask}').prefixlen}" if netmask else ""
+    except ValueError:
         return ""
+
+
+def _probe_linux(local_ip: str) -> NetworkInfo:
+    """Interface, netmask, gateway and DNS servers on Linux."""
+    info = NetworkInfo(local_ip=local_ip)
+    route = _netifaces_default_route(local_ip)
+    if route is not None:
+        info.gateway_ip, info.interface, netmask = route
+        info.netmask = _prefix_notation(netmask)
+    else:
+        _probe_linux_route(info)
+    # DNS: /etc/resolv.conf
+    try:
+        st = _RESOLV_CONF.stat()
+        info.dns_servers.extend(_parse_resolv_conf(str(_RESOLV_CONF), st.st_mtime_ns, st.st_size))
     except Exception:
+        pass
+    return info
+
+
+_RESOLV_CONF = Path("/etc/resolv.conf")
+
+
+@lru_cache(maxsize=4)
+def _parse_resolv_conf(path: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Nameservers listed in a resolv.conf; mtime_ns and size only key the cache."""
+    servers = []
+    # Parsed as bytes: only the ASCII addresses are ever decoded
+    for line in Path(path).read_bytes().splitlines():
+        parts = line.split()
+        if len(parts) >= 2 and parts[0] == b"nameserver":
+            servers.append(parts[1].decode("ascii", "ignore"))
+    return tuple(servers)
+
+
+def _linux_netmask(iface: str) -> str:
+    """Dotted IPv4 netmask of `iface` via the SIOCGIFNETMASK ioctl, or "" if unavailable."""
+    if fcntl is None:
+        return ""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            ifreq = fcntl.ioctl(s.fileno(), _SIOCGIFNETMASK, struct.pack("256s", iface.encode()[:15]))
+    except OSError:
         return ""
+    # struct ifreq: 16-byte name, then a sockaddr_in whose address sits at offset 4
+    return socket.inet_ntoa(ifreq[20:24])
+
+
+def _probe_linux_route(info: NetworkInfo) -> None:
+    """Gateway, interface and netmask from the `ip` command (no netifaces)."""
+    # Gateway: ip route | grep default
+    # default via 192.168.1.1 dev eth0 ...
+    m = _LINUX_DEFAULT_RE.search(_command_output(["ip", "route", "show", "default"]))
+    if m:
+        info.gateway_ip = m.group(1)
+        info.interface = m.group(2)
+    # Netmask straight from the kernel; ip addr show <iface> as a fallback
+    if info.interface:
+        info.netmask = _prefix_notation(_linux_netmask(info.interface))
+        if info.netmask:
+            return
+        # inet 192.168.1.10/24 ...
+        m = _INET_PREFIX_RE.search(_command_output(["ip", "addr", "show", info.interface]))
+        if m:
+            info.netmask = f"/{m.group(1)}"
+
+
+def _probe_darwin(local_ip: str) -> NetworkInfo:
+    """Interface, netmask, gateway and DNS servers on macOS."""
+    info = NetworkInfo(local_ip=local_ip)
+    route = _netifaces_default_route(local_ip)
+    # The commands are independent, so they run side by side
+    commands = {"dns": ["scutil", "--dns"]}
+    if route is None:
+        # netstat -nr for the default gateway, ifconfig for interface and netmask
+        commands["routes"] = ["netstat", "-nr"]
+        commands["ifconfig"] = ["ifconfig"]
+    outputs: Dict[str, str] = {}
+
+    def fetch(name: str, argv: list[str]) -> None:
+        outputs[name] = _command_output(argv)
+
+    # Daemon threads rather than a pool, whose workers are joined at exit:
+    # get_network_info may abandon this probe at its deadline
+    threads = [
+        threading.Thread(target=fetch, args=item, daemon=True) for item in commands.items()
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if route is not None:
+        info.gateway_ip, info.interface, info.netmask = route
+    else:
+        _parse_darwin_routes(outputs.get("routes", ""), outputs.get("ifconfig", ""), info)
+
+    # DNS: scutil --dns
+    for line in outputs.get("dns", "").splitlines():
+        if "nameserver" in line:
+            parts = line.split(":", 1)
+            if len(parts) == 2:
+                ns = parts[1].strip()
+                if ns:
+                    info.dns_servers.append(ns)
+    return info
+
+
+def _command_output(argv: list[str], timeout: float = 5, encoding: Optional[str] = None) -> str:
+    """
+    stdout of a command, or "" if it is missing, fails or times out.
+    Decoded with `encoding` (default: the locale's), undecodable bytes replaced.
+    """
+    try:
+        # stderr is discarded rather than piped: one pipe and reader fewer
+        with subprocess.Popen(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding=encoding,
+            errors="replace",
+        ) as proc:
+            try:
+                stdout, _ = proc.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.communicate()
+                return ""
+    except OSError:
+        return ""
+    return stdout if proc.returncode == 0 else ""
+
+
+def _parse_darwin_routes(netstat_out: str, ifconfig_out: str, info: NetworkInfo) -> None:
+    """Gateway from `netstat -nr`, interface and netmask from `ifconfig`."""
+    for line in netstat_out.splitlines():
+        if "default" in line:
+            parts = line.split()
+            if len(parts) >= 2:
+                info.gateway_ip = parts[1]
+                break
+    # Interface and netmask: the interface whose inet is our local IP
+    current_iface = None
+    for line in ifconfig_out.splitlines():
+        if not line.startswith("\t") and not line.startswith(" "):
+            current_iface = line.split(":")[0]
+        if "inet " in line and "127.0.0.1" not in line and current_iface:
+            m = _DARWIN_INET_RE.search(line)
+            if m and m.group(1) == info.local_ip:
+                info.interface = current_iface
+                # Convert hex netmask to dotted decimal
+                try:
+                    info.netmask = socket.inet_ntoa(struct.pack(">I", int(m.group(2), 16)))
+                except (ValueError, struct.error):
+                    pass
+                break
+
+
+def _probe_windows(local_ip: str) -> NetworkInfo:
+    """Interface, netmask, gateway and DNS servers on Windows."""
+    info = NetworkInfo(local_ip=local_ip)
+    # Windows: ipconfig. Decoded as ASCII: the fields we read are ASCII, and
+    # localized adapter names only turn into replacement characters
+    _parse_ipconfig(_command_output(["ipconfig", "/all"], timeout=10, encoding="ascii"), info)
+    return info
+
+
+def _parse_ipconfig(text: str, info: NetworkInfo) -> None:
+    """
+    Fill gateway, netmask, interface and DNS servers from `ipconfig /all`.
+
+    One pass over the lines groups "Key . . . : value" fields (plus their
+    continuation lines, e.g. secondary DNS servers) under the adapter
+    header above them. The adapter holding info.local_ip is then used;
+    without one, the first gateway and every DNS server listed are taken.
+    """
+    adapters: list[tuple[str, dict[str, list[str]]]] = []
+    fields: Optional[dict[str, list[str]]] = None
+    values: Optional[list[str]] = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if not line[0].isspace():
+            # Section header, e.g. "Ethernet adapter Ethernet:"
+            name = stripped.rstrip(":")
+            _, sep, adapter = name.partition(" adapter ")
+            fields = {}
+            adapters.append((adapter if sep else name, fields))
+            values = None
+        elif fields is not None:
+            # " : " rather than ":" so IPv6 values are not split; the
+            # appended space catches keys whose value is empty
+            key, sep, value = (stripped + " ").partition(" : ")
+            if sep:
+                values = fields.setdefault(key.rstrip(". "), [])
+                value = value.strip()
+            else:
+                value = stripped
+            if values is not None and value:
+                values.append(value)
+
+    def dns_of(fields: dict[str, list[str]]) -> list[str]:
+        # "DNS Servers", or "DNS Server" on some localized builds
+        return [v for k, vs in fields.items() if k.startswith("DNS Server") for v in vs]
+
+    ours = None
+    for name, fields in adapters:
+        addresses = (v.split("(")[0].strip() for vs in fields.values() for v in vs)
+        if info.local_ip and info.local_ip in addresses:
+            ours = (name, fields)
+            break
+    if ours is not None:
+        name, fields = ours
+        info.interface = name
+        info.netmask = (fields.get("Subnet Mask") or [""])[0]
+        gateways = fields.get("Default Gateway") or []
+        # The IPv4 gateway may follow an IPv6 link-local one
+        info.gateway_ip = next((g for g in gateways if ":" not in g), gateways[0] if gateways else "")
+        info.dns_servers.extend(dns_of(fields))
+    if not info.gateway_ip:
+        info.gateway_ip = next(
+            (g for _, fields in adapters for g in fields.get("Default Gateway", []) if ":" not in g),
+            "",
+        )
+    if not info.dns_servers:
+        for _, fields in adapters:
+            info.dns_servers.extend(dns_of(fields))
+
+
+def _probe_os(local_ip: str, os_type: str) -> NetworkInfo:
+    """Run the OS-specific probe; `local_ip` picks the interface on macOS/Windows."""
+    if os_type == "Linux":
+        info = _probe_linux(local_ip)
+    elif os_type == "Darwin":
+        info = _probe_darwin(local_ip)
+    else:
+        info = _probe_windows(local_ip)
+    # Resolvers are often listed more than once; keep the first occurrence
+    info.dns_servers = list(dict.fromkeys(info.dns_servers))
+    return info
 
 
 def get_network_info(timeout: float = 2.0) -> NetworkInfo:
     """
     Gather network information for the current host.
     Uses OS-appropriate commands (ip/ifconfig/netstat/ipconfig/scutil).
+
+    The public-IP lookups and the local probes run concurrently, so the call
+    takes about as long as the slower of the two rather than their sum. The
+    whole gather is capped at 3 * `timeout` seconds; fields whose probe has
+    not finished by then are left empty. Probes still running at the deadline
+    are abandoned on daemon threads and do not delay interpreter exit.
     """
-    info = NetworkInfo()
-    os_type = platform.system()
+    return asyncio.run(_get_network_info_async(timeout))
 
-    # Local and public IP
-    info.local_ip = _get_local_ip()
-    info.public_ip = _get_public_ip(timeout)
 
-    if os_type == "Linux":
-        # Gateway: ip route | grep default
+def _run_detached(loop: asyncio.AbstractEventLoop, func, *args) -> "asyncio.Future[Any]":
+    """
+    Run func(*args) on a daemon thread and return a future for its result.
+
+    Unlike asyncio.to_thread or a ThreadPoolExecutor, whose workers are joined
+    at exit, a call abandoned at the deadline never holds the process open.
+    """
+    future = loop.create_future()
+
+    def settle(method, value) -> None:
+        if not future.done():
+            method(value)
+
+    def target() -> None:
         try:
-            out = subprocess.run(
-                ["ip", "route", "show", "default"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if out.returncode == 0 and out.stdout:
-                # default via 192.168.1.1 dev eth0 ...
-                m = re.search(r"default\s+via\s+(\S+)\s+dev\s+(\S+)", out.stdout)
-                if m:
-                    info.gateway_ip = m.group(1)
-                    info.interface = m.group(2)
-            # Netmask from ip addr show <iface>
-            if info.interface:
-                out2 = subprocess.run(
-                    ["ip", "addr", "show", info.interface],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if out2.returncode == 0:
-                    # inet 192.168.1.10/24 ...
-                    m = re.search(r"inet\s+\S+/(\d+)", out2.stdout)
-                    if m:
-                        prefix = int(m.group(1))
-                        info.netmask = f"/{prefix}"
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
-        # DNS: /etc/resolv.conf
+            outcome = (future.set_result, func(*args))
+        except BaseException as e:
+            outcome = (future.set_exception, e)
         try:
-            resolv = Path("/etc/resolv.conf")
-            if resolv.exists():
-                for line in resolv.read_text().splitlines():
-                    line = line.strip()
-                    if line.startswith("nameserver"):
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            info.dns_servers.append(parts[1])
-        except Exception:
-            pass
+            loop.call_soon_threadsafe(settle, *outcome)
+        except RuntimeError:
+            pass  # the loop closed while this call was abandoned
 
-    elif os_type == "Darwin":
-        # macOS: netstat -nr | grep default, then ifconfig for netmask
-        try:
-            out = subprocess.run(
-                ["netstat", "-nr"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if out.returncode == 0:
-                for line in out.stdout.splitlines():
-                    if "default" in line:
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            info.gateway_ip = parts[1]
-                            break
-            # Interface and netmask from ifconfig (first en* with inet)
-            out2 = subprocess.run(
-                ["ifconfig"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if out2.returncode == 0:
-                current_iface = None
-                for line in out2.stdout.splitlines():
-                    if not line.startswith("\t") and not line.startswith(" "):
-                        current_iface = line.split(":")[0]
-                    if "inet " in line and "127.0.0.1" not in line and current_iface:
-                        m = re.search(r"inet\s+(\S+)\s+netmask\s+0x([0-9a-fA-F]+)", line)
-                        if m and m.group(1) == info.local_ip:
-                            info.interface = current_iface
-                            # Convert hex netmask to dotted decimal
-                            hex_mask = m.group(2)
-                            try:
-                                n = int(hex_mask, 16)
-                                parts = [
-                                    (n >> 24) & 0xFF,
-                                    (n >> 16) & 0xFF,
-                                    (n >> 8) & 0xFF,
-                                    n & 0xFF,
-                                ]
-                                info.netmask = ".".join(str(p) for p in parts)
-                            except ValueError:
-                                pass
-                            break
-            # DNS: scutil --dns
-            out3 = subprocess.run(
-                ["scutil", "--dns"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if out3.returncode == 0:
-                for line in out3.stdout.splitlines():
-                    if "nameserver" in line:
-                        parts = line.split(":", 1)
-                        if len(parts) == 2:
-                            ns = parts[1].strip()
-                            if ns and ns not in info.dns_servers:
-                                info.dns_servers.append(ns)
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+    threading.Thread(target=target, name="netscope-netinfo", daemon=True).start()
+    return future
 
-    else:
-        # Windows: ipconfig
-        try:
-            out = subprocess.run(
-                ["ipconfig", "/all"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if out.returncode != 0:
-                pass
-            else:
-                current = out.stdout
-                # Default gateway
-                gw_m = re.search(r"Default Gateway[.\s]*:\s*(\S+)", current, re.I)
-                if gw_m:
-                    info.gateway_ip = gw_m.group(1).strip()
-                # Subnet mask and interface (adapter) from the same block as our local IP
-                for block in re.split(r"\r?\n\r?\n", current):
-                    if info.local_ip and info.local_ip in block:
-                        mask_m = re.search(r"Subnet Mask[.\s]*:\s*(\S+)", block, re.I)
-                        if mask_m:
-                            info.netmask = mask_m.group(1).strip()
-                        iface_m = re.search(r"adapter\s+(.+?):", block, re.I)
-                        if iface_m:
-                            info.interface = iface_m.group(1).strip()
-                        break
-                # DNS
-                for m in re.finditer(r"DNS Servers[.\s]*:\s*(\S+)", current, re.I):
-                    info.dns_servers.append(m.group(1).strip())
-                if not info.dns_servers:
-                    for m in re.finditer(r"(\d+\.\d+\.\d+\.\d+)\s*\(Preferred\)", current):
-                        # Often DNS is listed after "DNS Servers" with (Preferred)
-                        pass
-                    for m in re.finditer(r"DNS Server[^s][.\s]*:\s*(\S+)", current, re.I):
-                        info.dns_servers.append(m.group(1).strip())
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
-
-    # Gateway MAC from ARP
-    if info.gateway_ip:
-        info.gateway_mac = _parse_arp_for_mac(info.gateway_ip, os_type)
-
-    # Provider and location from public IP
-    if info.public_ip:
-        info.provider, info.location = _get_provider_and_location(info.public_ip, timeout)
 
+async def _get_network_info_async(timeout: float) -> NetworkInfo:
+    info = NetworkInfo()
+    os_type = _OS_TYPE
+    loop = asyncio.get_running_loop()
+
+    def run(func, *args):
+        return _run_detached(loop, func, *args)
+
+    async def public_chain() -> None:
+        # Public IP, provider and location come back from one request
+        info.public_ip, info.provider, info.location = await run(_get_public_info, timeout)
+
+    async def local_chain() -> None:
+        # Local IP, then the OS probe that needs it, then the gateway's MAC
+        info.local_ip = await run(_get_local_ip)
+        probed = await run(_probe_os, info.local_ip, os_type)
+        info.interface = probed.interface
+        info.netmask = probed.netmask
+        info.gateway_ip = probed.gateway_ip
+        info.dns_servers = probed.dns_servers
+        if info.gateway_ip:
+            info.gateway_mac = await run(_parse_arp_for_mac, info.gateway_ip, os_type)
+
+    try:
+        await asyncio.wait_for(asyncio.gather(public_chain(), local_chain()), timeout * 3)
+    except asyncio.TimeoutError:
+        pass  # keep whatever finished within the budget
     return info
@@ -30,6 +30,7 @@ setup(
         "rich>=13.0.0",
         "questionary>=2.0.0",
         "pandas>=2.0.0",
+        "numpy>=1.24.0",
         "loguru>=0.7.0",
         "pydantic>=2.0.0",
         "pydantic-settings>=2.0.0",
@@ -48,10 +49,14 @@ setup(
         "security": [
             "cryptography>=41.0",
             "python-nmap>=0.7.1",
+            "dnspython>=2.4.0",
         ],
         "bandwidth": [
             "speedtest-cli>=2.1.3",
         ],
+        "parquet": [
+            "pyarrow>=14.0",
+        ],
         "advanced": [
             "scapy>=2.5.0",
             "netifaces>=0.11.0",
@@ -0,0 +1,103 @@
+"""Tests for CSVHandler."""
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from netscope.storage.csv_handler import CSVHandler
+
+
+def test_write_result_appends_row():
+    """write_result appends a single row under the header."""
+    with tempfile.TemporaryDirectory() as tmp:
+        handler = CSVHandler(Path(tmp) / "results.csv")
+        handler.write_result(datetime.now(), "Ping Test", "1.1.1.1", "avg_latency", 12.5, "success")
+        rows = handler.read_results()
+    assert len(rows) == 1
+    assert rows[0]["metric"] == "avg_latency"
+    assert rows[0]["value"] == "12.5"
+
+
+def test_write_results_batches_rows_in_order():
+    """write_results writes every (metric, value) pair with shared fields."""
+    with tempfile.TemporaryDirectory() as tmp:
+        handler = CSVHandler(Path(tmp) / "results.csv")
+        handler.write_results(
+            timestamp=datetime.now(),
+            test_name="DNS Lookup",
+            target="example.com",
+            metrics=[("ip_address_1", "93.184.216.34"), ("ip_count", 1)],
+            status="success",
+            details="resolved",
+        )
+        rows = handler.read_results()
+    assert [r["metric"] for r in rows] == ["ip_address_1", "ip_count"]
+    assert all(r["target"] == "example.com" and r["details"] == "resolved" for r in rows)
+
+
+def test_write_results_empty_is_noop():
+    """An empty batch does not touch the file beyond its header."""
+    with tempfile.TemporaryDirectory() as tmp:
+        handler = CSVHandler(Path(tmp) / "results.csv")
+        handler.write_results(datetime.now(), "Ping Test", "1.1.1.1", [], "failure")
+        assert handler.read_results() == []
+
+
+def test_write_rows_per_row_targets():
+    """write_rows keeps each row's own target and defaults details to empty."""
+    now = datetime.now()
+    with tempfile.TemporaryDirectory() as tmp:
+        handler = CSVHandler(Path(tmp) / "results.csv")
+        handler.write_rows(
+            {"timestamp": now, "test_name": "Ping Sweep", "target": host,
+             "metric": "alive", "value": "true", "status": "success"}
+            for host in ("10.0.0.1", "10.0.0.2")
+        )
+        rows = handler.read_results()
+    assert [r["target"] for r in rows] == ["10.0.0.1", "10.0.0.2"]
+    assert all(r["details"] == "" for r in rows)
+
+
+def test_enqueue_result_is_written_after_flush():
+    """Queued rows land in the file, in order, once flushed."""
+    from netscope.storage.csv_handler import flush_pending_writes
+
+    with tempfile.TemporaryDirectory() as tmp:
+        handler = CSVHandler(Path(tmp) / "results.csv")
+        for i in range(5):
+            handler.enqueue_result(datetime.now(), "Security Audit", "example.com", "score", i, "low")
+        flush_pending_writes()
+        rows = handler.read_results()
+    assert [row["value"] for row in rows] == ["0", "1", "2", "3", "4"]
+
+
+def test_handler_batches_rows_until_flush_or_close():
+    """Rows are held in memory until the batch fills, flush() or close()."""
+    import csv
+
+    def on_disk(path):
+        with path.open(newline="") as f:
+            return [r["metric"] for r in csv.DictReader(f)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "results.csv"
+        with CSVHandler(path) as handler:
+            handler.write_result(datetime.now(), "Ping Test", "1.1.1.1", "sent", 4, "success")
+            assert on_disk(path) == []
+            handler.flush()
+            assert on_disk(path) == ["sent"]
+            fh = handler._fh
+
+            handler._batch_size = 2
+            handler.write_result(datetime.now(), "Ping Test", "1.1.1.1", "received", 4, "success")
+            assert on_disk(path) == ["sent"]
+            handler.write_result(datetime.now(), "Ping Test", "1.1.1.1", "lost", 0, "success")
+            assert on_disk(path) == ["sent", "received", "lost"]
+            assert handler._fh is fh
+
+            handler.write_result(datetime.now(), "Ping Test", "1.1.1.1", "loss_pct", 0, "success")
+        assert handler._fh is None
+        assert on_disk(path)[-1] == "loss_pct"
+
+        handler.write_result(datetime.now(), "Ping Test", "1.1.1.1", "avg_latency", 1.5, "success")
+        handler.close()
+        assert len(on_disk(path)) == 5
@@ -0,0 +1,73 @@
+"""Tests for the TUI dashboard."""
+from rich.console import Console
+
+from netscope.tui.dashboard import NetworkDashboard
+
+
+def test_test_history_keeps_most_recent_first_and_is_bounded():
+    """New results go to the front and the oldest fall off past max_history."""
+    dashboard = NetworkDashboard(console=Console())
+    for i in range(15):
+        dashboard.add_test_result(f"test {i}", "success", 0.1)
+
+    assert len(dashboard.test_history) == dashboard.max_history
+    assert dashboard.test_history[0]["test_name"] == "test 14"
+    assert dashboard.test_history[-1]["test_name"] == "test 5"
+    dashboard.render_status()
+
+
+def test_device_table_sorts_ips_numerically():
+    """IPs sort by value, not text; unparseable addresses sort first."""
+    from netscope.tui.dashboard import DeviceTable
+
+    devices = [{"ip": "10.0.0.10"}, {"ip": "10.0.0.9"}, {"ip": "fe80::1"}, {"ip": "192.168.1.1"}]
+    DeviceTable(devices).render(sort_by="ip")
+    assert [d["ip"] for d in devices] == ["fe80::1", "10.0.0.9", "10.0.0.10", "192.168.1.1"]
+
+
+def test_color_bands_match_thresholds():
+    """Band edges belong to the worse band, as with the original < comparisons."""
+    dashboard = NetworkDashboard(console=Console())
+
+    assert [dashboard._get_latency_color(v) for v in (0, 19.9, 20, 50, 99.9, 100, 500)] == [
+        "green", "green", "yellow", "orange", "orange", "red", "red",
+    ]
+    assert [dashboard._get_packet_loss_color(v) for v in (0, 1, 4.9, 5)] == [
+        "green", "yellow", "yellow", "red",
+    ]
+    assert dashboard._get_status_icon("error") == "[red]✗[/red]"
+    assert dashboard._get_status_icon("failure") == "[dim]?[/dim]"
+
+
+def test_panels_are_reused_between_refreshes():
+    """The metrics panel is updated in place; the status panel is rebuilt only after a new result."""
+    from netscope.tui.dashboard import NetworkMetrics
+
+    console = Console(record=True, width=80)
+    dashboard = NetworkDashboard(console=console)
+
+    dashboard.update_metrics(NetworkMetrics(latency_ms=12.3, devices_discovered=4))
+    panel = dashboard.render_metrics()
+    dashboard.update_metrics(NetworkMetrics(latency_ms=45.6))
+    assert dashboard.render_metrics() is panel
+    console.print(panel)
+    assert "45.6 ms" in console.export_text()
+
+    status = dashboard.render_status()
+    assert dashboard.render_status() is status
+    dashboard.add_test_result("Ping Test", "success", 1.0)
+    assert dashboard.render_status() is not status
+
+
+def test_run_draws_once_per_render():
+    """Live does not redraw on a timer; the loop refreshes after each render."""
+    from unittest.mock import patch
+
+    console = Console(record=True, width=80)
+    dashboard = NetworkDashboard(console=console)
+    with patch("netscope.tui.dashboard.Live") as live_cls, \
+         patch.object(console, "input", side_effect=["r", "q"]):
+        dashboard.run()
+
+    assert live_cls.call_args.kwargs["auto_refresh"] is False
+    assert live_cls.return_value.__enter__.return_value.refresh.call_count == 2
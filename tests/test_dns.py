@@ -0,0 +1,43 @@
+"""Tests for DNS lookup parsing and summaries."""
+from netscope.modules.dns import DNSTest
+
+
+def test_resolved_summary_mixed_families():
+    """Summary lists both address families and at most three addresses."""
+    metrics = {
+        "ip_addresses": ["1.1.1.1", "1.0.0.1", "2606:4700::1111", "2606:4700::1001"],
+        "ipv4_count": 2,
+        "ipv6_count": 2,
+    }
+    summary = DNSTest._format_resolved_summary("one.one.one.one", metrics)
+    assert summary == (
+        "Resolved one.one.one.one to 4 address(es) (2 IPv4 + 2 IPv6): "
+        "1.1.1.1, 1.0.0.1, 2606:4700::1111"
+    )
+
+
+def test_resolved_summary_ipv4_only():
+    """Summary omits the IPv6 part when there are no AAAA records."""
+    metrics = {"ip_addresses": ["93.184.216.34"], "ipv4_count": 1, "ipv6_count": 0}
+    summary = DNSTest._format_resolved_summary("example.com", metrics)
+    assert summary == "Resolved example.com to 1 address(es) (1 IPv4): 93.184.216.34"
+
+
+def test_parse_output_windows_nslookup():
+    """nslookup output is parsed, keeping full IPv6 addresses after the label."""
+    output = (
+        "Server:  router.local\n"
+        "Address:  192.168.1.1\n"
+        "\n"
+        "Name:    example.com\n"
+        "Address:  2606:2800:220:1:248:1893:25c8:1946\n"
+    )
+    metrics = DNSTest(None, None).parse_output(output, "Windows")
+    assert metrics["ipv4_addresses"] == ["192.168.1.1"]
+    assert metrics["ipv6_addresses"] == ["2606:2800:220:1:248:1893:25c8:1946"]
+
+
+def test_parse_output_windows_no_addresses():
+    """Output without any Address line resolves nothing."""
+    metrics = DNSTest(None, None).parse_output("*** Request timed out\n", "Windows")
+    assert metrics["resolved"] is False
@@ -0,0 +1,160 @@
+"""Tests for the static HTML report."""
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from netscope.report.html_report import generate_html
+from netscope.storage.csv_handler import CSVHandler
+
+
+def _make_run(run_dir: Path) -> None:
+    (run_dir / "metadata.json").write_text(json.dumps({
+        "test_type": "Ping <Test>",
+        "target": "1.1.1.1",
+        "status": "success",
+        "timestamp": "2024-01-01T00:00:00",
+        "system_info": {"os": "Linux"},
+    }))
+    now = datetime.now()
+    with CSVHandler(run_dir / "results.csv") as handler:
+        handler.write_result(now, "Ping Test", "1.1.1.1", "avg_latency", 12.5, "success")
+        handler.write_result(now, "DNS Lookup", "1.1.1.1", "ip_count", 1, "warning")
+
+
+def test_generate_html_renders_run():
+    """The page carries escaped metadata, one card per test and the chart data."""
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp)
+        _make_run(run_dir)
+        html = generate_html(run_dir)
+
+    assert html.startswith("<!doctype html>")
+    assert "<title>NetScope Report - Ping &lt;Test&gt;</title>" in html
+    assert '<span class="badge badge-success">SUCCESS</span>' in html
+    assert "<td>Avg Latency</td><td>12.5</td>" in html
+    assert "DNS Lookup" in html
+    assert "data: [1, 1, 0]," in html
+    assert html.count('id="statusChart"') == 1
+    assert "body { font-family" in html
+
+
+def test_escape_handles_all_special_characters():
+    """Every HTML-special character is escaped, and & is not double-escaped."""
+    from netscope.report.html_report import _escape
+
+    assert _escape("<a href=\"x\">Tom & Jerry's</a>") == (
+        "&lt;a href=&quot;x&quot;&gt;Tom &amp; Jerry&#39;s&lt;/a&gt;"
+    )
+    assert _escape(12.5) == "12.5"
+
+
+def test_load_run_data_reads_rows_as_strings():
+    """Rows come back as a str DataFrame; a missing CSV gives an empty frame."""
+    from netscope.report.html_report import load_run_data
+
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp)
+        assert load_run_data(run_dir)["rows"].empty
+        assert "No metrics were recorded" in generate_html(run_dir)
+
+        _make_run(run_dir)
+        rows = load_run_data(run_dir)["rows"]
+
+    assert list(rows["test_name"]) == ["Ping Test", "DNS Lookup"]
+    assert list(rows["value"]) == ["12.5", "1"]
+
+
+def test_load_run_data_falls_back_to_csv_when_parquet_unreadable():
+    """An unreadable results.parquet (or no Parquet engine) falls back to the CSV."""
+    from netscope.report.html_report import load_run_data
+
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp)
+        _make_run(run_dir)
+        (run_dir / "results.parquet").write_bytes(b"not parquet")
+        rows = load_run_data(run_dir)["rows"]
+
+    assert list(rows["metric"]) == ["avg_latency", "ip_count"]
+
+
+def test_load_run_data_prefers_parquet_export():
+    """A Parquet export written by CSVHandler.to_parquet is read back as str rows."""
+    pytest.importorskip("pyarrow")
+    from netscope.report.html_report import load_run_data
+
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp)
+        _make_run(run_dir)
+        out = CSVHandler(run_dir / "results.csv").to_parquet()
+        assert out == run_dir / "results.parquet"
+        (run_dir / "results.csv").write_text("garbage\n")
+        os.utime(out)
+        rows = load_run_data(run_dir)["rows"]
+
+    assert list(rows["value"]) == ["12.5", "1"]
+
+
+def test_load_run_data_is_cached_until_files_change():
+    """A second load of an unchanged run reuses the parse; rewriting the CSV invalidates it."""
+    from netscope.report.html_report import load_run_data
+
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp)
+        _make_run(run_dir)
+        first = load_run_data(run_dir)
+        assert load_run_data(run_dir / ".")["rows"] is first["rows"]
+
+        with CSVHandler(run_dir / "results.csv") as handler:
+            handler.write_result(datetime.now(), "Ping Test", "1.1.1.1", "sent", 4, "success")
+        assert len(load_run_data(run_dir)["rows"]) == 3
+
+
+def test_generate_html_report_streams_same_page_to_file():
+    """The file written by generate_html_report matches generate_html's string."""
+    from netscope.report.html_report import generate_html_report
+
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp)
+        _make_run(run_dir)
+        out = generate_html_report(run_dir)
+        assert out == run_dir.resolve() / "report.html"
+        assert out.read_text(encoding="utf-8") == generate_html(run_dir)
+
+
+def test_load_run_summary_keeps_last_value_in_first_seen_order():
+    """Repeated metrics keep their first position but report the last value."""
+    from netscope.report.html_report import load_run_summary
+
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp)
+        _make_run(run_dir)
+        with CSVHandler(run_dir / "results.csv") as handler:
+            now = datetime.now()
+            handler.write_result(now, "Ping Test", "1.1.1.1", "sent", 4, "success")
+            handler.write_result(now, "Ping Test", "1.1.1.1", "avg_latency", 14.0, "success")
+            handler.write_result(now, "Traceroute", "1.1.1.1", "", "", "failure")
+        summary = load_run_summary(run_dir)
+
+    assert list(summary) == ["Ping Test", "DNS Lookup", "Traceroute"]
+    assert summary["Ping Test"] == {"avg_latency": "14.0", "sent": "4"}
+    assert list(summary["Ping Test"]) == ["avg_latency", "sent"]
+    assert summary["Traceroute"] == {}
+
+
+def test_generate_html_report_compress_writes_gzip():
+    """compress=True writes report.html.gz holding the same page."""
+    import gzip
+
+    from netscope.report.html_report import generate_html_report
+
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp)
+        _make_run(run_dir)
+        out = generate_html_report(run_dir, compress=True)
+        assert out == run_dir.resolve() / "report.html.gz"
+        with gzip.open(out, "rt", encoding="utf-8") as f:
+            assert f.read() == generate_html(run_dir)
@@ -0,0 +1,29 @@
+"""Tests for logging setup."""
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+from loguru import logger
+
+from netscope.storage.csv_handler import CSVHandler
+from netscope.storage.logger import log, setup_logging
+
+
+def test_stdlib_records_reach_loguru_file_sink():
+    """Records from the stdlib "netscope" logger land in netscope.log with their caller."""
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            setup_logging(Path(tmp))
+            CSVHandler(Path(tmp) / "results.csv")
+            logger.remove()
+            text = (Path(tmp) / "netscope.log").read_text()
+    finally:
+        log.handlers.clear()
+        log.setLevel(logging.NOTSET)
+        log.propagate = True
+        logger.remove()
+        logger.add(sys.stderr)
+
+    line = next(line for line in text.splitlines() if "Created CSV file" in line)
+    assert "netscope.storage.csv_handler:_create_csv:" in line
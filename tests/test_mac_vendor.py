@@ -0,0 +1,64 @@
+"""Tests for the MAC vendor lookup."""
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from netscope.utils.mac_vendor import (
+    get_device_info,
+    import_oui_database,
+    lookup_vendor,
+    normalize_mac,
+)
+
+
+def test_lookup_vendor_accepts_common_mac_formats():
+    """Colon, dash, dotted and bare forms of the same MAC resolve to one vendor."""
+    for mac in ("00:50:56:c0:00:08", "00-50-56-C0-00-08", "0050.56c0.0008", "005056C00008"):
+        assert lookup_vendor(mac) == "VMware Inc."
+    assert lookup_vendor("FF:FF:FF:00:00:00") is None
+    assert lookup_vendor("ZZ:50:56:C0:00:08") is None
+    assert lookup_vendor("not a mac") is None
+    # int(..., 16) would accept these; they are still not hex MACs
+    for mac in ("0x:50:56:aa:bb:cc", "+0:50:56:aa:bb:cc", "0_:50:56:aa:bb:cc"):
+        assert lookup_vendor(mac) is None
+        assert get_device_info(mac)["device_type"] != "Virtual Machine"
+
+
+def test_normalize_mac_and_device_info():
+    """MACs are upper-cased with colons; invalid input is returned as-is."""
+    assert normalize_mac("00-1b-63-aa-bb-cc") == "00:1B:63:AA:BB:CC"
+    assert normalize_mac("bogus") == "bogus"
+    assert normalize_mac("00:1b:63:aa:bb:cc") == "00:1B:63:AA:BB:CC"
+    assert normalize_mac("00:1B:63:AA:BB:CC\n") == "00:1B:63:AA:BB:CC"
+
+    info = get_device_info("00-1b-63-aa-bb-cc", ip="10.0.0.2", hostname="my-macbook")
+    assert info["mac"] == "00:1B:63:AA:BB:CC"
+    assert info["oui"] == "00:1B:63"
+    assert info["vendor"] == "Apple Inc."
+    assert info["device_type"] == "Computer"
+
+
+def test_import_oui_database_is_cached_until_file_changes():
+    """Re-importing an unchanged file reuses the parse; callers get their own dict."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "oui.json"
+        path.write_text(json.dumps({"AA:BB:CC": "Acme"}))
+        first = import_oui_database(path)
+        first["DD:EE:FF"] = "Mutated"
+        assert import_oui_database(path) == {"AA:BB:CC": "Acme"}
+
+        path.write_text(json.dumps({"AA:BB:CC": "Acme Corp"}))
+        os.utime(path, ns=(0, 0))
+        assert import_oui_database(path) == {"AA:BB:CC": "Acme Corp"}
+
+
+def test_guess_device_type_prefers_earlier_rules():
+    """The first matching vendor rule wins, whatever its position in the name."""
+    from netscope.utils.mac_vendor import _guess_device_type
+
+    assert _guess_device_type("Intel Apple Ltd", "") == "Computer/Device"
+    assert _guess_device_type("ASUSTek Computer", "home-router") == "Router"
+    assert _guess_device_type("ASUSTek Computer", "") == "Router/AP"
+    assert _guess_device_type("Acme Widgets", "") == "Unknown"
+    assert _guess_device_type(None, "router") == "Unknown"
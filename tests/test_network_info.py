@@ -0,0 +1,310 @@
+"""Tests for host network information gathering."""
+import socket
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from netscope.utils import network_info
+from netscope.utils.network_info import NetworkInfo, get_network_info
+
+
+def _slow(value, delay=0.3):
+    def probe(*args):
+        time.sleep(delay)
+        return value
+    return probe
+
+
+def test_get_network_info_runs_public_and_local_probes_concurrently():
+    """The public-IP chain and the local probe chain overlap instead of adding up."""
+    probed = NetworkInfo(interface="eth0", netmask="/24", gateway_ip="10.0.0.1", dns_servers=["10.0.0.1"])
+    with patch.object(network_info, "_get_local_ip", return_value="10.0.0.2"), \
+            patch.object(network_info, "_probe_os", side_effect=_slow(probed)), \
+            patch.object(network_info, "_parse_arp_for_mac", return_value="AA:BB:CC:DD:EE:FF"), \
+            patch.object(network_info, "_get_public_info", side_effect=_slow(("203.0.113.7", "ISP", "Town"))):
+        start = time.monotonic()
+        info = get_network_info(timeout=1.0)
+        elapsed = time.monotonic() - start
+
+    assert elapsed < 0.9
+    assert (info.local_ip, info.interface, info.netmask) == ("10.0.0.2", "eth0", "/24")
+    assert (info.gateway_ip, info.gateway_mac) == ("10.0.0.1", "AA:BB:CC:DD:EE:FF")
+    assert (info.public_ip, info.provider, info.location) == ("203.0.113.7", "ISP", "Town")
+
+
+def test_get_network_info_returns_partial_result_at_overall_deadline():
+    """A stuck probe is abandoned after 3 * timeout; finished fields are still returned."""
+    with patch.object(network_info, "_get_local_ip", return_value="10.0.0.2"), \
+            patch.object(network_info, "_probe_os", side_effect=_slow(NetworkInfo(interface="eth0"), delay=2.0)), \
+            patch.object(network_info, "_get_public_info", return_value=("203.0.113.7", "ISP", "Town")):
+        start = time.monotonic()
+        info = get_network_info(timeout=0.2)
+        elapsed = time.monotonic() - start
+
+    assert elapsed < 1.5
+    assert (info.local_ip, info.public_ip) == ("10.0.0.2", "203.0.113.7")
+    assert info.interface == ""
+
+
+def test_local_ip_prefers_hostname_address_over_udp_probe():
+    """A routable hostname address needs no socket; loopback falls through to the UDP trick."""
+    def addrinfo(*ips):
+        return [(socket.AF_INET, socket.SOCK_DGRAM, 17, "", (ip, 0)) for ip in ips]
+
+    with patch.object(network_info.socket, "getaddrinfo", return_value=addrinfo("127.0.1.1", "10.0.0.2")), \
+            patch.object(network_info.socket, "socket") as m_socket:
+        assert network_info._get_local_ip() == "10.0.0.2"
+        assert not m_socket.called
+
+    with patch.object(network_info.socket, "getaddrinfo", return_value=addrinfo("127.0.1.1")), \
+            patch.object(network_info.socket, "socket") as m_socket:
+        udp = m_socket.return_value.__enter__.return_value
+        udp.getsockname.return_value = ("192.168.1.10", 40000)
+        assert network_info._get_local_ip() == "192.168.1.10"
+        udp.settimeout.assert_called_once_with(0.1)
+
+
+def test_abandoned_probe_does_not_delay_interpreter_exit():
+    """A probe still stuck at the deadline must not keep the process alive."""
+    script = (
+        "import time\n"
+        "from unittest.mock import patch\n"
+        "from netscope.utils import network_info\n"
+        "def stuck(*args):\n"
+        "    time.sleep(4)\n"
+        "with patch.object(network_info, '_get_local_ip', return_value='10.0.0.2'), \\\n"
+        "        patch.object(network_info, '_probe_os', side_effect=stuck), \\\n"
+        "        patch.object(network_info, '_get_public_info', return_value=('', '', '')):\n"
+        "    network_info.get_network_info(timeout=0.2)\n"
+    )
+    start = time.monotonic()
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=10)
+    assert time.monotonic() - start < 3
+
+
+def test_http_get_reuses_keep_alive_connection():
+    """Back-to-back lookups against one host share a single TCP connection."""
+    peers = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            peers.add(self.client_address)
+            body = self.path.encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        assert network_info._http_get(f"{base}/a?x=1", 1.0) == "/a?x=1"
+        assert network_info._http_get(f"{base}/b", 1.0) == "/b"
+    finally:
+        network_info._close_idle_connections()
+        server.shutdown()
+        server.server_close()
+
+    assert len(peers) == 1
+
+
+def test_public_info_is_one_cached_request_with_ipify_fallback():
+    """ip-api answers IP, ISP and location at once; ipify only covers an ip-api outage."""
+    network_info.clear_cache()
+    responses = {
+        network_info._IP_API_URL: '{"query": "203.0.113.7", "isp": "ISP", "city": "Town", "country": "Land"}',
+        "https://api.ipify.org": "203.0.113.7\n",
+    }
+    with patch.object(network_info, "_http_get", side_effect=lambda url, t: responses[url]) as m_get:
+        for _ in range(3):
+            assert network_info._get_public_info() == ("203.0.113.7", "ISP", "Town, Land")
+        assert m_get.call_count == 1
+
+        network_info.clear_cache()
+        m_get.side_effect = lambda url, t: responses[url] if "ipify" in url else "<html>rate limited</html>"
+        assert network_info._get_public_info() == ("203.0.113.7", "", "")
+
+        network_info.clear_cache()
+        m_get.side_effect = OSError
+        assert network_info._get_public_info() == ("", "", "")
+    network_info.clear_cache()
+
+
+def test_linux_probe_reads_route_from_netifaces_without_subprocess():
+    """With netifaces installed, the default route and netmask need no `ip` calls."""
+    from types import SimpleNamespace
+
+    fake = SimpleNamespace(
+        AF_INET=2,
+        gateways=lambda: {"default": {2: ("10.0.0.1", "wlan0")}},
+        ifaddresses=lambda iface: {2: [
+            {"addr": "10.0.0.99", "netmask": "255.255.0.0"},
+            {"addr": "10.0.0.2", "netmask": "255.255.255.0"},
+        ]},
+    )
+    with patch.object(network_info, "netifaces", fake), \
+            patch.object(network_info, "_command_output") as m_run:
+        info = network_info._probe_linux("10.0.0.2")
+
+    assert not m_run.called
+    assert (info.gateway_ip, info.interface, info.netmask) == ("10.0.0.1", "wlan0", "/24")
+
+
+def test_arp_lookup_reads_proc_net_arp_on_linux(tmp_path):
+    """Linux MACs come from /proc/net/arp; incomplete entries fall through to `ip neigh`."""
+    arp = tmp_path / "arp"
+    arp.write_text(
+        "IP address       HW type     Flags       HW address            Mask     Device\n"
+        "10.0.0.10        0x1         0x2         aa:aa:aa:aa:aa:aa     *        eth0\n"
+        "10.0.0.1         0x1         0x2         02:fc:00:00:00:05     *        eth0\n"
+        "10.0.0.3         0x1         0x0         00:00:00:00:00:00     *        eth0\n"
+    )
+    with patch.object(network_info, "_PROC_NET_ARP", arp), \
+            patch.object(network_info, "_command_output") as m_run:
+        assert network_info._parse_arp_for_mac("10.0.0.1", "Linux") == "02:fc:00:00:00:05"
+        assert not m_run.called
+
+        m_run.return_value = "10.0.0.3 dev eth0 lladdr 02:00:00:00:00:03 STALE\n"
+        with patch.object(network_info, "_has_ip_command", return_value=True):
+            assert network_info._parse_arp_for_mac("10.0.0.3", "Linux") == "02:00:00:00:00:03"
+        assert m_run.call_args[0][0] == ["ip", "neigh", "show", "10.0.0.3"]
+
+
+IPCONFIG_ALL = """
+Windows IP Configuration
+
+   Host Name . . . . . . . . . . . . : DESKTOP
+   Primary Dns Suffix  . . . . . . . :
+
+Ethernet adapter vEthernet (WSL):
+
+   IPv4 Address. . . . . . . . . . . : 172.20.0.1(Preferred)
+   Subnet Mask . . . . . . . . . . . : 255.255.240.0
+   Default Gateway . . . . . . . . . :
+   DNS Servers . . . . . . . . . . . : fec0:0:0:ffff::1%1
+
+Wireless LAN adapter Wi-Fi:
+
+   Description . . . . . . . . . . . : Intel(R) Wi-Fi 6 AX201 160MHz
+   IPv4 Address. . . . . . . . . . . : 192.168.1.10(Preferred)
+   Subnet Mask . . . . . . . . . . . : 255.255.255.0
+   Default Gateway . . . . . . . . . : fe80::1%12
+                                       192.168.1.1
+   DNS Servers . . . . . . . . . . . : 192.168.1.1
+                                       8.8.8.8
+   NetBIOS over Tcpip. . . . . . . . : Enabled
+"""
+
+
+def test_parse_ipconfig_uses_the_adapter_holding_the_local_ip():
+    """Fields come from our adapter, including multi-line gateway and DNS entries."""
+    info = NetworkInfo(local_ip="192.168.1.10")
+    network_info._parse_ipconfig(IPCONFIG_ALL, info)
+    assert info.interface == "Wi-Fi"
+    assert info.netmask == "255.255.255.0"
+    assert info.gateway_ip == "192.168.1.1"
+    assert info.dns_servers == ["192.168.1.1", "8.8.8.8"]
+
+    info = NetworkInfo(local_ip="10.9.9.9")
+    network_info._parse_ipconfig(IPCONFIG_ALL, info)
+    assert (info.interface, info.netmask, info.gateway_ip) == ("", "", "192.168.1.1")
+    assert info.dns_servers == ["fec0:0:0:ffff::1%1", "192.168.1.1", "8.8.8.8"]
+
+    info = NetworkInfo(local_ip="172.20.0.1")
+    network_info._parse_ipconfig(IPCONFIG_ALL, info)
+    assert (info.interface, info.netmask) == ("vEthernet (WSL)", "255.255.240.0")
+    assert info.gateway_ip == "192.168.1.1"
+
+
+
+def test_windows_probe_reads_ipconfig_as_ascii():
+    """ipconfig output is decoded as ASCII, so an OEM code page cannot break the parse."""
+    with patch.object(network_info, "_command_output", return_value=IPCONFIG_ALL) as m_run:
+        info = network_info._probe_windows("192.168.1.10")
+    m_run.assert_called_once_with(["ipconfig", "/all"], timeout=10, encoding="ascii")
+    assert (info.interface, info.gateway_ip) == ("Wi-Fi", "192.168.1.1")
+
+
+def test_command_output_returns_stdout_only_on_success():
+    """stderr is dropped; failures, missing binaries and timeouts all give ""."""
+    script = "import sys; sys.stderr.write('noise'); sys.stdout.buffer.write(b'R\\xe9seau')"
+    assert network_info._command_output([sys.executable, "-c", script], encoding="ascii") == "R\ufffdseau"
+    assert network_info._command_output([sys.executable, "-c", "raise SystemExit(1)"]) == ""
+    assert network_info._command_output(["netscope-no-such-command"]) == ""
+    start = time.monotonic()
+    assert network_info._command_output([sys.executable, "-c", "import time; time.sleep(5)"], timeout=0.3) == ""
+    assert time.monotonic() - start < 3
+
+
+def test_darwin_probe_runs_commands_side_by_side():
+    """netstat, ifconfig and scutil run concurrently and are parsed as before."""
+    outputs = {
+        "netstat": "Internet:\nDestination  Gateway  Flags\ndefault  192.168.1.1  UGScg  en0\n",
+        "ifconfig": (
+            "lo0: flags=8049<UP,LOOPBACK>\n\tinet 127.0.0.1 netmask 0xff000000\n"
+            "en0: flags=8863<UP,BROADCAST>\n\tinet 192.168.1.10 netmask 0xffffff00 broadcast 192.168.1.255\n"
+        ),
+        "scutil": "resolver #1\n  nameserver[0] : 192.168.1.1\n  nameserver[1] : 1.1.1.1\n"
+                  "resolver #2\n  nameserver[0] : 192.168.1.1\n",
+    }
+
+    def command_output(argv, timeout=5):
+        time.sleep(0.2)
+        return outputs[argv[0]]
+
+    with patch.object(network_info, "netifaces", None), \
+            patch.object(network_info, "_command_output", side_effect=command_output):
+        start = time.monotonic()
+        info = network_info._probe_os("192.168.1.10", "Darwin")
+        elapsed = time.monotonic() - start
+
+    assert elapsed < 0.5
+    assert (info.gateway_ip, info.interface, info.netmask) == ("192.168.1.1", "en0", "255.255.255.0")
+    assert info.dns_servers == ["192.168.1.1", "1.1.1.1"]
+
+
+def test_parse_resolv_conf_lists_nameservers(tmp_path):
+    """Only `nameserver` lines count; comments and other options are skipped."""
+    resolv = tmp_path / "resolv.conf"
+    resolv.write_bytes(
+        b"# r\xc3\xa9solveur\nsearch lan\n  nameserver 10.0.0.1\nnameserver\t1.1.1.1 # x\n"
+        b"nameservers 9.9.9.9\noptions edns0\n"
+    )
+    st = resolv.stat()
+    assert network_info._parse_resolv_conf(str(resolv), st.st_mtime_ns, st.st_size) == ("10.0.0.1", "1.1.1.1")
+
+
+@pytest.mark.skipif(network_info.fcntl is None or not sys.platform.startswith("linux"), reason="Linux ioctl")
+def test_linux_netmask_reads_loopback_via_ioctl():
+    assert network_info._linux_netmask("lo") == "255.0.0.0"
+    assert network_info._linux_netmask("no-such-if0") == ""
+
+
+def test_linux_route_probe_skips_ip_addr_when_ioctl_answers():
+    """Once the default route is known, the netmask comes from the kernel, not `ip addr show`."""
+    route = "default via 10.0.0.1 dev eth0 proto dhcp\n"
+    info = NetworkInfo()
+    with patch.object(network_info, "_command_output", return_value=route) as m_run, \
+            patch.object(network_info, "_linux_netmask", return_value="255.255.252.0"):
+        network_info._probe_linux_route(info)
+    assert (info.gateway_ip, info.interface, info.netmask) == ("10.0.0.1", "eth0", "/22")
+    assert m_run.call_count == 1
+
+
+def test_probe_os_drops_duplicate_dns_servers():
+    """Every OS gets the same order-preserving dedupe, not just macOS."""
+    probed = NetworkInfo(dns_servers=["10.0.0.1", "1.1.1.1", "10.0.0.1", "1.1.1.1", "8.8.8.8"])
+    with patch.object(network_info, "_probe_linux", return_value=probed):
+        info = network_info._probe_os("10.0.0.2", "Linux")
+    assert info.dns_servers == ["10.0.0.1", "1.1.1.1", "8.8.8.8"]
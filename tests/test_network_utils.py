@@ -0,0 +1,24 @@
+"""Tests for the network utility helpers."""
+from netscope.utils.network import is_valid_hostname, is_valid_ip
+
+
+def test_is_valid_ip_accepts_dotted_quads_and_ipv6():
+    """Only full dotted-quad IPv4 or IPv6 addresses are accepted."""
+    assert is_valid_ip("192.168.1.1")
+    assert is_valid_ip("0.0.0.0")
+    assert is_valid_ip("fe80::1")
+    assert not is_valid_ip("127.1")
+    assert not is_valid_ip("256.1.1.1")
+    assert not is_valid_ip("1.2.3.")
+    assert not is_valid_ip("1.2.3.4 ")
+    assert not is_valid_ip("1.2.3.²")
+    assert not is_valid_ip("example.com")
+    assert not is_valid_ip("fe80::zz")
+
+
+def test_is_valid_hostname_checks_each_label():
+    """Labels may hold inner hyphens; a trailing dot is allowed."""
+    assert is_valid_hostname("example.com.")
+    assert is_valid_hostname("my-host.local")
+    assert not is_valid_hostname("-bad.example.com")
+    assert not is_valid_hostname("a" * 64 + ".com")
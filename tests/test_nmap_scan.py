@@ -0,0 +1,74 @@
+"""Tests for nmap XML parsing."""
+from netscope.modules.nmap_scan import parse_nmap_xml
+
+
+SAMPLE_XML = """<?xml version="1.0"?>
+<nmaprun>
+  <host>
+    <ports>
+      <port protocol="tcp" portid="443">
+        <state state="open"/>
+        <service name="https" product="nginx" version="1.25"/>
+      </port>
+      <port protocol="tcp" portid="22">
+        <state state="open"/>
+        <service name="ssh"/>
+      </port>
+      <port protocol="tcp" portid="25">
+        <state state="filtered"/>
+      </port>
+    </ports>
+  </host>
+  <host>
+    <ports>
+      <port protocol="tcp" portid="80">
+        <state state="closed"/>
+        <service name="http"/>
+      </port>
+    </ports>
+  </host>
+  <runstats>
+    <hosts up="2" down="1" total="3"/>
+  </runstats>
+</nmaprun>
+"""
+
+
+def test_parse_nmap_xml_counts_and_ports():
+    """Ports from every host are classified by state and sorted."""
+    metrics = parse_nmap_xml(SAMPLE_XML)
+    assert metrics["hosts_up"] == 2
+    assert metrics["hosts_down"] == 1
+    assert metrics["open_ports"] == [22, 443]
+    assert metrics["closed_ports"] == [80]
+    assert metrics["filtered_ports"] == [25]
+    assert metrics["open_count"] == 2
+
+
+def test_parse_nmap_xml_services():
+    """Service name, product and version are extracted; missing ones are empty."""
+    services = {s["port"]: s for s in parse_nmap_xml(SAMPLE_XML)["services"]}
+    assert services[443]["product"] == "nginx"
+    assert services[443]["version"] == "1.25"
+    assert services[22]["product"] == ""
+    assert services[25]["service"] == ""
+
+
+def test_parse_nmap_xml_invalid():
+    """Empty or malformed XML yields empty metrics rather than raising."""
+    assert parse_nmap_xml("")["open_ports"] == []
+    assert parse_nmap_xml("<nmaprun>")["hosts_up"] == 0
+
+
+def test_parse_nmap_xml_no_open_ports_skips_services():
+    """Without open ports, states are still counted but service details are skipped."""
+    xml = SAMPLE_XML.replace('state="open"', 'state="closed"')
+    metrics = parse_nmap_xml(xml)
+    assert metrics["open_ports"] == []
+    assert metrics["closed_ports"] == [22, 80, 443]
+    assert all(s["service"] == "" for s in metrics["services"])
+
+
+def test_parse_nmap_xml_accepts_bytes():
+    """Raw process output (bytes) parses the same as decoded text."""
+    assert parse_nmap_xml(SAMPLE_XML.encode()) == parse_nmap_xml(SAMPLE_XML)
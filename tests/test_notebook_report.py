@@ -0,0 +1,26 @@
+"""Tests for the Jupyter notebook report."""
+import json
+import tempfile
+from pathlib import Path
+
+from netscope.report.notebook_report import generate_notebook_report
+
+
+def test_notebook_report_escapes_run_fields():
+    """Metadata and the run path are embedded verbatim, whatever characters they hold."""
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp) / 'run "$1"'
+        run_dir.mkdir()
+        (run_dir / "metadata.json").write_text(json.dumps({
+            "test_type": 'Ping "quoted" \\ ${x}',
+            "target": "1.1.1.1",
+        }))
+        out = generate_notebook_report(run_dir)
+        nb = json.loads(out.read_text(encoding="utf-8"))
+
+    assert nb["nbformat"] == 4
+    assert len(nb["cells"]) == 6
+    title = nb["cells"][0]["source"][0]
+    assert title.startswith('# NetScope Report – Ping "quoted" \\ ${x}\n')
+    assert "- **Status**: `—`" in title
+    assert f"run_dir = Path({json.dumps(str(run_dir.resolve()))})" in nb["cells"][1]["source"][0]
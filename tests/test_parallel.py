@@ -41,12 +41,24 @@ class TestParallelTestConfig:
     def test_default_config(self):
         """Test default configuration values."""
         config = ParallelTestConfig()
-        assert config.max_workers == 10
+        assert 10 <= config.max_workers <= 64
         assert config.timeout == 30
         assert config.rate_limit is None
         assert config.retry_failed is False
         assert config.retry_count == 3
 
+    def test_default_max_workers_scales_with_cpus(self, monkeypatch):
+        """I/O-bound default: 5 threads per CPU, capped; NETSCOPE_MAX_WORKERS overrides."""
+        monkeypatch.delenv("NETSCOPE_MAX_WORKERS", raising=False)
+        with patch("netscope.parallel.executor.os.cpu_count", return_value=4):
+            assert ParallelTestConfig().max_workers == 20
+        with patch("netscope.parallel.executor.os.cpu_count", return_value=64):
+            assert ParallelTestConfig().max_workers == 64
+        monkeypatch.setenv("NETSCOPE_MAX_WORKERS", "7")
+        assert ParallelTestConfig().max_workers == 7
+        monkeypatch.setenv("NETSCOPE_MAX_WORKERS", "lots")
+        assert ParallelTestConfig().max_workers >= 10
+
     def test_custom_config(self):
         """Test custom configuration values."""
         config = ParallelTestConfig(
@@ -65,7 +77,7 @@ class TestParallelTestExecutor:
     def test_init_default_config(self):
         """Test executor initialization with default config."""
         executor = ParallelTestExecutor()
-        assert executor.config.max_workers == 10
+        assert executor.config.max_workers == ParallelTestConfig().max_workers
         assert executor.results == []
 
     def test_init_custom_config(self, parallel_config):
@@ -93,8 +105,7 @@ class TestParallelTestExecutor:
 
         assert len(results) == 2
         assert all(r.status == "success" for r in results)
-        assert results[0].target in targets
-        assert results[1].target in targets
+        assert [r.target for r in results] == targets
 
     def test_execute_parallel_with_progress_callback(self, parallel_config, mock_test_result):
         """Test parallel execution with progress callback."""
@@ -122,6 +133,50 @@ class TestParallelTestExecutor:
         assert len(progress_calls) == 2
         assert progress_calls[-1] == (2, 2)
 
+    def test_results_follow_target_order(self, parallel_config):
+        """Results line up with targets even when later targets finish first."""
+        import time
+
+        def test_func(target: str) -> TestResult:
+            time.sleep(0.1 if target == "10.0.0.1" else 0.0)
+            return TestResult(
+                test_name="test",
+                target=target,
+                status="success",
+                timestamp=datetime.now(),
+                duration=0.0,
+                metrics={},
+            )
+
+        async def async_test_func(target: str) -> TestResult:
+            return test_func(target)
+
+        targets = ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+        with ParallelTestExecutor(parallel_config) as executor:
+            assert [r.target for r in executor.execute_parallel(test_func, targets)] == targets
+            assert [r.target for r in executor.execute_parallel_async(async_test_func, targets)] == targets
+
+    def test_progress_callback_can_be_batched(self):
+        """progress_batch_every thins out callbacks but always reports the final count."""
+        config = ParallelTestConfig(max_workers=4, timeout=5, progress_batch_every=10)
+        progress_calls = []
+
+        def test_func(target: str) -> TestResult:
+            return TestResult(
+                test_name="test",
+                target=target,
+                status="success",
+                timestamp=datetime.now(),
+                duration=0.0,
+                metrics={},
+            )
+
+        with ParallelTestExecutor(config) as executor:
+            targets = [f"10.0.0.{i}" for i in range(25)]
+            executor.execute_parallel(test_func, targets, lambda c, t: progress_calls.append((c, t)))
+
+        assert progress_calls == [(10, 25), (20, 25), (25, 25)]
+
     def test_execute_parallel_with_exception(self, parallel_config):
         """Test parallel execution handles exceptions."""
         executor = ParallelTestExecutor(parallel_config)
@@ -158,6 +213,111 @@ class TestParallelTestExecutor:
         assert len(results) == 1
         assert results[0].status == "error"
 
+    def test_execute_parallel_timeout_does_not_wait_for_test(self):
+        """A timed-out test is reported without blocking until it finishes."""
+        import time
+        executor = ParallelTestExecutor(ParallelTestConfig(max_workers=2, timeout=0.1))
+
+        def test_func(target: str) -> TestResult:
+            time.sleep(1)
+            return TestResult(
+                test_name="test",
+                target=target,
+                status="success",
+                timestamp=datetime.now(),
+                duration=1.0,
+                metrics={},
+            )
+
+        start = time.monotonic()
+        results = executor.execute_parallel(test_func, ["127.0.0.1", "127.0.0.2"])
+
+        assert time.monotonic() - start < 0.9
+        assert [r.error for r in results] == ["Timeout"] * 2
+        # Timed-out results record how long the test actually ran
+        assert all(0.1 <= r.duration < 0.9 for r in results)
+
+    def test_pool_is_reused_across_calls(self, parallel_config):
+        """Worker threads are kept between execute_parallel calls."""
+        import threading
+
+        seen = set()
+
+        def test_func(target: str) -> TestResult:
+            seen.add(threading.get_ident())
+            return TestResult(
+                test_name="test",
+                target=target,
+                status="success",
+                timestamp=datetime.now(),
+                duration=0.0,
+                metrics={},
+            )
+
+        with ParallelTestExecutor(parallel_config) as executor:
+            for _ in range(5):
+                executor.execute_parallel(test_func, ["127.0.0.1", "127.0.0.2"])
+
+        assert len(seen) <= parallel_config.max_workers
+
+    def test_warmup_starts_all_workers_up_front(self):
+        """With warmup, every worker thread exists before the first batch."""
+        with ParallelTestExecutor(ParallelTestConfig(max_workers=4, warmup=True)) as executor:
+            assert len(executor._pool._threads) == 4
+        with ParallelTestExecutor(ParallelTestConfig(max_workers=4)) as executor:
+            assert len(executor._pool._threads) == 0
+
+    def test_pool_is_recycled_after_recycle_after_tests(self):
+        """Worker threads are replaced once recycle_after tests have gone through them."""
+        import threading
+
+        seen = set()
+
+        def test_func(target: str) -> TestResult:
+            seen.add(threading.current_thread())
+            return TestResult(
+                test_name="test",
+                target=target,
+                status="success",
+                timestamp=datetime.now(),
+                duration=0.0,
+                metrics={},
+            )
+
+        config = ParallelTestConfig(max_workers=1, timeout=5, recycle_after=4)
+        with ParallelTestExecutor(config) as executor:
+            for _ in range(3):
+                executor.execute_parallel(test_func, ["127.0.0.1", "127.0.0.2"])
+
+        # Batches 1-2 share a thread; batch 3 runs on a fresh pool
+        assert len(seen) == 2
+
+    def test_adaptive_timeout_follows_response_times(self):
+        """Once fast responses are seen, a slow target times out well before config.timeout."""
+        import time
+        config = ParallelTestConfig(max_workers=1, timeout=5, adaptive_timeout=True, min_timeout=0.2)
+        executor = ParallelTestExecutor(config)
+
+        def test_func(target: str) -> TestResult:
+            time.sleep(1 if target == "slow" else 0.01)
+            return TestResult(
+                test_name="test",
+                target=target,
+                status="success",
+                timestamp=datetime.now(),
+                duration=0.0,
+                metrics={},
+            )
+
+        executor.execute_parallel(test_func, ["a", "b", "c"])
+        assert executor._current_timeout() == 0.2
+
+        start = time.monotonic()
+        results = executor.execute_parallel(test_func, ["slow"])
+        assert time.monotonic() - start < 0.9
+        assert results[0].error == "Timeout"
+        executor.close()
+
     def test_get_summary_empty(self):
         """Test summary with no results."""
         executor = ParallelTestExecutor()
@@ -212,6 +372,55 @@ class TestParallelTestExecutor:
         assert len(results) == 2
         assert all(r.status == "success" for r in results)
 
+    def test_execute_parallel_async_bounds_concurrency(self, parallel_config):
+        """No more than max_workers async tests are in flight at once."""
+        executor = ParallelTestExecutor(parallel_config)
+        in_flight = 0
+        peak = 0
+
+        async def async_test_func(target: str) -> TestResult:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return TestResult(
+                test_name="test",
+                target=target,
+                status="success",
+                timestamp=datetime.now(),
+                duration=0.01,
+                metrics={},
+            )
+
+        targets = [f"10.0.0.{i}" for i in range(20)]
+        results = executor.execute_parallel_async(async_test_func, targets)
+
+        assert sorted(r.target for r in results) == sorted(targets)
+        assert peak == parallel_config.max_workers
+
+    def test_execute_parallel_async_rate_limit_is_global(self):
+        """rate_limit caps starts per second for the whole batch, not per worker."""
+        import time
+        executor = ParallelTestExecutor(ParallelTestConfig(max_workers=10, rate_limit=50.0))
+        starts = []
+
+        async def async_test_func(target: str) -> TestResult:
+            starts.append(time.monotonic())
+            return TestResult(
+                test_name="test",
+                target=target,
+                status="success",
+                timestamp=datetime.now(),
+                duration=0.0,
+                metrics={},
+            )
+
+        executor.execute_parallel_async(async_test_func, [str(i) for i in range(11)])
+
+        # 11 starts at 50/s are spread over at least 10 intervals of 20ms
+        assert max(starts) - min(starts) >= 0.19
+
 
 class TestBatchTestRunner:
     """Test BatchTestRunner."""
@@ -219,7 +428,7 @@ class TestBatchTestRunner:
     def test_init_default_config(self):
         """Test batch runner initialization with default config."""
         runner = BatchTestRunner()
-        assert runner.config.max_workers == 10
+        assert runner.config.max_workers == ParallelTestConfig().max_workers
 
     def test_run_batch_success(self, parallel_config):
         """Test batch execution with successful results."""
@@ -300,6 +509,67 @@ class TestBatchTestRunner:
         assert results["test"][0].status == "error"
 
 
+    def test_run_batch_times_out_hung_test(self):
+        """A hung sub-test is reported as a timeout without holding up the batch."""
+        import time
+
+        runner = BatchTestRunner(ParallelTestConfig(max_workers=2, timeout=0.2))
+
+        def slow_func(target: str) -> TestResult:
+            time.sleep(1.0)
+
+        def fast_func(target: str) -> TestResult:
+            return TestResult(
+                test_name="fast",
+                target=target,
+                status="success",
+                timestamp=datetime.now(),
+                duration=0.0,
+                metrics={},
+            )
+
+        tests = [
+            {"name": "slow", "func": slow_func, "target": "10.0.0.1"},
+            {"name": "fast", "func": fast_func, "target": "127.0.0.1"},
+        ]
+        start = time.monotonic()
+        with runner:
+            results = runner.run_batch(tests)
+
+        assert time.monotonic() - start < 0.8
+        assert results["fast"][0].status == "success"
+        assert (results["slow"][0].status, results["slow"][0].error) == ("error", "Timeout")
+        assert results["slow"][0].target == "10.0.0.1"
+
+
+    def test_slow_lane_keeps_quick_tests_moving(self):
+        """Tests declared slow run on their own pool instead of blocking quick ones."""
+        import time
+
+        start = time.monotonic()
+        quick_done = []
+
+        def slow_func(target: str) -> TestResult:
+            time.sleep(0.3)
+            return TestResult(test_name="scan", target=target, status="success",
+                              timestamp=datetime.now(), duration=0.3, metrics={})
+
+        def quick_func(target: str) -> TestResult:
+            quick_done.append(time.monotonic() - start)
+            return TestResult(test_name="ping", target=target, status="success",
+                              timestamp=datetime.now(), duration=0.0, metrics={})
+
+        tests = [
+            {"name": "scan", "func": slow_func, "target": t, "expected_duration": 30}
+            for t in ("10.0.0.1", "10.0.0.2")
+        ] + [{"name": "ping", "func": quick_func, "target": t} for t in ("10.0.0.1", "10.0.0.2")]
+
+        with BatchTestRunner(ParallelTestConfig(max_workers=1, timeout=5), slow_workers=1) as runner:
+            results = runner.run_batch(tests)
+
+        assert len(results["scan"]) == 2 and len(results["ping"]) == 2
+        assert max(quick_done) < 0.2
+
 class TestContinuousMonitor:
     """Test ContinuousMonitor."""
 
@@ -320,7 +590,7 @@ class TestContinuousMonitor:
         assert monitor.targets == ["127.0.0.1"]
         assert monitor.interval == 60
         assert monitor.running is False
-        assert monitor.history == []
+        assert list(monitor.history) == []
 
     def test_stop(self, parallel_config):
         """Test stopping the monitor."""
@@ -357,6 +627,158 @@ class TestContinuousMonitor:
         history = monitor.get_history(limit=10)
         assert history == []
 
+    def test_history_is_bounded(self):
+        """Only the newest history_limit cycles are kept."""
+        def test_func(target: str) -> TestResult:
+            return TestResult(
+                test_name="test",
+                target=target,
+                status="success",
+                timestamp=datetime.now(),
+                duration=0.0,
+                metrics={},
+            )
+
+        config = ParallelTestConfig(max_workers=1, history_limit=3)
+        monitor = ContinuousMonitor(test_func, ["127.0.0.1"], interval=0, config=config)
+        for cycle in range(5):
+            monitor.history.append({"cycle": cycle})
+
+        assert [entry["cycle"] for entry in monitor.get_history()] == [2, 3, 4]
+        assert [entry["cycle"] for entry in monitor.get_history(limit=2)] == [3, 4]
+        assert [entry["cycle"] for entry in monitor.get_history(limit=10)] == [2, 3, 4]
+
+    def test_start_with_async_test_func(self, parallel_config):
+        """Coroutine test functions are awaited on the monitor's own loop."""
+        async def test_func(target: str) -> TestResult:
+            return TestResult(
+                test_name="test",
+                target=target,
+                status="success",
+                timestamp=datetime.now(),
+                duration=0.0,
+                metrics={},
+            )
+
+        monitor = ContinuousMonitor(test_func, ["127.0.0.1"], interval=0, config=parallel_config)
+        asyncio.run(monitor.start(duration=0.01))
+
+        assert len(monitor.history) >= 1
+        assert monitor.history[0]["summary"]["success"] == 1
+
+    def test_start_with_sync_test_func(self, parallel_config):
+        """Plain test functions still run through the thread pool."""
+        def test_func(target: str) -> TestResult:
+            return TestResult(
+                test_name="test",
+                target=target,
+                status="success",
+                timestamp=datetime.now(),
+                duration=0.0,
+                metrics={},
+            )
+
+        monitor = ContinuousMonitor(test_func, ["127.0.0.1"], interval=0, config=parallel_config)
+        asyncio.run(monitor.start(duration=0.01))
+
+        assert monitor.history[0]["results"][0].status == "success"
+
+
+    def test_interval_backs_off_on_errors_and_recovers(self, parallel_config):
+        """Mostly-failing cycles stretch the interval (capped); clean ones shrink it back."""
+        def result(status: str) -> TestResult:
+            return TestResult(
+                test_name="test",
+                target="10.0.0.1",
+                status=status,
+                timestamp=datetime.now(),
+                duration=0.0,
+                metrics={},
+            )
+
+        monitor = ContinuousMonitor(lambda t: None, ["10.0.0.1"], interval=10, config=parallel_config)
+        failing = [result("error"), result("error"), result("success")]
+        assert monitor._next_interval(failing) == 15
+        assert monitor._next_interval(failing) == 22.5
+        for _ in range(10):
+            monitor._next_interval(failing)
+        assert monitor._current_interval == 100
+
+        assert monitor._next_interval([result("error"), result("success")]) == 100
+        for _ in range(10):
+            monitor._next_interval([result("success")])
+        assert monitor._current_interval == 10
+
+    def test_cache_ttl_reuses_fresh_results(self):
+        """Within cache_ttl a target's last result is reused instead of re-testing it."""
+        calls = []
+
+        def test_func(target: str) -> TestResult:
+            calls.append(target)
+            return TestResult(
+                test_name="test",
+                target=target,
+                status="success",
+                timestamp=datetime.now(),
+                duration=0.0,
+                metrics={},
+            )
+
+        config = ParallelTestConfig(max_workers=2, timeout=5, cache_ttl=60)
+        monitor = ContinuousMonitor(test_func, ["127.0.0.1", "127.0.0.2"], interval=0, config=config)
+        asyncio.run(monitor.start(duration=0.05))
+
+        assert len(monitor.history) > 1
+        assert sorted(calls) == ["127.0.0.1", "127.0.0.2"]
+        assert all(entry["summary"]["success"] == 2 for entry in monitor.history)
+
+    def test_cache_ttl_retries_errors_and_keeps_target_order(self):
+        """Error results are not reused, and merged results follow target order."""
+        clock = [0.0]
+        calls = []
+        cycles = []
+
+        async def test_func(target: str) -> TestResult:
+            calls.append((clock[0], target))
+            # b fails the first time it is tested, then recovers
+            if target == "b" and clock[0] == 0.0:
+                raise RuntimeError("unreachable")
+            return TestResult(
+                test_name="test",
+                target=target,
+                status="success",
+                timestamp=datetime.now(),
+                duration=0.0,
+                metrics={},
+            )
+
+        config = ParallelTestConfig(max_workers=3, timeout=5, cache_ttl=1.5)
+        monitor = ContinuousMonitor(test_func, ["a", "b", "c"], interval=0, config=config)
+
+        def callback(results):
+            cycles.append([(r.target, r.status) for r in results])
+            # Each cycle is one second later; stop after three
+            clock[0] += 1.0
+            if len(cycles) == 3:
+                monitor.running = False
+
+        fake_time = MagicMock(monotonic=lambda: clock[0])
+        with patch("netscope.parallel.executor.time", fake_time):
+            asyncio.run(monitor.start(callback=callback))
+
+        # b is retried in the second cycle; a and c expire in the third
+        assert sorted(calls) == [
+            (0.0, "a"), (0.0, "b"), (0.0, "c"),
+            (1.0, "b"),
+            (2.0, "a"), (2.0, "c"),
+        ]
+        assert cycles == [
+            [("a", "success"), ("b", "error"), ("c", "success")],
+            [("a", "success"), ("b", "success"), ("c", "success")],
+            [("a", "success"), ("b", "success"), ("c", "success")],
+        ]
+        assert [r.target for r in monitor.executor.results] == ["a", "b", "c"]
+
 
 class TestParallelPortScan:
     """Test parallel port scanning functionality."""
@@ -366,13 +788,12 @@ class TestParallelPortScan:
         # Test with localhost - should find some ports open (at least SSH/22 might be open)
         # We'll test with a small set of ports
         ports = [22, 80, 443, 8080]
-        open_ports, closed_ports = scan_ports("127.0.0.1", ports, timeout=1.0)
+        open_ports, closed_count = scan_ports("127.0.0.1", ports, timeout=1.0)
 
         # Results should be sorted
         assert open_ports == sorted(open_ports)
-        assert closed_ports == sorted(closed_ports)
         # All ports should be accounted for
-        assert len(open_ports) + len(closed_ports) == len(ports)
+        assert len(open_ports) + closed_count == len(ports)
 
     def test_scan_ports_progress_callback(self):
         """Test scan_ports progress callback."""
@@ -389,16 +810,16 @@ class TestParallelPortScan:
 
     def test_scan_ports_empty_list(self):
         """Test scan_ports with empty port list."""
-        open_ports, closed_ports = scan_ports("127.0.0.1", [], timeout=1.0)
+        open_ports, closed_count = scan_ports("127.0.0.1", [], timeout=1.0)
         assert open_ports == []
-        assert closed_ports == []
+        assert closed_count == 0
 
     def test_scan_ports_timeout(self):
         """Test scan_ports respects timeout."""
         # Use an unreachable host with short timeout
         ports = [80]
-        open_ports, closed_ports = scan_ports("192.0.2.1", ports, timeout=0.1)
+        open_ports, closed_count = scan_ports("192.0.2.1", ports, timeout=0.1)
 
-        # Should timeout and mark as closed
-        assert len(closed_ports) == 1
-        assert 80 in closed_ports
+        # Should timeout and count as closed
+        assert open_ports == []
+        assert closed_count == 1
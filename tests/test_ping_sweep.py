@@ -0,0 +1,59 @@
+"""Tests for the ping sweep helpers."""
+import struct
+from unittest.mock import MagicMock, patch
+
+from netscope.modules import ping_sweep
+from netscope.modules.ping_sweep import _build_echo_request, _icmp_checksum, ping_host
+
+
+def test_echo_request_checksum_verifies():
+    """A built echo request sums to zero under the Internet checksum."""
+    packet = _build_echo_request(0x1234)
+    assert packet[0] == 8
+    assert struct.unpack("!H", packet[6:8])[0] == 0x1234
+    assert _icmp_checksum(packet) == 0
+
+
+def test_ping_host_falls_back_to_subprocess_without_icmp_socket():
+    """When ICMP sockets are not permitted, the system ping binary is used."""
+    with patch.object(ping_sweep, "_icmp_available", None), \
+            patch("netscope.modules.ping_sweep.socket.socket", side_effect=PermissionError), \
+            patch("netscope.modules.ping_sweep.subprocess.run") as m_run:
+        m_run.return_value = MagicMock(returncode=0)
+        assert ping_host("192.0.2.10", timeout=0.1) == ("192.0.2.10", True)
+        assert m_run.called
+
+
+def test_sweep_cidr_uses_thread_pool_without_icmp_socket():
+    """Without ICMP sockets, sweep_cidr pings each host and sorts the alive ones."""
+    alive = {"10.0.0.9", "10.0.0.2"}
+    with patch.object(ping_sweep, "_icmp_available", None), \
+            patch("netscope.modules.ping_sweep.socket.socket", side_effect=PermissionError), \
+            patch("netscope.modules.ping_sweep._subprocess_ping", side_effect=lambda h, t: h in alive):
+        assert ping_sweep.sweep_cidr("10.0.0.0/28", timeout=0.1) == ["10.0.0.2", "10.0.0.9"]
+
+
+def test_is_echo_reply_strips_ip_header():
+    """Replies that include the IPv4 header (macOS) are still recognised."""
+    icmp = struct.pack("!BBHHH", 0, 0, 0, 1, 42)
+    ip_header = bytes([0x45]) + bytes(19)
+    assert ping_sweep._is_echo_reply(icmp, 42)
+    assert ping_sweep._is_echo_reply(ip_header + icmp, 42)
+    assert not ping_sweep._is_echo_reply(icmp, 43)
+
+
+def test_sweep_cidr_accepts_parsed_network():
+    """A parsed network object is used as-is and results keep address order."""
+    import ipaddress
+
+    alive = {"10.0.0.10", "10.0.0.9"}
+    with patch.object(ping_sweep, "_icmp_available", False), \
+            patch("netscope.modules.ping_sweep._subprocess_ping", side_effect=lambda h, t: h in alive):
+        network = ipaddress.ip_network("10.0.0.0/28")
+        assert ping_sweep.sweep_cidr(network, timeout=0.1) == ["10.0.0.9", "10.0.0.10"]
+
+
+def test_sweep_executor_is_reused():
+    """The fallback thread pool is shared across sweeps of the same size."""
+    assert ping_sweep._get_sweep_executor(3) is ping_sweep._get_sweep_executor(3)
+    assert ping_sweep._get_sweep_executor(3) is not ping_sweep._get_sweep_executor(4)
@@ -0,0 +1,99 @@
+"""Tests for the TCP port scanner."""
+import socket
+from unittest.mock import patch
+
+import pytest
+
+from netscope.modules import ports as ports_mod
+from netscope.modules.ports import scan_ports
+
+
+@pytest.fixture
+def listening_port():
+    """A local TCP port that accepts connections."""
+    srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    srv.bind(("127.0.0.1", 0))
+    srv.listen(16)
+    yield srv.getsockname()[1]
+    srv.close()
+
+
+def test_scan_ports_finds_listening_port(listening_port):
+    """A listening port is reported open and an unused one closed."""
+    open_ports, closed_count = scan_ports("127.0.0.1", [listening_port, 1], timeout=1.0)
+    assert open_ports == [listening_port]
+    assert closed_count == 1
+
+
+def test_scan_ports_chunks_by_fd_budget(listening_port):
+    """Ports are still all classified when the in-flight budget is tiny."""
+    ports = [listening_port, 1, 2, 3, 4]
+    with patch.object(ports_mod, "_max_in_flight", return_value=2):
+        open_ports, closed_count = scan_ports("127.0.0.1", ports, timeout=1.0)
+    assert open_ports == [listening_port]
+    assert closed_count == 4
+
+
+def test_scan_ports_unresolvable_host():
+    """An unresolvable host marks every port closed instead of raising."""
+    open_ports, closed_count = scan_ports("host.invalid", [80, 443], timeout=0.5)
+    assert open_ports == []
+    assert closed_count == 2
+
+
+def test_scan_ports_overall_timeout_counts_untried_ports(listening_port):
+    """Chunks not started before the overall deadline are counted as not open."""
+    ports = [listening_port, 1, 2, 3]
+    with patch.object(ports_mod, "_max_in_flight", return_value=1):
+        open_ports, closed_count = scan_ports("127.0.0.1", ports, timeout=1.0, overall_timeout=0)
+    assert open_ports == []
+    assert closed_count == len(ports)
+
+
+def test_scan_ports_socket_exhaustion_counts_remaining(listening_port):
+    """If sockets cannot be created, remaining ports are counted without retrying each one."""
+    real_socket = socket.socket
+    calls = []
+
+    def failing_socket(*args, **kwargs):
+        calls.append(args)
+        if len(calls) > 1:
+            raise OSError(24, "Too many open files")
+        return real_socket(*args, **kwargs)
+
+    with patch("netscope.modules.ports.socket.socket", side_effect=failing_socket):
+        open_ports, closed_count = scan_ports("127.0.0.1", [listening_port, 1, 2, 3], timeout=1.0)
+    assert open_ports == [listening_port]
+    assert closed_count == 3
+    assert len(calls) == 2
+
+
+def test_scan_ports_rtt_factor_stops_waiting_on_silent_ports(listening_port):
+    """Once the host has answered, silent ports are not waited on for the full timeout."""
+    import time
+
+    # A listener whose accept queue is full drops further SYNs, so connects
+    # to it stay pending like a filtered port
+    silent = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    silent.bind(("127.0.0.1", 0))
+    silent.listen(0)
+    fillers = []
+    for _ in range(4):
+        client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        client.setblocking(False)
+        client.connect_ex(silent.getsockname())
+        fillers.append(client)
+    time.sleep(0.05)
+
+    try:
+        ports = [listening_port, silent.getsockname()[1]]
+        start = time.monotonic()
+        open_ports, closed_count = scan_ports("127.0.0.1", ports, timeout=3.0, rtt_factor=4.0)
+        elapsed = time.monotonic() - start
+    finally:
+        for client in fillers:
+            client.close()
+        silent.close()
+
+    assert listening_port in open_ports
+    assert elapsed < 1.5
@@ -0,0 +1,70 @@
+"""Tests for the security test helpers."""
+import ssl
+
+from netscope.modules.security import SSLSecurityTest
+
+
+def test_ssl_contexts_are_shared():
+    """Contexts are built once and reused across calls."""
+    assert SSLSecurityTest._get_default_context() is SSLSecurityTest._get_default_context()
+    assert SSLSecurityTest._get_protocol_context(ssl.TLSVersion.TLSv1_2) is \
+        SSLSecurityTest._get_protocol_context(ssl.TLSVersion.TLSv1_2)
+
+
+def test_protocol_context_is_pinned_to_one_version():
+    """Probe contexts only negotiate the version being probed."""
+    context = SSLSecurityTest._get_protocol_context(ssl.TLSVersion.TLSv1_2)
+    assert context.minimum_version == ssl.TLSVersion.TLSv1_2
+    assert context.maximum_version == ssl.TLSVersion.TLSv1_2
+    assert context.verify_mode == ssl.CERT_NONE
+
+
+def test_parse_certificate_extracts_names_and_expiry():
+    """getpeercert() output is reduced to subject/issuer names, SANs and expiry."""
+    cert = {
+        "subject": ((("commonName", "example.com"),),),
+        "issuer": ((("organizationName", "Example CA"),), (("commonName", "Example CA R1"),)),
+        "notBefore": "Jan  1 00:00:00 2020 GMT",
+        "notAfter": "Jan  1 00:00:00 2021 GMT",
+        "subjectAltName": (("DNS", "example.com"), ("IP Address", "192.0.2.1"), ("DNS", "www.example.com")),
+        "version": 3,
+    }
+    info = SSLSecurityTest._parse_certificate(cert)
+    assert info.subject["commonName"] == "example.com"
+    assert info.issuer["commonName"] == "Example CA R1"
+    assert info.san == ["example.com", "www.example.com"]
+    assert info.expired is True
+    assert info.days_until_expiry < 0
+
+
+def test_parse_certificate_multi_valued_rdn():
+    """Every attribute of a multi-valued RDN is kept, not just the first."""
+    cert = {"subject": ((("organizationName", "Example"), ("commonName", "example.com")),)}
+    info = SSLSecurityTest._parse_certificate(cert)
+    assert info.subject == {"organizationName": "Example", "commonName": "example.com"}
+
+
+def test_certificate_expiry_from_text():
+    """Without DER input the OpenSSL notAfter text is parsed as UTC."""
+    from datetime import datetime, timezone
+
+    from netscope.modules.security import _certificate_expiry
+
+    assert _certificate_expiry(None, "Jan  1 00:00:00 2021 GMT") == \
+        datetime(2021, 1, 1, tzinfo=timezone.utc)
+    assert _certificate_expiry(None, "not a date") is None
+    assert _certificate_expiry(None, "") is None
+
+
+def test_default_context_built_once_under_concurrency():
+    """Concurrent first use still loads the CA bundle only once."""
+    from concurrent.futures import ThreadPoolExecutor
+    from unittest.mock import patch
+
+    SSLSecurityTest._default_context = None
+    with patch("netscope.modules.security.ssl.create_default_context",
+               wraps=ssl.create_default_context) as create:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            contexts = list(pool.map(lambda _: SSLSecurityTest._get_default_context(), range(8)))
+    assert create.call_count == 1
+    assert all(c is contexts[0] for c in contexts)
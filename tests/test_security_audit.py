@@ -0,0 +1,197 @@
+"""Tests for the security audit orchestrator."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from netscope.modules.base import TestResult
+from netscope.modules.security_audit import SecurityAudit
+
+
+class _Audit(SecurityAudit):
+    def parse_output(self, output):
+        return {}
+
+
+def _result(name, **metrics):
+    return TestResult(
+        test_name=name,
+        target="example.com",
+        status="success",
+        timestamp=datetime.now(),
+        duration=0.0,
+        metrics=metrics,
+    )
+
+
+@pytest.fixture
+def audit():
+    with patch("netscope.modules.security_audit.SSLSecurityTest"), \
+         patch("netscope.modules.security_audit.PortSecurityTest"), \
+         patch("netscope.modules.security_audit.DNSSecurityTest"):
+        yield _Audit(MagicMock(), MagicMock())
+
+
+def test_sub_tests_run_concurrently(audit):
+    """The audit takes about as long as its slowest probe, not the sum."""
+    def slow(result):
+        def run(*args):
+            time.sleep(0.3)
+            return result
+        return run
+
+    audit.ssl_test.run.side_effect = slow(_result(
+        "ssl", supports_tls_1_2=True, supports_tls_1_3=True, has_forward_secrecy=True,
+    ))
+    audit.port_test.run.side_effect = slow(_result("ports", dangerous_ports=[]))
+    audit.dns_test.run.side_effect = slow(_result("dns", has_dnssec=True))
+
+    start = time.monotonic()
+    result = audit.run("example.com", open_ports=[443])
+    assert time.monotonic() - start < 0.8
+    assert result.overall_score == 100
+    assert result.findings == []
+
+
+def test_failed_probe_does_not_affect_others(audit):
+    """A probe that raises becomes an error finding; the rest are still analyzed."""
+    audit.ssl_test.run.side_effect = OSError("connection refused")
+    audit.port_test.run.return_value = _result("ports", dangerous_ports=[23], dangerous_ports_count=1)
+    audit.dns_test.run.return_value = _result("dns", has_dnssec=True)
+
+    result = audit.run("example.com", open_ports=[23])
+
+    assert result.findings[0]["category"] == "SSL/TLS"
+    assert result.findings[0]["severity"] == "error"
+    assert "connection refused" in result.findings[0]["finding"]
+    assert result.port_result is not None
+    assert result.dns_result is not None
+    assert result.overall_score == 80
+
+
+def test_format_audit_report_groups_by_severity():
+    """Findings are listed under their severity, most severe first."""
+    from netscope.modules.security_audit import SecurityAuditResult, format_audit_report
+
+    report = format_audit_report(SecurityAuditResult(
+        target="example.com",
+        timestamp=datetime(2024, 1, 1),
+        overall_score=45,
+        risk_level="critical",
+        findings=[
+            {"category": "DNS Security", "severity": "low", "finding": "DNSSEC not enabled"},
+            {"category": "SSL/TLS", "severity": "critical", "finding": "SSL certificate has expired"},
+            {"category": "Port Security", "severity": "high", "finding": "Dangerous port 23 is open"},
+        ],
+    ))
+
+    assert report.index("CRITICAL Severity:") < report.index("HIGH Severity:") < report.index("LOW Severity:")
+    assert "MEDIUM Severity:" not in report
+    assert "  • [Port Security] Dangerous port 23 is open" in report
+
+
+def test_score_is_100_minus_total_penalty(audit):
+    """Penalties from every category add up and the score bottoms out at 0."""
+    audit.ssl_test.run.return_value = _result(
+        "ssl", certificate_expired=True, supports_tls_1_2=True, has_forward_secrecy=True,
+    )
+    audit.port_test.run.return_value = _result("ports", dangerous_ports=[23, 445])
+    audit.dns_test.run.return_value = _result("dns", has_dnssec=False)
+
+    result = audit.run("example.com", open_ports=[23, 445])
+    assert result.overall_score == 100 - (30 + 2 * 20 + 5)
+    assert result.risk_level == "critical"
+
+    audit.port_test.run.return_value = _result("ports", dangerous_ports=[21, 23, 445, 3389, 5900])
+    assert audit.run("example.com", open_ports=[]).overall_score == 0
+
+
+def test_ssl_and_dns_results_are_cached(audit):
+    """Repeated audits reuse SSL/DNS results until the TTL passes or a refresh is forced."""
+    audit.ssl_test.run.return_value = _result("ssl", supports_tls_1_2=True, has_forward_secrecy=True)
+    audit.port_test.run.return_value = _result("ports", dangerous_ports=[])
+    audit.dns_test.run.return_value = _result("dns", has_dnssec=True)
+
+    audit.run("example.com", open_ports=[])
+    audit.run("example.com", open_ports=[])
+    assert audit.ssl_test.run.call_count == 1
+    assert audit.dns_test.run.call_count == 1
+    assert audit.port_test.run.call_count == 2
+
+    audit.run("example.com", open_ports=[], force_refresh=True)
+    assert audit.ssl_test.run.call_count == 2
+
+    audit.run("example.com", port=8443, open_ports=[])
+    assert audit.ssl_test.run.call_count == 3
+    assert audit.dns_test.run.call_count == 2
+
+
+def test_error_results_are_not_cached(audit):
+    """A failed handshake is retried on the next audit instead of being replayed."""
+    failed = _result("ssl").model_copy(update={"status": "error", "error": "timed out"})
+    audit.ssl_test.run.side_effect = [failed, _result("ssl", supports_tls_1_2=True)]
+    audit.port_test.run.return_value = _result("ports", dangerous_ports=[])
+    audit.dns_test.run.return_value = _result("dns", has_dnssec=True)
+
+    audit.run("example.com", open_ports=[])
+    audit.run("example.com", open_ports=[])
+    audit.run("example.com", open_ports=[])
+    assert audit.ssl_test.run.call_count == 2
+    assert audit.dns_test.run.call_count == 1
+
+
+def test_cache_evicts_oldest_entry_when_full(audit):
+    """Once full of live entries, the cache drops its oldest key rather than growing."""
+    probe = MagicMock(side_effect=lambda: _result("dns"))
+    with patch("netscope.modules.security_audit._CACHE_MAX_ENTRIES", 3):
+        for key in ("a", "b", "c", "d"):
+            audit._cached((key,), probe)
+        assert list(audit._cache) == [("b",), ("c",), ("d",)]
+        audit._cached(("b",), probe)
+        assert probe.call_count == 4
+
+
+def test_cache_survives_concurrent_probes(audit):
+    """Probes filling a full cache from several threads neither raise nor overflow it."""
+    result = _result("dns")
+    with patch("netscope.modules.security_audit._CACHE_MAX_ENTRIES", 8), \
+         ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [
+            pool.submit(audit._cached, (worker, i), lambda: result)
+            for worker in range(4) for i in range(200)
+        ]
+        assert all(f.result() is result for f in futures)
+    assert len(audit._cache) == 8
+
+
+def test_scan_common_ports_finds_open_dangerous_port(audit):
+    """Without open_ports the audit probes the dangerous-port list itself."""
+    with patch("netscope.modules.security_audit.scan_ports", return_value=([23], 19)) as scan:
+        assert audit._scan_common_ports("example.com") == [23]
+    ports = scan.call_args[0][1]
+    assert 23 in ports and 3389 in ports
+    assert list(ports) == sorted(ports)
+
+
+def test_fail_fast_stops_waiting_once_score_is_zero(audit):
+    """With fail_fast, a slow probe is abandoned once the others already zeroed the score."""
+    def slow_dns(*args):
+        time.sleep(1)
+        return _result("dns", has_dnssec=True)
+
+    audit.ssl_test.run.return_value = _result("ssl", certificate_expired=True)
+    audit.port_test.run.return_value = _result(
+        "ports", dangerous_ports=[21, 23, 445], dangerous_ports_count=3,
+    )
+    audit.dns_test.run.side_effect = slow_dns
+
+    start = time.monotonic()
+    result = audit.run("example.com", open_ports=[21, 23, 445], fail_fast=True)
+
+    assert time.monotonic() - start < 0.8
+    assert result.overall_score == 0
+    assert result.dns_result is None
+    assert result.findings[-1]["severity"] == "info"
+    assert result.findings[0]["category"] == "SSL/TLS"
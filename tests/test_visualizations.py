@@ -0,0 +1,86 @@
+"""Tests for the terminal visualizations."""
+from netscope.tui.visualizations import (
+    BarChart,
+    DataPoint,
+    LatencyHeatmap,
+    LineGraph,
+    NetworkTopology,
+    Sparkline,
+    create_summary_panel,
+)
+
+
+def test_sparkline_scales_values_to_blocks():
+    """Values map onto the eight block heights; a flat series uses the lowest block."""
+    assert Sparkline.render([1, 5, 3, 9, 2, 7, 4]) == "▁▅▃█▂▇▄"
+    assert Sparkline.render([2, 2, 2]) == "▁▁▁"
+    assert Sparkline.render([]) == ""
+
+
+def test_sparkline_samples_to_width_and_clamps():
+    """Long series are sampled down to width; values past max_val clamp to the top block."""
+    assert Sparkline.render(list(range(100)), width=10) == "▁▁▂▃▄▅▅▆▇█"
+    assert Sparkline.render([0, 10, 20], min_val=0, max_val=10) == "▁██"
+
+
+def test_line_graph_plots_points_and_connects_them():
+    """Points land on their scaled row; steps are joined by vertical or short strokes."""
+    graph = LineGraph.render([DataPoint(v) for v in (0, 4, 1, 2)], height=5, width=6, show_axes=False)
+    assert graph.split("\n") == [
+        "│●    ",
+        "││    ",
+        "││─●●●",
+        "││●   ",
+        "●     ",
+    ]
+    assert LineGraph.render([]) == "No data"
+
+
+def test_latency_category_band_edges():
+    """Each threshold belongs to the next, worse category."""
+    categories = [LatencyHeatmap.get_latency_category(ms) for ms in (0, 19.9, 20, 50, 99, 100, 200, 5000)]
+    assert categories == ["excellent", "excellent", "good", "fair", "fair", "poor", "bad", "bad"]
+    assert LatencyHeatmap.get_latency_categories([0, 19.9, 20, 50, 99, 100, 200, 5000]) == categories
+    assert LatencyHeatmap.get_latency_categories([]) == []
+    assert LatencyHeatmap._CATEGORY_COLORS == tuple(
+        LatencyHeatmap.COLORS[c] for c in LatencyHeatmap.CATEGORIES
+    )
+
+
+def test_latency_heatmap_colors_bars_by_category():
+    """Each row is a cyan target, a bar of latency/10 blocks and the dim value."""
+    text = LatencyHeatmap.render(["a", "b"], [12.0, 150.0])
+    assert text.plain == f"{'a':20} █ 12.0ms\n{'b':20} {'█' * 15} 150.0ms\n"
+    assert [span.style for span in text.spans] == ["cyan", "green", "dim", "cyan", "orange", "dim"]
+    # No empty span for a bar shorter than one block
+    assert [span.style for span in LatencyHeatmap.render(["c"], [5.0]).spans] == ["cyan", "dim"]
+    assert LatencyHeatmap.render(["d"], [1000.0]).plain.count("█") == 100
+
+
+def test_bar_chart_scales_bars_to_width():
+    """Bars are proportional to the largest value and labels are right-aligned."""
+    chart = BarChart.render([DataPoint(10, "up"), DataPoint(5, "down")], width=8)
+    assert chart.plain == "  up │ ████████ 10.0\ndown │ ████ 5.0"
+    assert BarChart.render([DataPoint(-2, "x")], width=4, show_values=False).plain == "x │ ████"
+
+
+def test_topology_draws_up_to_three_device_boxes():
+    """Device boxes sit side by side; extra devices are only counted."""
+    devices = [{"device_type": "Router"}, {"device_type": "PC"}, {}, {"device_type": "Printer"}]
+    lines = NetworkTopology.render_simple(devices, gateway="10.0.0.1").split("\n")
+    assert "        │ Gateway │  10.0.0.1" in lines
+    assert lines[-5:-2] == [
+        "     ┌──────┐  ┌──────┐  ┌──────┐",
+        "     │Router│  │  PC  │  │Device│",
+        "     └──────┘  └──────┘  └──────┘",
+    ]
+    assert lines[-1] == "     ... and 1 more devices"
+    assert NetworkTopology.render_simple([]).split("\n")[-3:] == ["     "] * 3
+
+
+def test_summary_panel_lists_metrics_without_parsing_markup():
+    """Keys are title-cased and values are shown literally, even if they look like markup."""
+    panel = create_summary_panel("Ping", {"avg_latency": "12 ms", "note": "[red]x"}, status="warning")
+    assert panel.renderable.plain == "Avg Latency: 12 ms\nNote: [red]x"
+    assert [span.style for span in panel.renderable.spans] == ["cyan", "white", "cyan", "white"]
+    assert panel.border_style == "yellow"